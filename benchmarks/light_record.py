@@ -0,0 +1,90 @@
+"""Compare the `LightRecord` layout with one dictionary per tracked field.
+
+Run with `python benchmarks/light_record.py [n_lights]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from custom_components.adaptive_lighting.light_record import (
+    LightRecord,
+)
+
+FIELDS = LightRecord.__slots__
+# Fields read when handling a single 'state_changed' event of a light
+HOT_FIELDS = (
+    "our_last_state_on_change",
+    "off_to_on_event",
+    "on_to_off_event",
+    "turn_on_event",
+    "turn_off_event",
+    "turn_off_lock",
+)
+
+
+def parallel_dicts(lights: list[str]) -> dict[str, dict[str, Any]]:
+    """Build the previous layout: one dictionary per field, keyed by light."""
+    return {field: {light: object() for light in lights} for field in FIELDS}
+
+
+def records(lights: list[str]) -> dict[str, Any]:
+    """Build the `LightRecord` layout: one record per light."""
+    result = {}
+    for light in lights:
+        record = LightRecord()
+        for field in FIELDS:
+            setattr(record, field, object())
+        result[light] = record
+    return result
+
+
+def memory(build: Any, lights: list[str]) -> int:
+    """Return the bytes allocated by `build`, excluding the stored values."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    data = build(lights)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del data
+    # The values are shared by both layouts, so don't count them
+    return after - before - len(lights) * len(FIELDS) * sys.getsizeof(object())
+
+
+def main(n_lights: int = 1000) -> None:
+    """Print the memory use and hot path lookup times of both layouts."""
+    lights = [f"light.light_{i}" for i in range(n_lights)]
+    dicts = parallel_dicts(lights)
+    recs = records(lights)
+
+    def lookup_dicts() -> None:
+        for light in lights:
+            for field in HOT_FIELDS:
+                dicts[field].get(light)
+
+    def lookup_records() -> None:
+        for light in lights:
+            record = recs.get(light)
+            for field in HOT_FIELDS:
+                getattr(record, field)
+
+    number = 100
+    print(f"{n_lights} lights, {len(FIELDS)} fields, {len(HOT_FIELDS)} hot fields")
+    print(f"{'layout':<16}{'memory (KiB)':>14}{'lookup (µs/light)':>20}")
+    for name, build, lookup in [
+        ("parallel dicts", parallel_dicts, lookup_dicts),
+        ("LightRecord", records, lookup_records),
+    ]:
+        seconds = min(timeit.repeat(lookup, number=number, repeat=5))
+        per_light = seconds / number / n_lights * 1e6
+        print(f"{name:<16}{memory(build, lights) / 1024:>14.1f}{per_light:>20.3f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
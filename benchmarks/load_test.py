@@ -0,0 +1,455 @@
+"""Load test Adaptive Lighting with thousands of simulated lights.
+
+Spins up Home Assistant with an in-process fake light platform (with command
+latency, optional polling, light groups and random external changes), spreads
+the lights over a number of switches and then drives sunrise/sunset, wall switch
+presses and sleep mode toggles for a while. Runs fully offline.
+
+The turn-on latency is the time from pressing a wall switch of a light that is
+off (a 'light.toggle' call) until the light received a command with a brightness,
+i.e., the adapted one.
+
+Run it from the Home Assistant core checkout that is used for the tests (see
+`tests/README.md`), e.g.:
+
+    cd core && python ../benchmarks/load_test.py --lights 2000 --switches 20
+
+Use `--help` for all options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+# The Home Assistant core checkout, for `tests.common`
+sys.path.insert(0, os.getcwd())  # noqa: PTH109
+
+from homeassistant.components.adaptive_lighting.const import (
+    CONF_INTERCEPT,
+    CONF_INTERVAL,
+    CONF_LIGHTS,
+    CONF_MULTI_LIGHT_INTERCEPT,
+    CONF_NAME,
+    CONF_SUNRISE_TIME,
+    CONF_SUNSET_TIME,
+    CONF_TRANSITION,
+    DOMAIN,
+    SERVICE_CHANGE_SWITCH_SETTINGS,
+)
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_HS_COLOR,
+    ATTR_RGB_COLOR,
+    ColorMode,
+    LightEntity,
+    LightEntityFeature,
+)
+from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    CONF_PLATFORM,
+    CONF_SCAN_INTERVAL,
+    EVENT_CALL_SERVICE,
+    SERVICE_TOGGLE,
+)
+from homeassistant.core import Context, Event, HomeAssistant, callback
+from homeassistant.setup import async_setup_component
+from homeassistant.util import color as color_util
+from homeassistant.util import dt as dt_util
+
+from tests.common import MockPlatform, async_test_home_assistant, mock_platform
+
+FAKE_DOMAIN = "load_test_light"
+SAMPLE_INTERVAL = 0.05  # seconds between event loop lag samples
+TURN_ON_TIMEOUT = 30  # seconds after which a turn-on counts as not adapted
+
+
+class LoadTestLight(LightEntity):
+    """A light that applies commands after a random latency."""
+
+    _attr_supported_features = LightEntityFeature.TRANSITION
+    _attr_min_color_temp_kelvin = 2000
+    _attr_max_color_temp_kelvin = 6500
+
+    def __init__(
+        self,
+        index: int,
+        latency: float,
+        poll: bool,
+        rng: random.Random,
+        on_command: Any,
+    ) -> None:
+        """Initialize the light, half of them on."""
+        self.entity_id = f"{LIGHT_DOMAIN}.{FAKE_DOMAIN}_{index:05d}"
+        self._attr_name = f"Load test light {index}"
+        self._attr_should_poll = poll
+        self._attr_supported_color_modes = {ColorMode.COLOR_TEMP, ColorMode.HS}
+        self._attr_is_on = index % 2 == 0
+        self._attr_brightness = 255
+        self._attr_color_mode = ColorMode.COLOR_TEMP
+        self._attr_color_temp_kelvin = 4000
+        self._attr_hs_color = None
+        self._latency = latency
+        self._rng = rng
+        self._on_command = on_command
+
+    async def _apply_latency(self) -> None:
+        if self._latency:
+            await asyncio.sleep(self._latency * self._rng.uniform(0.5, 1.5))
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Apply a 'light.turn_on' command after the latency."""
+        await self._apply_latency()
+        self._attr_is_on = True
+        if ATTR_BRIGHTNESS in kwargs:
+            self._attr_brightness = kwargs[ATTR_BRIGHTNESS]
+        if ATTR_COLOR_TEMP_KELVIN in kwargs:
+            self._attr_color_mode = ColorMode.COLOR_TEMP
+            self._attr_color_temp_kelvin = kwargs[ATTR_COLOR_TEMP_KELVIN]
+        elif ATTR_HS_COLOR in kwargs or ATTR_RGB_COLOR in kwargs:
+            self._attr_color_mode = ColorMode.HS
+            self._attr_hs_color = kwargs.get(ATTR_HS_COLOR) or (
+                color_util.color_RGB_to_hs(*kwargs[ATTR_RGB_COLOR])
+            )
+        self._on_command(self.entity_id, kwargs)
+        self.async_write_ha_state()
+
+    async def async_turn_off(self, **kwargs: Any) -> None:  # noqa: ARG002
+        """Apply a 'light.turn_off' command after the latency."""
+        await self._apply_latency()
+        self._attr_is_on = False
+        self.async_write_ha_state()
+
+    async def async_update(self) -> None:
+        """Poll the light, which costs a round trip."""
+        await self._apply_latency()
+
+    @callback
+    def async_external_change(self) -> None:
+        """Change the brightness outside of Home Assistant, e.g., with a remote."""
+        if not self._attr_is_on:
+            return
+        self.async_set_context(Context())
+        self._attr_brightness = self._rng.randint(1, 255)
+        self.async_write_ha_state()
+
+
+@dataclass
+class LoadStatistics:
+    """What is measured during a load test."""
+
+    loop_lags: list[float] = field(default_factory=list)
+    max_tasks: int = 0
+    light_service_calls: int = 0
+    service_calls: int = 0
+    presses: int = 0
+    sleep_toggles: int = 0
+    sun_changes: int = 0
+    # Light → monotonic time of a turn-on that has not been adapted yet
+    pending_turn_ons: dict[str, float] = field(default_factory=dict)
+    turn_on_latencies: list[float] = field(default_factory=list)
+
+    @callback
+    def on_command(self, light: str, service_data: dict[str, Any]) -> None:
+        """Record the latency of the first command with a brightness after a turn-on."""
+        if ATTR_BRIGHTNESS in service_data and light in self.pending_turn_ons:
+            started = self.pending_turn_ons.pop(light)
+            self.turn_on_latencies.append(time.monotonic() - started)
+
+    @callback
+    def on_service_call(self, event: Event) -> None:
+        """Count the service calls."""
+        self.service_calls += 1
+        if event.data.get("domain") == LIGHT_DOMAIN:
+            self.light_service_calls += 1
+
+    def report(self, duration: float) -> str:
+        """Return a human readable report."""
+        not_adapted = sum(
+            1
+            for started in self.pending_turn_ons.values()
+            if time.monotonic() - started > TURN_ON_TIMEOUT
+        )
+        peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        rows = [
+            ("duration (s)", f"{duration:.1f}"),
+            ("event loop lag, p99 (ms)", f"{_p99(self.loop_lags) * 1e3:.1f}"),
+            ("event loop lag, max (ms)", f"{max(self.loop_lags, default=0) * 1e3:.1f}"),
+            ("service calls (/s)", f"{self.service_calls / duration:.1f}"),
+            ("light service calls (/s)", f"{self.light_service_calls / duration:.1f}"),
+            ("peak memory (MiB)", f"{peak_memory:.1f}"),
+            ("tasks alive, max", str(self.max_tasks)),
+            ("tasks alive, end", str(len(asyncio.all_tasks()))),
+            ("wall switch presses", str(self.presses)),
+            ("sleep mode toggles", str(self.sleep_toggles)),
+            ("sunrise/sunset changes", str(self.sun_changes)),
+            ("adapted turn-ons", str(len(self.turn_on_latencies))),
+            ("turn-on latency, p50 (ms)", f"{_p50(self.turn_on_latencies) * 1e3:.1f}"),
+            ("turn-on latency, p99 (ms)", f"{_p99(self.turn_on_latencies) * 1e3:.1f}"),
+            (f"not adapted after {TURN_ON_TIMEOUT} s", str(not_adapted)),
+        ]
+        width = max(len(name) for name, _ in rows)
+        return "\n".join(f"{name:<{width}}  {value:>10}" for name, value in rows)
+
+
+def _p50(values: list[float]) -> float:
+    return statistics.median(values) if values else 0.0
+
+
+def _p99(values: list[float]) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[98]
+
+
+def _sun_times(now: datetime.datetime, day: bool) -> tuple[str, str]:
+    """Return sunrise and sunset times on the same day that make it day or night now."""
+    seconds = now.hour * 3600 + now.minute * 60 + now.second
+    day_seconds = 24 * 3600
+    if day:
+        sunrise, sunset = seconds / 2, (seconds + day_seconds) / 2
+    elif seconds > day_seconds / 2:  # after sunset
+        sunrise, sunset = seconds / 3, 2 * seconds / 3
+    else:  # before sunrise
+        sunrise, sunset = (seconds + day_seconds) / 2, (seconds + 3 * day_seconds) / 4
+
+    def fmt(seconds: float) -> str:
+        return str(datetime.timedelta(seconds=int(seconds))).zfill(8)
+
+    return fmt(sunrise), fmt(sunset)
+
+
+async def _every(
+    rate: float,
+    rng: random.Random,
+    action: Any,
+) -> None:
+    """Call `action` as a Poisson process with `rate` per second."""
+    if rate <= 0:
+        return
+    while True:
+        await asyncio.sleep(rng.expovariate(rate))
+        await action()
+
+
+async def _monitor_loop(stats: LoadStatistics) -> None:
+    """Sample the event loop lag and the number of tasks."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + SAMPLE_INTERVAL
+        await asyncio.sleep(SAMPLE_INTERVAL)
+        stats.loop_lags.append(max(loop.time() - expected, 0))
+        stats.max_tasks = max(stats.max_tasks, len(asyncio.all_tasks()))
+
+
+async def _setup(
+    hass: HomeAssistant,
+    args: argparse.Namespace,
+    stats: LoadStatistics,
+    rng: random.Random,
+) -> tuple[list[LoadTestLight], list[str]]:
+    """Set up the lights, groups and switches, return the lights and switch names."""
+    lights: list[LoadTestLight] = [
+        LoadTestLight(i, args.latency, args.poll > 0, rng, stats.on_command)
+        for i in range(args.lights)
+    ]
+
+    async def async_setup_platform(
+        hass: HomeAssistant,
+        config: dict[str, Any],  # noqa: ARG001
+        async_add_entities: Any,
+        discovery_info: Any = None,  # noqa: ARG001
+    ) -> None:
+        async_add_entities(lights)
+
+        async def external_change() -> None:
+            rng.choice(lights).async_external_change()
+
+        hass.async_create_background_task(
+            _every(args.external_change_rate, rng, external_change),
+            "load test external changes",
+        )
+
+    mock_platform(
+        hass,
+        f"{FAKE_DOMAIN}.{LIGHT_DOMAIN}",
+        MockPlatform(async_setup_platform=async_setup_platform),
+    )
+    platform: dict[str, Any] = {CONF_PLATFORM: FAKE_DOMAIN}
+    if args.poll > 0:
+        platform[CONF_SCAN_INTERVAL] = args.poll
+
+    # The first lights are put in groups, which switches control as a whole
+    grouped = args.groups * args.group_size
+    groups = [
+        {
+            CONF_PLATFORM: "group",
+            CONF_NAME: f"Load test group {g}",
+            "entities": [
+                light.entity_id
+                for light in lights[g * args.group_size : (g + 1) * args.group_size]
+            ],
+        }
+        for g in range(args.groups)
+    ]
+    assert await async_setup_component(
+        hass,
+        LIGHT_DOMAIN,
+        {LIGHT_DOMAIN: [platform, *groups]},
+    )
+    await hass.async_block_till_done()
+
+    targets = [f"{LIGHT_DOMAIN}.load_test_group_{g}" for g in range(args.groups)] + [
+        light.entity_id for light in lights[grouped:]
+    ]
+    names = [f"load_test_{s:03d}" for s in range(args.switches)]
+    assert await async_setup_component(
+        hass,
+        DOMAIN,
+        {
+            DOMAIN: [
+                {
+                    CONF_NAME: name,
+                    CONF_LIGHTS: targets[s :: args.switches],
+                    CONF_INTERVAL: args.interval,
+                    CONF_TRANSITION: args.transition,
+                    CONF_INTERCEPT: args.intercept,
+                    CONF_MULTI_LIGHT_INTERCEPT: args.intercept,
+                }
+                for s, name in enumerate(names)
+            ],
+        },
+    )
+    await hass.async_block_till_done()
+    return lights, names
+
+
+async def _drive(
+    hass: HomeAssistant,
+    args: argparse.Namespace,
+    stats: LoadStatistics,
+    rng: random.Random,
+    lights: list[LoadTestLight],
+    names: list[str],
+) -> None:
+    """Drive sunrise/sunset, wall switch presses and sleep toggles."""
+    switches = [f"{SWITCH_DOMAIN}.adaptive_lighting_{name}" for name in names]
+    sleep_switches = [
+        f"{SWITCH_DOMAIN}.adaptive_lighting_sleep_mode_{name}" for name in names
+    ]
+
+    async def press() -> None:
+        # A wall switch (or remote) that toggles its light through Home Assistant
+        light = rng.choice(lights)
+        if not light.is_on:
+            stats.pending_turn_ons[light.entity_id] = time.monotonic()
+        hass.async_create_task(
+            hass.services.async_call(
+                LIGHT_DOMAIN,
+                SERVICE_TOGGLE,
+                {ATTR_ENTITY_ID: light.entity_id},
+                context=Context(),
+            ),
+        )
+        stats.presses += 1
+
+    async def toggle_sleep() -> None:
+        hass.async_create_task(
+            hass.services.async_call(
+                SWITCH_DOMAIN,
+                SERVICE_TOGGLE,
+                {ATTR_ENTITY_ID: rng.choice(sleep_switches)},
+            ),
+        )
+        stats.sleep_toggles += 1
+
+    async def sun() -> None:
+        day = True
+        while True:
+            await asyncio.sleep(args.sun_period)
+            day = not day
+            sunrise, sunset = _sun_times(dt_util.now(), day)
+            hass.async_create_task(
+                hass.services.async_call(
+                    DOMAIN,
+                    SERVICE_CHANGE_SWITCH_SETTINGS,
+                    {
+                        ATTR_ENTITY_ID: switches,
+                        CONF_SUNRISE_TIME: sunrise,
+                        CONF_SUNSET_TIME: sunset,
+                    },
+                ),
+            )
+            stats.sun_changes += 1
+
+    tasks = [
+        asyncio.create_task(_every(args.press_rate, rng, press)),
+        asyncio.create_task(_every(args.sleep_rate, rng, toggle_sleep)),
+        asyncio.create_task(sun()),
+    ]
+    try:
+        await asyncio.sleep(args.duration)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the load test and print the report."""
+    rng = random.Random(args.seed)  # noqa: S311
+    stats = LoadStatistics()
+    with tempfile.TemporaryDirectory() as config_dir:
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            monitor = asyncio.create_task(_monitor_loop(stats))
+            setup_start = time.monotonic()
+            lights, names = await _setup(hass, args, stats, rng)
+            print(
+                f"Set up {len(lights)} lights and {len(names)} switches"
+                f" in {time.monotonic() - setup_start:.1f} s",
+            )
+            stats.loop_lags.clear()  # Only measure the steady state
+            hass.bus.async_listen(EVENT_CALL_SERVICE, stats.on_service_call)
+            await _drive(hass, args, stats, rng, lights, names)
+            monitor.cancel()
+            print(stats.report(args.duration))
+            await hass.async_stop(force=True)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add = parser.add_argument
+    add("--lights", type=int, default=1000, help="number of lights")
+    add("--switches", type=int, default=10, help="number of AL switches")
+    add("--groups", type=int, default=10, help="number of light groups")
+    add("--group-size", type=int, default=10, help="lights per group")
+    add("--latency", type=float, default=0.05, help="mean command latency (s)")
+    add("--poll", type=float, default=0, help="polling interval (s), 0 disables")
+    add("--external-change-rate", type=float, default=1, help="changes per second")
+    add("--press-rate", type=float, default=2, help="wall switch presses per second")
+    add("--sleep-rate", type=float, default=0.05, help="sleep toggles per second")
+    add("--sun-period", type=float, default=20, help="seconds between sun changes")
+    add("--interval", type=int, default=30, help="AL `interval` (s)")
+    add("--transition", type=float, default=1, help="AL `transition` (s)")
+    add("--intercept", action=argparse.BooleanOptionalAction, default=True)
+    add("--duration", type=float, default=60, help="seconds to drive the load")
+    add("--seed", type=int, default=0, help="random seed")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,230 @@
+"""Benchmarks of the code that runs for every light event or intercepted call.
+
+Run with pytest-benchmark from the Home Assistant core checkout, see
+`benchmarks/README.md`.
+"""
+
+from __future__ import annotations
+
+import zoneinfo
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import pytest
+from astral import LocationInfo
+from astral.location import Location
+from homeassistant.components.adaptive_lighting.adaptation_utils import (
+    prepare_adaptation_data,
+)
+from homeassistant.components.adaptive_lighting.color_and_brightness import (
+    SunLightSettings,
+)
+from homeassistant.components.adaptive_lighting.const import (
+    ATTR_ADAPTIVE_LIGHTING_MANAGER,
+    CONF_BRIGHTNESS_MODE,
+    CONF_INTERCEPT,
+    CONF_LIGHTS,
+    CONF_MULTI_LIGHT_INTERCEPT,
+    CONF_NAME,
+    DOMAIN,
+)
+from homeassistant.components.adaptive_lighting.switch import (
+    _attributes_have_changed,
+    _sun_light_settings_fields,
+    create_context,
+    is_our_context_id,
+    validate,
+)
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_COLOR_MODE,
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_MAX_COLOR_TEMP_KELVIN,
+    ATTR_MIN_COLOR_TEMP_KELVIN,
+    ATTR_SUPPORTED_COLOR_MODES,
+    ATTR_TRANSITION,
+    ColorMode,
+    LightEntityFeature,
+)
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_SUPPORTED_FEATURES,
+    CONF_PARAMS,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.util.read_only_dict import ReadOnlyDict
+
+from tests.common import MockConfigEntry
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+pytest.importorskip("pytest_benchmark")
+
+_T = TypeVar("_T")
+
+N_SWITCHES = 50
+LIGHTS_PER_SWITCH = 4
+
+LATITUDES = [
+    (0.0, 0.0, "UTC"),
+    (52.379189, 4.899431, "Europe/Amsterdam"),
+    (69.649205, 18.955324, "Europe/Oslo"),  # polar day and night
+]
+
+LIGHT_ATTRIBUTES = {
+    ATTR_SUPPORTED_COLOR_MODES: [ColorMode.COLOR_TEMP, ColorMode.HS],
+    ATTR_SUPPORTED_FEATURES: LightEntityFeature.TRANSITION,
+    ATTR_MIN_COLOR_TEMP_KELVIN: 2000,
+    ATTR_MAX_COLOR_TEMP_KELVIN: 6500,
+}
+
+
+def _complete(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine that never suspends, such that a benchmark can time it."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    msg = "The benchmarked coroutine suspended"
+    raise RuntimeError(msg)
+
+
+def _light(switch: int, index: int) -> str:
+    return f"light.bench_{switch}_{index}"
+
+
+@pytest.fixture
+async def manager(hass: HomeAssistant):
+    """Set up many switches (with interception) and return the manager."""
+    for s in range(N_SWITCHES):
+        for i in range(LIGHTS_PER_SWITCH):
+            hass.states.async_set(_light(s, i), STATE_OFF, LIGHT_ATTRIBUTES)
+    for s in range(N_SWITCHES):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                CONF_NAME: f"bench_{s}",
+                CONF_LIGHTS: [_light(s, i) for i in range(LIGHTS_PER_SWITCH)],
+                CONF_INTERCEPT: True,
+                CONF_MULTI_LIGHT_INTERCEPT: True,
+            },
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    manager = hass.data[DOMAIN][ATTR_ADAPTIVE_LIGHTING_MANAGER]
+    yield manager
+    for task in manager.adaptation_tasks:
+        task.cancel()
+
+
+@pytest.mark.benchmark(group="get_settings")
+@pytest.mark.parametrize("brightness_mode", ["default", "linear", "tanh"])
+@pytest.mark.parametrize(("lat", "long", "timezone"), LATITUDES)
+def test_get_settings(benchmark, lat, long, timezone, brightness_mode):
+    location = Location(
+        LocationInfo(latitude=lat, longitude=long, timezone=timezone),
+    )
+    settings = SunLightSettings(
+        name="bench",
+        astral_observer=location.observer,
+        timezone=zoneinfo.ZoneInfo(timezone),
+        **_sun_light_settings_fields(
+            validate(None, {CONF_BRIGHTNESS_MODE: brightness_mode}),
+        ),
+    )
+    benchmark(settings.get_settings, False, None)
+
+
+@pytest.mark.benchmark(group="prepare_adaptation_data")
+@pytest.mark.parametrize("filter_by_state", [False, True])
+@pytest.mark.parametrize("split", [False, True])
+async def test_prepare_adaptation_data(hass, benchmark, split, filter_by_state):
+    light = _light(0, 0)
+    hass.states.async_set(
+        light,
+        STATE_ON,
+        {
+            **LIGHT_ATTRIBUTES,
+            ATTR_COLOR_MODE: ColorMode.COLOR_TEMP,
+            ATTR_BRIGHTNESS: 128,
+            ATTR_COLOR_TEMP_KELVIN: 3000,
+        },
+    )
+    service_data = {
+        ATTR_ENTITY_ID: light,
+        ATTR_TRANSITION: 1,
+        ATTR_BRIGHTNESS: 128,  # redundant, removed when filtering by state
+        ATTR_COLOR_TEMP_KELVIN: 4000,
+    }
+    context = Context()
+
+    def prepare_and_drain() -> None:
+        data = prepare_adaptation_data(
+            hass,
+            light,
+            context,
+            transition=1,
+            split_delay=0,
+            service_data=dict(service_data),
+            split=split,
+            filter_by_state=filter_by_state,
+            force=False,
+        )
+        while _complete(data.next_service_call_data()) is not None:
+            pass
+
+    benchmark(prepare_and_drain)
+
+
+@pytest.mark.benchmark(group="attributes_have_changed")
+def test_attributes_have_changed(benchmark):
+    old = {
+        ATTR_COLOR_MODE: ColorMode.COLOR_TEMP,
+        ATTR_BRIGHTNESS: 128,
+        ATTR_COLOR_TEMP_KELVIN: 3000,
+    }
+    new = {**old, ATTR_BRIGHTNESS: 200, ATTR_COLOR_TEMP_KELVIN: 4500}
+    benchmark(_attributes_have_changed, "light.bench", old, new, Context())
+
+
+@pytest.mark.benchmark(group="context")
+def test_create_context(benchmark):
+    benchmark(create_context, "bench", "interval", 123456)
+
+
+@pytest.mark.benchmark(group="context")
+@pytest.mark.parametrize("which", [None, "interval"])
+@pytest.mark.parametrize("ours", [True, False])
+def test_is_our_context_id(benchmark, ours, which):
+    context = create_context("bench", "interval", 123456) if ours else Context()
+    benchmark(is_our_context_id, context.id, which)
+
+
+@pytest.mark.benchmark(group="interceptor")
+async def test_separate_entity_ids(manager, benchmark):
+    # One light of every other switch, so that each lookup scans all switches
+    lights = [_light(s, 0) for s in range(0, N_SWITCHES, 2)]
+    data = {ATTR_ENTITY_ID: lights, CONF_PARAMS: {}}
+    switch_to_eids, skipped = benchmark(manager._separate_entity_ids, lights, data)
+    assert len(switch_to_eids) == len(lights)
+    assert not skipped
+
+
+@pytest.mark.benchmark(group="interceptor")
+async def test_service_interceptor_turn_on_handler(manager, benchmark):
+    light = _light(N_SWITCHES - 1, 0)
+    call = SimpleNamespace(context=Context())
+    call_data = ReadOnlyDict({ATTR_ENTITY_ID: [light], CONF_PARAMS: {}})
+
+    def intercept() -> dict[str, Any]:
+        data = {**call_data, CONF_PARAMS: {}}
+        _complete(manager._service_interceptor_turn_on_handler(call, data))
+        return data
+
+    data = benchmark(intercept)
+    assert ATTR_BRIGHTNESS in data[CONF_PARAMS]
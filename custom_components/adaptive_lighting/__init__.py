@@ -5,6 +5,7 @@ from typing import Any
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.const import CONF_SOURCE
 from homeassistant.core import Event, HomeAssistant
@@ -75,8 +76,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
 
 async def async_update_options(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-    """Update options."""
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    """Update options, in place unless the name or the lights changed."""
+    switch = hass.data[DOMAIN].get(config_entry.entry_id, {}).get(SWITCH_DOMAIN)
+    if switch is None or not await switch.async_reconfigure(config_entry):
+        await hass.config_entries.async_reload(config_entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -11,6 +11,7 @@ from homeassistant.components.light import (
     ATTR_BRIGHTNESS_PCT,
     ATTR_BRIGHTNESS_STEP,
     ATTR_BRIGHTNESS_STEP_PCT,
+    ATTR_COLOR_MODE,
     ATTR_COLOR_NAME,
     ATTR_COLOR_TEMP_KELVIN,
     ATTR_EFFECT,
@@ -21,10 +22,13 @@ from homeassistant.components.light import (
     ATTR_RGBWW_COLOR,
     ATTR_TRANSITION,
     ATTR_XY_COLOR,
+    ColorMode,
 )
 from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import Context, HomeAssistant, State
 
+from .helpers import color_difference_redmean
+
 _LOGGER = logging.getLogger(__name__)
 
 COLOR_ATTRS = {  # Should ATTR_PROFILE be in here?
@@ -47,6 +51,11 @@ BRIGHTNESS_ATTRS = {
 
 ServiceData = dict[str, Any]
 
+# Largest differences between commanded and reported values that are learned as a
+# light's reporting quantization, larger ones are actual (e.g., manual) changes
+MAX_LEARNED_BRIGHTNESS_TOLERANCE = 3
+MAX_LEARNED_MIRED_TOLERANCE = 3.0
+
 
 class LightControlAttributes(IntFlag):
     """Attributes of lights that the adaptation engine can control."""
@@ -113,23 +122,118 @@ def _split_service_call_data(service_data: ServiceData) -> list[ServiceData]:
     return service_datas
 
 
+@dataclass(frozen=True)
+class RedundancyTolerance:
+    """How far a light's reported attributes may be from a command it already obeys.
+
+    Lights round what they report, e.g., brightness 254 for 255, or a color
+    temperature quantized to the light's mired steps (and converted back to Kelvin).
+    """
+
+    brightness: int = 0
+    # One mired step, enough for HA's Kelvin ↔ mired rounding
+    mired: float = 1.0
+    # Rounding every RGB channel by one is a redmean distance of ≈3.2
+    rgb_redmean: float = 4.0
+
+    def is_close(self, attr: str, value: Any, reported: Any) -> bool:
+        """Return whether the `reported` value of `attr` is close to `value`."""
+        if value == reported:
+            return True
+        if value is None or reported is None:
+            return False
+        if attr == ATTR_BRIGHTNESS:
+            return abs(value - reported) <= self.brightness
+        if attr == ATTR_COLOR_TEMP_KELVIN and value > 0 and reported > 0:
+            return abs(1e6 / value - 1e6 / reported) <= self.mired
+        if attr == ATTR_RGB_COLOR:
+            return color_difference_redmean(value, reported) <= self.rgb_redmean
+        return False
+
+    def learn(
+        self,
+        service_data: ServiceData,
+        attributes: dict[str, Any],
+    ) -> "RedundancyTolerance":
+        """Adjust the tolerance to the rounding of a light that obeyed `service_data`.
+
+        A larger rounding widens the tolerance at once, a smaller one narrows it
+        by half the difference, so a rounding that is no longer seen decays away.
+        """
+        brightness, mired = self.brightness, self.mired
+        sent, reported = (
+            service_data.get(ATTR_BRIGHTNESS),
+            attributes.get(ATTR_BRIGHTNESS),
+        )
+        if sent is not None and reported is not None:
+            delta = abs(sent - reported)
+            if delta <= MAX_LEARNED_BRIGHTNESS_TOLERANCE:
+                brightness = max(delta, (brightness + delta) // 2)
+        sent, reported = (
+            service_data.get(ATTR_COLOR_TEMP_KELVIN),
+            attributes.get(ATTR_COLOR_TEMP_KELVIN),
+        )
+        if sent and reported:
+            delta = abs(1e6 / sent - 1e6 / reported)
+            if delta <= MAX_LEARNED_MIRED_TOLERANCE:
+                # Never below the default of one mired step
+                mired = max(delta, (mired + delta) / 2, RedundancyTolerance.mired)
+        if brightness == self.brightness and mired == self.mired:
+            return self
+        return RedundancyTolerance(brightness, mired, self.rgb_redmean)
+
+
+DEFAULT_REDUNDANCY_TOLERANCE = RedundancyTolerance()
+
+
 def _remove_redundant_attributes(
     service_data: ServiceData,
     state: State,
+    tolerance: RedundancyTolerance = DEFAULT_REDUNDANCY_TOLERANCE,
 ) -> ServiceData:
     """Filter service data by removing attributes that already equal the given state.
 
     Removes all attributes from service call data whose values are already present
-    in the target entity's state.
+    in the target entity's state, up to the light's reporting `tolerance`.
     """
-    attributes: dict[str, Any] = dict(state.attributes)
+    attributes = state.attributes
     return {
         k: v
         for k, v in service_data.items()
-        if k not in attributes or v != attributes[k]
+        if k not in attributes or not tolerance.is_close(k, v, attributes[k])
     }
 
 
+def has_converged(
+    service_data: ServiceData,
+    state: State,
+    attributes: LightControlAttributes,
+    tolerance: RedundancyTolerance = DEFAULT_REDUNDANCY_TOLERANCE,
+) -> bool:
+    """Return whether the state of a light reflects the service data sent to it.
+
+    Only the adapted `attributes` are compared, and of the color only the attribute
+    of the light's current color mode.
+    """
+    reported = state.attributes
+    compared = []
+    if LightControlAttributes.BRIGHTNESS in attributes:
+        compared.append(ATTR_BRIGHTNESS)
+    if LightControlAttributes.COLOR in attributes:
+        compared.append(
+            (
+                ATTR_COLOR_TEMP_KELVIN
+                if reported.get(ATTR_COLOR_MODE) == ColorMode.COLOR_TEMP
+                else ATTR_RGB_COLOR
+            ),
+        )
+    return all(
+        tolerance.is_close(attr, service_data[attr], reported.get(attr))
+        for attr in compared
+        if attr in service_data
+    )
+
+
 def _has_relevant_service_data_attributes(service_data: ServiceData) -> bool:
     """Determines whether the service data justifies an adaptation service call.
 
@@ -145,6 +249,7 @@ async def _create_service_call_data_iterator(
     hass: HomeAssistant,
     service_datas: list[ServiceData],
     filter_by_state: bool,
+    tolerance: RedundancyTolerance = DEFAULT_REDUNDANCY_TOLERANCE,
 ) -> AsyncGenerator[ServiceData]:
     """Enumerates and filters a list of service datas on the fly.
 
@@ -164,6 +269,7 @@ async def _create_service_call_data_iterator(
                 service_data = _remove_redundant_attributes(  # noqa: PLW2901
                     service_data,
                     state=current_entity_state,
+                    tolerance=tolerance,
                 )
 
             # Emit service data if it still contains relevant attributes (else try next)
@@ -240,6 +346,7 @@ def prepare_adaptation_data(
     split: bool,
     filter_by_state: bool,
     force: bool,
+    tolerance: RedundancyTolerance = DEFAULT_REDUNDANCY_TOLERANCE,
 ) -> AdaptationData:
     """Prepares a data object carrying all data required to execute an adaptation."""
     _LOGGER.debug(
@@ -261,6 +368,7 @@ def prepare_adaptation_data(
         hass,
         service_datas,
         filter_by_state,
+        tolerance,
     )
 
     attributes = _identify_light_control_attributes(service_data)
@@ -0,0 +1,87 @@
+"""Capabilities of lights, derived from their state attributes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import IntFlag
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.light import (
+    ATTR_MAX_COLOR_TEMP_KELVIN,
+    ATTR_MIN_COLOR_TEMP_KELVIN,
+    ATTR_SUPPORTED_COLOR_MODES,
+    ColorMode,
+    LightEntityFeature,
+)
+from homeassistant.const import ATTR_SUPPORTED_FEATURES
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# The state attributes that the capabilities are derived from
+CAPABILITY_ATTRS = (
+    ATTR_SUPPORTED_FEATURES,
+    ATTR_SUPPORTED_COLOR_MODES,
+    ATTR_MIN_COLOR_TEMP_KELVIN,
+    ATTR_MAX_COLOR_TEMP_KELVIN,
+)
+
+_COLOR_MODES = frozenset(
+    {ColorMode.RGB, ColorMode.RGBW, ColorMode.RGBWW, ColorMode.XY, ColorMode.HS},
+)
+
+
+class LightFeature(IntFlag):
+    """What Adaptive Lighting can adapt or use of a light."""
+
+    NONE = 0
+    BRIGHTNESS = 1
+    COLOR_TEMP = 2
+    COLOR = 4
+    TRANSITION = 8
+
+
+@dataclass(frozen=True, slots=True)
+class LightCapabilities:
+    """The features of a light and its color temperature range.
+
+    Instances are shared by all lights with the same capabilities, see
+    `light_capabilities`, and can be used as keys of per-profile caches.
+    """
+
+    features: LightFeature
+    min_color_temp_kelvin: int | None = None
+    max_color_temp_kelvin: int | None = None
+
+
+def light_capabilities(attributes: Mapping[str, Any]) -> LightCapabilities:
+    """Return the (shared) capabilities of a light from its state attributes."""
+    supported_features = int(attributes.get(ATTR_SUPPORTED_FEATURES, 0))
+    features = LightFeature.NONE
+    if supported_features & LightEntityFeature.TRANSITION:
+        features |= LightFeature.TRANSITION
+
+    supported_color_modes = attributes.get(ATTR_SUPPORTED_COLOR_MODES) or ()
+    # Adding brightness when color mode is supported, see
+    # comment https://github.com/basnijholt/adaptive-lighting/issues/112#issuecomment-836944011
+    if not _COLOR_MODES.isdisjoint(supported_color_modes):
+        features |= LightFeature.COLOR | LightFeature.BRIGHTNESS
+    if ColorMode.BRIGHTNESS in supported_color_modes:
+        features |= LightFeature.BRIGHTNESS
+    if ColorMode.COLOR_TEMP not in supported_color_modes:
+        return _shared_capabilities(features, None, None)
+    return _shared_capabilities(
+        features | LightFeature.COLOR_TEMP | LightFeature.BRIGHTNESS,
+        attributes[ATTR_MIN_COLOR_TEMP_KELVIN],
+        attributes[ATTR_MAX_COLOR_TEMP_KELVIN],
+    )
+
+
+@lru_cache(maxsize=256)
+def _shared_capabilities(
+    features: LightFeature,
+    min_color_temp_kelvin: int | None,
+    max_color_temp_kelvin: int | None,
+) -> LightCapabilities:
+    return LightCapabilities(features, min_color_temp_kelvin, max_color_temp_kelvin)
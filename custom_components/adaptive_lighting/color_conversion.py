@@ -0,0 +1,56 @@
+"""Memoized color conversions of `homeassistant.util.color`.
+
+The color temperatures that Adaptive Lighting computes are multiples of 5 Kelvin,
+so their RGB colors are looked up in a precomputed table. The other conversions
+are cached, because the same few colors are converted over and over again.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from homeassistant.util.color import (
+    color_RGB_to_xy,
+    color_temperature_to_rgb,
+    color_xy_to_hs,
+    color_xy_to_RGB,
+)
+
+KELVIN_MIN = 1000
+KELVIN_MAX = 10000
+KELVIN_STEP = 5
+
+_KELVIN_TO_RGB: tuple[tuple[float, float, float], ...] = tuple(
+    color_temperature_to_rgb(kelvin)
+    for kelvin in range(KELVIN_MIN, KELVIN_MAX + 1, KELVIN_STEP)
+)
+
+
+def kelvin_to_rgb(kelvin: float) -> tuple[float, float, float]:
+    """Return the RGB color of a color temperature, see `color_temperature_to_rgb`."""
+    if KELVIN_MIN <= kelvin <= KELVIN_MAX and kelvin % KELVIN_STEP == 0:
+        return _KELVIN_TO_RGB[int(kelvin - KELVIN_MIN) // KELVIN_STEP]
+    return _kelvin_to_rgb(kelvin)
+
+
+@lru_cache(maxsize=256)
+def _kelvin_to_rgb(kelvin: float) -> tuple[float, float, float]:
+    return color_temperature_to_rgb(kelvin)
+
+
+@lru_cache(maxsize=1024)
+def rgb_to_xy(r: int, g: int, b: int) -> tuple[float, float]:
+    """Return the xy color of an RGB color, see `color_RGB_to_xy`."""
+    return color_RGB_to_xy(r, g, b)
+
+
+@lru_cache(maxsize=1024)
+def xy_to_hs(x: float, y: float) -> tuple[float, float]:
+    """Return the hs color of an xy color, see `color_xy_to_hs`."""
+    return color_xy_to_hs(x, y)
+
+
+@lru_cache(maxsize=256)
+def xy_to_rgb(x: float, y: float) -> tuple[int, int, int]:
+    """Return the RGB color of an xy color, see `color_xy_to_RGB`."""
+    return color_xy_to_RGB(x, y)
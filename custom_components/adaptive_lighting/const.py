@@ -25,6 +25,14 @@ class TakeOverControlMode(Enum):
     PAUSE_CHANGED = "pause_changed"
 
 
+class RolloutOrder(Enum):
+    """Order in which lights are adapted during a staggered rollout."""
+
+    ENTITY_ID = "entity_id"
+    PLATFORM = "platform"
+    AREA = "area"
+
+
 DOCS = {CONF_ENTITY_ID: "Entity ID of the switch. 📝"}
 
 
@@ -237,6 +245,17 @@ DOCS[CONF_SEND_SPLIT_DELAY] = (
     "simultaneous brightness and color setting. ⏲️"
 )
 
+CONF_AUTO_SEND_SPLIT_DELAY, DEFAULT_AUTO_SEND_SPLIT_DELAY = (
+    "auto_send_split_delay",
+    False,
+)
+DOCS[CONF_AUTO_SEND_SPLIT_DELAY] = (
+    "Learn the delay between `separate_turn_on_commands` per light, from how long "
+    "each light takes to report the state of our commands. `send_split_delay` is "
+    "then the maximum delay (1000 ms if it is 0), and is used until a light's delay "
+    "has been learned. ⏲️"
+)
+
 CONF_AUTORESET_CONTROL, DEFAULT_AUTORESET_CONTROL = "autoreset_control_seconds", 0
 DOCS[CONF_AUTORESET_CONTROL] = (
     "Automatically reset the manual control after a number of seconds. "
@@ -272,6 +291,60 @@ DOCS[CONF_MULTI_LIGHT_INTERCEPT] = (
     "Requires `intercept` to be enabled."
 )
 
+CONF_ROLLOUT_WINDOW, DEFAULT_ROLLOUT_WINDOW = "rollout_window", 0
+DOCS[CONF_ROLLOUT_WINDOW] = (
+    "Spread the adaptations caused by toggling the switch or sleep mode over this "
+    "many seconds instead of sending all commands at once. Transitions are "
+    "shortened so that all lights finish at the same time. Set to 0 to disable. 🌊"
+)
+
+CONF_ROLLOUT_ORDER, DEFAULT_ROLLOUT_ORDER = (
+    "rollout_order",
+    RolloutOrder.ENTITY_ID.value,
+)
+DOCS[CONF_ROLLOUT_ORDER] = (
+    "Order of the lights during a `rollout_window`. `entity_id` keeps the configured "
+    "order, `platform` alternates between integrations (e.g., Zigbee, Z-Wave, Hue) to "
+    "spread the load over networks, and `area` adapts the lights room by room. 🌊"
+)
+
+CONF_PRELOAD_OFF_LIGHTS, DEFAULT_PRELOAD_OFF_LIGHTS = "preload_off_lights", False
+DOCS[CONF_PRELOAD_OFF_LIGHTS] = (
+    "Fire an `adaptive_lighting.preload` event with the current settings for the "
+    "lights that are off, for lights that accept settings while off (e.g., Zigbee "
+    "lights with `execute_if_off`) via an automation. A bare `light.turn_on` of a "
+    "preloaded light is then not intercepted. ⏩"
+)
+
+CONF_LIGHT_PROFILES, DEFAULT_LIGHT_PROFILES = "light_profiles", {}
+DOCS[CONF_LIGHT_PROFILES] = (
+    "Per light (or light group) overrides of `min_brightness`, `max_brightness`, "
+    "`min_color_temp`, `max_color_temp`, `sleep_brightness`, and `sleep_color_temp`, "
+    'e.g., `{"light.bedroom": {"max_brightness": 60}}`. The settings of the switch '
+    "are mapped onto these ranges, so one switch can replace several that only "
+    "differ in these values. 🎚️"
+)
+
+CONF_SHARED_INTERVAL_CLOCK, DEFAULT_SHARED_INTERVAL_CLOCK = (
+    "shared_interval_clock",
+    False,
+)
+DOCS[CONF_SHARED_INTERVAL_CLOCK] = (
+    "Let a single clock, shared by all switches with this option, run the interval "
+    "adaptations. It spreads the lights of these switches evenly over the interval, "
+    "interleaving the integrations (e.g., Zigbee, Z-Wave, Hue), for a steady command "
+    "rate instead of a burst per switch. Intervals are rounded to multiples of the "
+    "shortest `interval` of these switches. 🕰️"
+)
+
+CONF_PRIORITY, DEFAULT_PRIORITY = "priority", 0
+DOCS[CONF_PRIORITY] = (
+    "Priority of this switch for lights that are also in other switches. Of the "
+    "switches that are on, the one with the highest priority adapts a shared light, "
+    "ties go to the switch that was turned on first. A switch with `adapt_brightness` "
+    "or `adapt_color` off leaves that attribute to the next switch in line. 🥇"
+)
+
 SLEEP_MODE_SWITCH = "sleep_mode_switch"
 ADAPT_COLOR_SWITCH = "adapt_color_switch"
 ADAPT_BRIGHTNESS_SWITCH = "adapt_brightness_switch"
@@ -299,6 +372,55 @@ DOCS[CONF_USE_DEFAULTS] = (
 
 TURNING_OFF_DELAY = 5
 
+# Maximum number of lights adapted at the same time by a single service call
+SERVICE_CALL_CONCURRENCY = 10
+
+# After a restart, the first adaptation waits until none of the lights changed
+# state for STARTUP_QUIET_PERIOD seconds (at most STARTUP_MAX_WAIT seconds) and
+# is then sent in batches of STARTUP_BATCH_SIZE lights
+STARTUP_QUIET_PERIOD = 10
+STARTUP_MAX_WAIT = 60
+STARTUP_BATCH_SIZE = 10
+STARTUP_BATCH_INTERVAL = 1
+
+# The shared interval clock (`shared_interval_clock`) spreads the lights over this
+# fraction of a tick, the rest leaves time for the last commands before the next tick
+SHARED_CLOCK_SPREAD = 0.8
+
+# The manager state (e.g., manual control) is persisted in .storage/adaptive_lighting.manager
+STORAGE_KEY = f"{DOMAIN}.manager"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+# Number of state changes kept per light since one of our adaptations (including ours)
+STATE_HISTORY_LENGTH = 10
+# Records of lights that are gone from HA for LIGHT_RECORD_TTL seconds are dropped,
+# which is checked every LIGHT_RECORD_PURGE_INTERVAL seconds
+LIGHT_RECORD_TTL = 24 * 3600
+LIGHT_RECORD_PURGE_INTERVAL = 3600
+
+# Seconds after which a proactive adaptation (of an intercepted call) is forgotten,
+# long enough for the delayed calls of `separate_turn_on_commands`
+PROACTIVE_CONTEXT_LIFETIME = 300
+
+# Lights whose state did not reflect our last command at NON_CONVERGENCE_THRESHOLD
+# consecutive interval updates are skipped for exponentially longer periods (starting
+# at one interval), of at most NON_CONVERGENCE_MAX_BACKOFF seconds
+NON_CONVERGENCE_THRESHOLD = 3
+NON_CONVERGENCE_MAX_BACKOFF = 3600
+
+# Off lights are preloaded (`preload_off_lights`) at most every PRELOAD_MIN_INTERVAL
+# seconds, and only when their desired state changed
+PRELOAD_MIN_INTERVAL = 300
+
+# The command-to-state latency of a light is estimated from this many recent samples
+# (its 90th percentile) and an EWMA with this weight of the newest sample
+LATENCY_SAMPLES = 20
+LATENCY_EWMA_WEIGHT = 0.2
+
+# The largest learned delay (ms) of `auto_send_split_delay` if `send_split_delay` is 0
+MAX_AUTO_SEND_SPLIT_DELAY = 1000
+
 DOCS_MANUAL_CONTROL = {
     CONF_ENTITY_ID: "The `entity_id` of the switch in which to (un)mark the "
     "light as being `manually controlled`. 📝",
@@ -396,6 +518,7 @@ VALIDATION_TUPLES: list[tuple[str, Any, Any]] = [
     (CONF_ADAPT_ONLY_ON_BARE_TURN_ON, DEFAULT_ADAPT_ONLY_ON_BARE_TURN_ON, bool),
     (CONF_SEPARATE_TURN_ON_COMMANDS, DEFAULT_SEPARATE_TURN_ON_COMMANDS, bool),
     (CONF_SEND_SPLIT_DELAY, DEFAULT_SEND_SPLIT_DELAY, int_between(0, 10000)),
+    (CONF_AUTO_SEND_SPLIT_DELAY, DEFAULT_AUTO_SEND_SPLIT_DELAY, bool),
     (CONF_ADAPT_DELAY, DEFAULT_ADAPT_DELAY, cv.positive_float),
     (
         CONF_SKIP_REDUNDANT_COMMANDS,
@@ -404,6 +527,30 @@ VALIDATION_TUPLES: list[tuple[str, Any, Any]] = [
     ),
     (CONF_INTERCEPT, DEFAULT_INTERCEPT, bool),
     (CONF_MULTI_LIGHT_INTERCEPT, DEFAULT_MULTI_LIGHT_INTERCEPT, bool),
+    (
+        CONF_ROLLOUT_WINDOW,
+        DEFAULT_ROLLOUT_WINDOW,
+        vol.All(vol.Coerce(float), vol.Range(min=0, max=600)),  # 10 minutes max
+    ),
+    (
+        CONF_ROLLOUT_ORDER,
+        DEFAULT_ROLLOUT_ORDER,
+        selector.SelectSelector(  # type: ignore[arg-type]
+            selector.SelectSelectorConfig(
+                options=[order.value for order in RolloutOrder],
+                multiple=False,
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            ),
+        ),
+    ),
+    (CONF_PRELOAD_OFF_LIGHTS, DEFAULT_PRELOAD_OFF_LIGHTS, bool),
+    (
+        CONF_LIGHT_PROFILES,
+        DEFAULT_LIGHT_PROFILES,
+        selector.ObjectSelector(selector.ObjectSelectorConfig()),  # type: ignore[arg-type]
+    ),
+    (CONF_PRIORITY, DEFAULT_PRIORITY, int),
+    (CONF_SHARED_INTERVAL_CLOCK, DEFAULT_SHARED_INTERVAL_CLOCK, bool),
     (CONF_INCLUDE_CONFIG_IN_ATTRIBUTES, DEFAULT_INCLUDE_CONFIG_IN_ATTRIBUTES, bool),
 ]
 
@@ -416,6 +563,22 @@ def timedelta_as_int(value: timedelta) -> float:
     return value.total_seconds()
 
 
+VALID_LIGHT_PROFILES = vol.Schema(
+    {
+        cv.entity_id: vol.Schema(
+            {
+                vol.Optional(CONF_MIN_BRIGHTNESS): int_between(1, 100),
+                vol.Optional(CONF_MAX_BRIGHTNESS): int_between(1, 100),
+                vol.Optional(CONF_MIN_COLOR_TEMP): int_between(1000, 10000),
+                vol.Optional(CONF_MAX_COLOR_TEMP): int_between(1000, 10000),
+                vol.Optional(CONF_SLEEP_BRIGHTNESS): int_between(1, 100),
+                vol.Optional(CONF_SLEEP_COLOR_TEMP): int_between(1000, 10000),
+            },
+        ),
+    },
+)
+
+
 # conf_option: (validator, coerce) tuples
 # these validators cannot be serialized but can be serialized when coerced by coerce.
 EXTRA_VALIDATION: dict[str, tuple[Any, Any]] = {
@@ -430,6 +593,7 @@ EXTRA_VALIDATION: dict[str, tuple[Any, Any]] = {
     CONF_MAX_SUNSET_TIME: (cv.time, str),
     CONF_BRIGHTNESS_MODE_TIME_LIGHT: (cv.time_period, timedelta_as_int),
     CONF_BRIGHTNESS_MODE_TIME_DARK: (cv.time_period, timedelta_as_int),
+    CONF_LIGHT_PROFILES: (VALID_LIGHT_PROFILES, dict),
 }
 
 
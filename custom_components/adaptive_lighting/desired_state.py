@@ -0,0 +1,98 @@
+"""Per-light desired states shared by all adaptation paths."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .capabilities import LightFeature
+from .helpers import clamp
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .capabilities import LightCapabilities
+
+
+@dataclass(frozen=True)
+class DesiredState:
+    """The adapted target of a light, already clamped to its capabilities.
+
+    Attributes the light does not support are `None`. `color_temp_kelvin` is also
+    `None` when the settings force the use of `rgb_color` (sleep mode with
+    `sleep_rgb_or_color_temp: rgb_color` or `force_rgb_color`).
+    """
+
+    owner: str
+    generation: int
+    supports_transition: bool
+    brightness: int | None
+    color_temp_kelvin: int | None
+    rgb_color: tuple[int, int, int] | None
+
+
+def desired_state_from_settings(
+    owner: str,
+    generation: int,
+    settings: Mapping[str, Any],
+    capabilities: LightCapabilities,
+    *,
+    force_rgb_color: bool,
+) -> DesiredState:
+    """Compute the desired state of lights with `capabilities` from the settings.
+
+    Only the settings that the `capabilities` need are read, such that the
+    lazily calculated color spaces of `LightSettings` are skipped for other lights.
+    """
+    features = capabilities.features
+    has_color = LightFeature.COLOR in features
+    color_temp_kelvin = None
+    if LightFeature.COLOR_TEMP in features and not (force_rgb_color and has_color):
+        color_temp_kelvin = clamp(
+            settings["color_temp_kelvin"],
+            capabilities.min_color_temp_kelvin,
+            capabilities.max_color_temp_kelvin,
+        )
+    return DesiredState(
+        owner=owner,
+        generation=generation,
+        supports_transition=LightFeature.TRANSITION in features,
+        brightness=(
+            round(255 * settings["brightness_pct"] / 100)
+            if LightFeature.BRIGHTNESS in features
+            else None
+        ),
+        color_temp_kelvin=color_temp_kelvin,
+        rgb_color=settings["rgb_color"] if has_color else None,
+    )
+
+
+class DesiredStateStore:
+    """Holds the current `DesiredState` of each light.
+
+    An entry is valid as long as the settings of its owning switch have not been
+    recomputed since, which is tracked with a per-switch generation counter.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._states: dict[str, DesiredState] = {}
+
+    def get(self, light: str, owner: str, generation: int) -> DesiredState | None:
+        """Return the desired state of a light if it is still valid."""
+        state = self._states.get(light)
+        if state is None or state.owner != owner or state.generation != generation:
+            return None
+        return state
+
+    def set(self, light: str, state: DesiredState) -> None:
+        """Store the desired state of a light."""
+        self._states[light] = state
+
+    def pop(self, light: str) -> DesiredState | None:
+        """Remove the desired state of a light."""
+        return self._states.pop(light, None)
+
+    def as_dict(self) -> dict[str, DesiredState]:
+        """Return a copy of all desired states."""
+        return dict(self._states)
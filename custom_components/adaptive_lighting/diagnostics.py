@@ -0,0 +1,70 @@
+"""Diagnostics support for Adaptive Lighting."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+
+from .const import DOMAIN
+from .hass_utils import interceptor_timings
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: dict[str, Any] = {
+        "data": dict(config_entry.data),
+        "options": dict(config_entry.options),
+    }
+    switch = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {}).get(SWITCH_DOMAIN)
+    if switch is not None:
+        data["lights"] = switch.lights
+        data["interval_loop"] = asdict(switch.tick_statistics)
+        desired_states = switch.manager.desired_states.as_dict()
+        data["desired_states"] = {
+            light: asdict(desired_states[light])
+            for light in switch.lights
+            if light in desired_states
+        }
+        now = hass.loop.time()
+        records = switch.manager.light_records
+        data["command_latencies"] = {
+            light: {
+                "ewma": round(record.latency.ewma, 3),
+                "percentile_90": round(record.latency.percentile, 3),
+                "samples": len(record.latency.samples),
+            }
+            for light in switch.lights
+            if (record := records.get(light)) is not None and record.latency is not None
+        }
+        data["non_converging_lights"] = {
+            light: {
+                "non_convergences": record.non_convergences,
+                "backoff_remaining": (
+                    round(max(record.backoff_until - now, 0), 3)
+                    if record.backoff_until is not None
+                    else None
+                ),
+            }
+            for light in switch.lights
+            if (record := records.get(light)) is not None
+            and record.non_convergences is not None
+        }
+        data["shared_lights"] = {
+            light: str(switch.manager.owned_attributes(switch, light))
+            for light in switch.lights
+            if len(switch.manager.switches_of(light)) > 1
+        }
+    data["service_call_interceptors"] = {
+        service: {hook: asdict(timing) for hook, timing in timings.items()}
+        for service, timings in interceptor_timings(hass).items()
+    }
+    return data
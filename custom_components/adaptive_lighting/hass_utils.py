@@ -1,16 +1,28 @@
 """Utility functions for HA core."""
 
+import asyncio
 import logging
-from collections.abc import Awaitable, Callable
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterator, Mapping, MutableMapping
+from copy import deepcopy
+from dataclasses import dataclass
+from itertools import chain, zip_longest
+from typing import Any
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, Service, ServiceCall
 from homeassistant.helpers import device_registry, entity_registry
 from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from .adaptation_utils import ServiceData
+from .const import RolloutOrder
 
 _LOGGER = logging.getLogger(__name__)
 
+_INTERCEPTOR_CHAINS = "adaptive_lighting_interceptor_chains"
+
+type InterceptFunc = Callable[[ServiceCall, ServiceData], Awaitable[None] | None]
+
 
 def area_entities(hass: HomeAssistant, area_id: str):
     """Get all entities linked to an area."""
@@ -31,78 +43,256 @@ def area_entities(hass: HomeAssistant, area_id: str):
     return entity_ids
 
 
-def setup_service_call_interceptor(
+def entity_area_id(hass: HomeAssistant, entity_id: str) -> str | None:
+    """Get the area of an entity, falling back to the area of its device."""
+    ent_reg = entity_registry.async_get(hass)
+    entry = ent_reg.async_get(entity_id)
+    if entry is None:
+        return None
+    if entry.area_id is not None or entry.device_id is None:
+        return entry.area_id
+    device = device_registry.async_get(hass).async_get(entry.device_id)
+    return device.area_id if device is not None else None
+
+
+def rollout_order(
     hass: HomeAssistant,
-    domain: str,
-    service: str,
-    intercept_func: Callable[[ServiceCall, ServiceData], Awaitable[None] | None],
-) -> Callable[[], None]:
-    """Inject a function into a registered service call to preprocess service data.
+    lights: list[str],
+    order: RolloutOrder,
+) -> list[str]:
+    """Sort lights in the order in which they are adapted during a rollout.
 
-    The injected interceptor function receives the service call and a writeable data dictionary
-    (the data of the service call is read-only) before the service call is executed.
+    `PLATFORM` interleaves the integrations (round-robin) such that consecutive
+    commands go to different networks, `AREA` keeps the lights of a room together.
+    """
+    if order is RolloutOrder.ENTITY_ID:
+        return list(lights)
+    groups: dict[str | None, list[str]] = defaultdict(list)
+    if order is RolloutOrder.PLATFORM:
+        ent_reg = entity_registry.async_get(hass)
+        for light in lights:
+            entry = ent_reg.async_get(light)
+            groups[entry.platform if entry is not None else None].append(light)
+        interleaved = chain.from_iterable(zip_longest(*groups.values()))
+        return [light for light in interleaved if light is not None]
+    for light in lights:
+        groups[entity_area_id(hass, light)].append(light)
+    return list(chain.from_iterable(groups.values()))
+
+
+class _CopyOnWriteData(MutableMapping[str, Any]):
+    """Writeable view of read-only service call data that only copies on write."""
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self._data = data
+        self.copied = False
+
+    def _writeable(self) -> dict[str, Any]:
+        if not self.copied:
+            self._data = dict(self._data)
+            self.copied = True
+        return self._data  # type: ignore[return-value]
+
+    def snapshot(self) -> tuple[Mapping[str, Any], bool]:
+        """Return the current data, to `restore` it if a hook fails halfway."""
+        return (dict(self._data) if self.copied else self._data), self.copied
+
+    def restore(self, snapshot: tuple[Mapping[str, Any], bool]) -> None:
+        """Discard the modifications made since the `snapshot`."""
+        self._data, self.copied = snapshot
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._writeable()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        self._writeable().__delitem__(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return repr(dict(self._data))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        # The copy is a plain dictionary, also when the data is still read-only
+        return deepcopy(dict(self._data), memo)
+
+
+@dataclass
+class HookTiming:
+    """Timing counters of a service call interceptor hook."""
+
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    def record(self, duration: float) -> None:
+        """Record a single call of the hook."""
+        self.calls += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+
+
+class ServiceCallInterceptorChain:
+    """Ordered hooks that preprocess the calls of a single registered service.
+
+    A single proxy handler is installed per service, which runs the hooks in the
+    order in which they were added before calling the original handler. The hooks
+    receive the service call and a writeable view of its (read-only) data, which
+    is only copied when a hook modifies it.
     """
-    try:
-        # HACK: Access protected attribute of HA service registry.
-        # This is necessary to replace a registered service handler with our
-        # proxy handler to intercept calls.
-        registered_services = (
-            hass.services._services  # pylint: disable=protected-access  # type: ignore[attr-defined]
+
+    def __init__(self, hass: HomeAssistant, domain: str, service: str) -> None:
+        """Initialize the chain, install it with `install`."""
+        self.hass = hass
+        self.domain = domain
+        self.service = service
+        self.hooks: list[InterceptFunc] = []
+        self.timings: dict[str, HookTiming] = {}
+        self._existing_service: Service | None = None
+        self._target_is_coroutine = False
+
+    def install(self) -> None:
+        """Replace the registered service handler with the proxy of this chain."""
+        try:
+            # HACK: Access protected attribute of HA service registry.
+            # This is necessary to replace a registered service handler with our
+            # proxy handler to intercept calls.
+            registered_services = (
+                self.hass.services._services  # pylint: disable=protected-access  # type: ignore[attr-defined]
+            )
+        except AttributeError as error:
+            msg = (
+                "Intercept failed because registered services are no longer"
+                " accessible (internal API may have changed)"
+            )
+            raise RuntimeError(msg) from error
+
+        domain, service = self.domain, self.service
+        if (
+            domain not in registered_services
+            or service not in registered_services[domain]
+        ):
+            msg = (
+                f"Intercept failed because service {domain}.{service} is not registered"
+            )
+            raise RuntimeError(msg)
+
+        existing_service = registered_services[domain][service]
+        self._existing_service = existing_service
+        self._target_is_coroutine = asyncio.iscoroutinefunction(
+            existing_service.job.target,
         )
-    except AttributeError as error:
-        msg = (
-            "Intercept failed because registered services are no longer"
-            " accessible (internal API may have changed)"
+        self.hass.services.async_register(
+            domain,
+            service,
+            self._service_func_proxy,
+            existing_service.schema,
         )
-        raise RuntimeError(msg) from error
 
-    if domain not in registered_services or service not in registered_services[domain]:
-        msg = f"Intercept failed because service {domain}.{service} is not registered"
-        raise RuntimeError(msg)
+    def uninstall(self) -> None:
+        """Reinstall the original service handler."""
+        if self._existing_service is None:
+            return
+        self.hass.services.async_register(
+            self.domain,
+            self.service,
+            self._existing_service.job.target,
+            self._existing_service.schema,
+        )
+        self._existing_service = None
 
-    existing_service = registered_services[domain][service]
+    def add_hook(self, intercept_func: InterceptFunc) -> Callable[[], None]:
+        """Append a hook to the chain and return a function that removes it."""
+        self.hooks.append(intercept_func)
+        self.timings.setdefault(_hook_name(intercept_func), HookTiming())
 
-    async def service_func_proxy(call: ServiceCall) -> None:
-        try:
-            # Convert read-only data to writeable dictionary for modification by interceptor
-            data = dict(call.data)
+        def remove() -> None:
+            self.hooks.remove(intercept_func)
 
-            # Call interceptor
-            result = intercept_func(call, data)
-            if result is not None:
-                await result
+        return remove
 
-            # Convert data back to read-only
+    async def _service_func_proxy(self, call: ServiceCall) -> None:
+        data = _CopyOnWriteData(call.data)
+        # A copy, because hooks may be removed while the call is processed
+        for hook in list(self.hooks):
+            start = time.perf_counter()
+            snapshot = data.snapshot()
+            try:
+                result = hook(call, data)  # type: ignore[arg-type]
+                if result is not None:
+                    await result
+            except Exception:
+                # Blindly catch all exceptions to avoid breaking the service call,
+                # and discard the modifications of the failing hook
+                data.restore(snapshot)
+                _LOGGER.exception(
+                    "Error for call '%s' in service_func_proxy",
+                    call.data,
+                )
+            self.timings[_hook_name(hook)].record(time.perf_counter() - start)
+        if data.copied:
             call.data = ReadOnlyDict(data)
-        except Exception:
-            # Blindly catch all exceptions to avoid breaking light.turn_on
-            _LOGGER.exception(
-                "Error for call '%s' in service_func_proxy",
-                call.data,
-            )
-        # Call original service handler with processed data
-        import asyncio
 
-        target = existing_service.job.target
-        if asyncio.iscoroutinefunction(target):
+        # Call original service handler with processed data
+        assert self._existing_service is not None
+        target = self._existing_service.job.target
+        if self._target_is_coroutine:
             await target(call)
         else:
             target(call)
 
-    hass.services.async_register(
-        domain,
-        service,
-        service_func_proxy,
-        existing_service.schema,
+
+def _hook_name(intercept_func: InterceptFunc) -> str:
+    return getattr(intercept_func, "__qualname__", repr(intercept_func))
+
+
+def setup_service_call_interceptor(
+    hass: HomeAssistant,
+    domain: str,
+    service: str,
+    intercept_func: InterceptFunc,
+) -> Callable[[], None]:
+    """Inject a function into a registered service call to preprocess service data.
+
+    The injected interceptor function receives the service call and a writeable data dictionary
+    (the data of the service call is read-only) before the service call is executed.
+    All interceptors of a service share a single `ServiceCallInterceptorChain`.
+    """
+    chains: dict[tuple[str, str], ServiceCallInterceptorChain] = hass.data.setdefault(
+        _INTERCEPTOR_CHAINS,
+        {},
     )
+    key = (domain, service)
+    if (interceptor_chain := chains.get(key)) is None:
+        interceptor_chain = ServiceCallInterceptorChain(hass, domain, service)
+        interceptor_chain.install()
+        chains[key] = interceptor_chain
+    remove_hook = interceptor_chain.add_hook(intercept_func)
 
     def remove() -> None:
-        # Remove the interceptor by reinstalling the original service handler
-        hass.services.async_register(
-            domain,
-            service,
-            existing_service.job.target,
-            existing_service.schema,
-        )
+        remove_hook()
+        if not interceptor_chain.hooks:
+            # Remove the interceptor by reinstalling the original service handler
+            interceptor_chain.uninstall()
+            chains.pop(key, None)
 
     return remove
+
+
+def interceptor_timings(hass: HomeAssistant) -> dict[str, dict[str, HookTiming]]:
+    """Return the per-hook timing counters of the installed interceptor chains."""
+    chains: dict[tuple[str, str], ServiceCallInterceptorChain] = hass.data.get(
+        _INTERCEPTOR_CHAINS,
+        {},
+    )
+    return {
+        f"{domain}.{service}": dict(interceptor_chain.timings)
+        for (domain, service), interceptor_chain in chains.items()
+    }
@@ -0,0 +1,260 @@
+"""Per-light state tracked by the `AdaptiveLightingManager`."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterator, MutableMapping
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from homeassistant.components.light import ATTR_EFFECT, ATTR_FLASH, ATTR_TRANSITION
+from homeassistant.const import ATTR_SERVICE_DATA
+from homeassistant.core import Context, Event
+
+from .adaptation_utils import BRIGHTNESS_ATTRS, COLOR_ATTRS
+from .const import LATENCY_EWMA_WEIGHT, LATENCY_SAMPLES
+
+if TYPE_CHECKING:
+    import asyncio
+    import datetime
+
+    from homeassistant.core import State
+
+    from .adaptation_utils import LightControlAttributes, RedundancyTolerance
+    from .capabilities import LightCapabilities
+    from .desired_state import DesiredState
+
+_V = TypeVar("_V")
+
+# The keys of the service data of 'light.turn_on/off' calls that are inspected
+_INSPECTED_SERVICE_DATA_KEYS = frozenset(
+    {*BRIGHTNESS_ATTRS, *COLOR_ATTRS, ATTR_EFFECT, ATTR_FLASH, ATTR_TRANSITION},
+)
+
+
+class EventRecord:
+    """Compact record of a service call or state change event of a light.
+
+    Unlike the `Event`, it does not keep the (old and new) `State` objects alive.
+    """
+
+    __slots__ = ("context", "service_data", "time_fired")
+
+    def __init__(
+        self,
+        context: Context,
+        time_fired: datetime.datetime,
+        service_data: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the record."""
+        self.context = context
+        self.time_fired = time_fired
+        self.service_data = service_data
+
+    @classmethod
+    def from_event(cls, event: Event | EventRecord) -> EventRecord:
+        """Create a record of the parts of an event that are inspected."""
+        if isinstance(event, EventRecord):
+            return event
+        service_data = event.data.get(ATTR_SERVICE_DATA)
+        # A fresh context, because `Context.origin_event` references the whole event
+        context = Context(
+            user_id=event.context.user_id,
+            parent_id=event.context.parent_id,
+            id=event.context.id,
+        )
+        return cls(
+            context,
+            event.time_fired,
+            (
+                {
+                    key: value
+                    for key, value in service_data.items()
+                    if key in _INSPECTED_SERVICE_DATA_KEYS
+                }
+                if service_data is not None
+                else None
+            ),
+        )
+
+
+class LatencyEstimator:
+    """Estimate of the time (seconds) between a command to a light and its state.
+
+    Keeps an EWMA of the latency and the recent samples, whose 90th percentile
+    captures the slow responses that an average hides.
+    """
+
+    __slots__ = ("ewma", "samples")
+
+    def __init__(self) -> None:
+        """Initialize an estimator without samples."""
+        self.ewma: float | None = None
+        self.samples: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def add(self, latency: float) -> None:
+        """Add an observed latency."""
+        self.samples.append(latency)
+        self.ewma = (
+            latency
+            if self.ewma is None
+            else LATENCY_EWMA_WEIGHT * latency + (1 - LATENCY_EWMA_WEIGHT) * self.ewma
+        )
+
+    @property
+    def percentile(self) -> float:
+        """Return the 90th percentile of the recent samples."""
+        samples = sorted(self.samples)
+        return samples[min(len(samples) - 1, int(0.9 * len(samples)))]
+
+    def estimate(self) -> float:
+        """Return a latency that covers most commands, the larger of both."""
+        assert self.ewma is not None
+        return max(self.ewma, self.percentile)
+
+
+class LightRecord:
+    """Everything the manager tracks about a single light, `None` if unset."""
+
+    __slots__ = (
+        "adaptation_task_brightness",
+        "adaptation_task_color",
+        "auto_reset_time",
+        "auto_reset_timer",
+        "backoff_until",
+        "capabilities",
+        "deferred_adaptation",
+        "last_adaptation_service_data",
+        "last_service_data",
+        "latency",
+        "latency_probe",
+        "manual_control",
+        "missing_since",
+        "non_convergences",
+        "off_to_on_event",
+        "on_to_off_event",
+        "our_last_state_on_change",
+        "preloaded",
+        "preloaded_at",
+        "redundancy_tolerance",
+        "toggle_event",
+        "transition_timer",
+        "turn_off_event",
+        "turn_off_lock",
+        "turn_off_waiter",
+        "turn_on_event",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty record."""
+        # Last 'light.turn_on', 'light.turn_off' and 'light.toggle' service calls
+        self.turn_on_event: EventRecord | None = None
+        self.turn_off_event: EventRecord | None = None
+        self.toggle_event: EventRecord | None = None
+        # Last 'on' → 'off' and 'off' → 'on' state changes
+        self.on_to_off_event: EventRecord | None = None
+        self.off_to_on_event: EventRecord | None = None
+        # Pending 'just_turned_off' decision and the lock that serializes them
+        self.turn_off_waiter: asyncio.Future[bool] | None = None
+        self.turn_off_lock: asyncio.Lock | None = None
+        # Which attributes are manually controlled
+        self.manual_control: LightControlAttributes | None = None
+        # Our last 'state_changed' and the ones that followed (bounded, ours is kept)
+        self.our_last_state_on_change: deque[State] | None = None
+        # Last 'service_data' to 'light.turn_on' resulting from this integration
+        self.last_service_data: dict[str, Any] | None = None
+        # Only the 'service_data' of the calls of our most recent adaptation
+        self.last_adaptation_service_data: dict[str, Any] | None = None
+        # The desired state last preloaded while the light was off, and when
+        self.preloaded: DesiredState | None = None
+        self.preloaded_at: float | None = None
+        # Our last command's context id and loop time, until the light reports a state
+        self.latency_probe: tuple[str, float] | None = None
+        # Time that the light takes to report a state after our commands
+        self.latency: LatencyEstimator | None = None
+        # How the light rounds the attributes it reports, learned after our commands
+        self.redundancy_tolerance: RedundancyTolerance | None = None
+        # Ongoing adaptation tasks (the same task if it adapts both)
+        self.adaptation_task_brightness: asyncio.Task[None] | None = None
+        self.adaptation_task_color: asyncio.Task[None] | None = None
+        # Timers (`_AsyncSingleShotTimer`) and the auto reset delay
+        self.transition_timer: Any = None
+        self.auto_reset_timer: Any = None
+        self.auto_reset_time: float | None = None
+        # The `AdaptiveSwitch` that waits for the transition to end to adapt the light
+        self.deferred_adaptation: Any = None
+        # Derived from the state attributes, see `AdaptiveLightingManager.capabilities`
+        self.capabilities: LightCapabilities | None = None
+        # Consecutive interval updates at which the light did not reflect our last
+        # command, and the loop time until which its adaptations are skipped
+        self.non_convergences: int | None = None
+        self.backoff_until: float | None = None
+        # Loop time since when the light is no longer known to HA
+        self.missing_since: float | None = None
+
+
+class LightRecordFieldView(MutableMapping[str, _V], Generic[_V]):
+    """Dictionary view of one field of the `LightRecord`s, keyed by light.
+
+    A light is in the view if its record has the field set (i.e., not `None`).
+    Values are passed through `convert` when they are set.
+    """
+
+    def __init__(
+        self,
+        records: dict[str, LightRecord],
+        field: str,
+        convert: Callable[[Any], _V] | None = None,
+    ) -> None:
+        """Initialize the view of `field`."""
+        self._records = records
+        self._field = field
+        self._convert = convert
+
+    def __getitem__(self, light: str) -> _V:
+        """Return the field of the record of `light`."""
+        record = self._records.get(light)
+        if record is None:
+            raise KeyError(light)
+        value = getattr(record, self._field)
+        if value is None:
+            raise KeyError(light)
+        return value
+
+    def __setitem__(self, light: str, value: _V) -> None:
+        """Set the field of the record of `light`, creating the record if needed."""
+        if (record := self._records.get(light)) is None:
+            record = self._records[light] = LightRecord()
+        if self._convert is not None:
+            value = self._convert(value)
+        setattr(record, self._field, value)
+
+    def __delitem__(self, light: str) -> None:
+        """Unset the field of the record of `light`."""
+        self[light]
+        setattr(self._records[light], self._field, None)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the lights that have the field set."""
+        field = self._field
+        return (
+            light
+            for light, record in list(self._records.items())
+            if getattr(record, field) is not None
+        )
+
+    def __len__(self) -> int:
+        """Return the number of lights that have the field set."""
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Return the view as a dictionary representation."""
+        return repr(dict(self.items()))
+
+    def __copy__(self) -> dict[str, _V]:
+        """Return a shallow copy as a plain dictionary."""
+        return dict(self.items())
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, _V]:
+        """Return a deep copy of the field values as a plain dictionary."""
+        return deepcopy(dict(self.items()), memo)
@@ -5,8 +5,11 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
+import time
 import zoneinfo
+from collections import OrderedDict, deque
 from copy import deepcopy
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -18,11 +21,8 @@ from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_COLOR_TEMP_KELVIN,
     ATTR_RGB_COLOR,
-    ATTR_SUPPORTED_COLOR_MODES,
     ATTR_TRANSITION,
     ATTR_XY_COLOR,
-    ColorMode,
-    LightEntityFeature,
     is_on,
     preprocess_turn_on_alternatives,
 )
@@ -36,7 +36,6 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
-    ATTR_SUPPORTED_FEATURES,
     CONF_NAME,
     CONF_PARAMS,
     EVENT_CALL_SERVICE,
@@ -54,7 +53,9 @@ from homeassistant.core import (
     Event,
     HomeAssistant,
     ServiceCall,
+    ServiceResponse,
     State,
+    SupportsResponse,
     callback,
 )
 from homeassistant.helpers import entity_platform, entity_registry
@@ -62,26 +63,31 @@ from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.helpers.event import (
     EventStateChangedData,
+    async_call_later,
     async_track_state_change_event,
-    async_track_time_interval,
 )
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.util import slugify
-from homeassistant.util.color import (
-    color_temperature_to_rgb,
-    color_xy_to_RGB,
-)
+from homeassistant.util.async_ import gather_with_limited_concurrency
 
 from .adaptation_utils import (
+    DEFAULT_REDUNDANCY_TOLERANCE,
     AdaptationData,
     LightControlAttributes,
+    RedundancyTolerance,
     ServiceData,
     get_light_control_attributes,
+    has_brightness_attribute,
+    has_color_attribute,
+    has_converged,
     has_effect_attribute,
     manual_control_event_attribute_to_flags,
     prepare_adaptation_data,
 )
-from .color_and_brightness import SunLightSettings
+from .capabilities import CAPABILITY_ATTRS, LightCapabilities, light_capabilities
+from .color_and_brightness import LightProfile, SunLightSettings
+from .color_conversion import kelvin_to_rgb, xy_to_rgb
 from .const import (
     ADAPT_BRIGHTNESS_SWITCH,
     ADAPT_COLOR_SWITCH,
@@ -91,6 +97,7 @@ from .const import (
     CONF_ADAPT_DELAY,
     CONF_ADAPT_ONLY_ON_BARE_TURN_ON,
     CONF_ADAPT_UNTIL_SLEEP,
+    CONF_AUTO_SEND_SPLIT_DELAY,
     CONF_AUTORESET_CONTROL,
     CONF_BRIGHTNESS_MODE,
     CONF_BRIGHTNESS_MODE_TIME_DARK,
@@ -100,6 +107,7 @@ from .const import (
     CONF_INITIAL_TRANSITION,
     CONF_INTERCEPT,
     CONF_INTERVAL,
+    CONF_LIGHT_PROFILES,
     CONF_LIGHTS,
     CONF_MANUAL_CONTROL,
     CONF_MAX_BRIGHTNESS,
@@ -113,8 +121,13 @@ from .const import (
     CONF_MULTI_LIGHT_INTERCEPT,
     CONF_ONLY_ONCE,
     CONF_PREFER_RGB_COLOR,
+    CONF_PRELOAD_OFF_LIGHTS,
+    CONF_PRIORITY,
+    CONF_ROLLOUT_ORDER,
+    CONF_ROLLOUT_WINDOW,
     CONF_SEND_SPLIT_DELAY,
     CONF_SEPARATE_TURN_ON_COMMANDS,
+    CONF_SHARED_INTERVAL_CLOCK,
     CONF_SKIP_REDUNDANT_COMMANDS,
     CONF_SLEEP_BRIGHTNESS,
     CONF_SLEEP_COLOR_TEMP,
@@ -136,28 +149,52 @@ from .const import (
     ICON_COLOR_TEMP,
     ICON_MAIN,
     ICON_SLEEP,
+    LIGHT_RECORD_PURGE_INTERVAL,
+    LIGHT_RECORD_TTL,
+    MAX_AUTO_SEND_SPLIT_DELAY,
+    NON_CONVERGENCE_MAX_BACKOFF,
+    NON_CONVERGENCE_THRESHOLD,
+    PRELOAD_MIN_INTERVAL,
+    PROACTIVE_CONTEXT_LIFETIME,
     SERVICE_APPLY,
+    SERVICE_CALL_CONCURRENCY,
     SERVICE_CHANGE_SWITCH_SETTINGS,
     SERVICE_SET_MANUAL_CONTROL,
     SET_MANUAL_CONTROL_SCHEMA,
+    SHARED_CLOCK_SPREAD,
     SLEEP_MODE_SWITCH,
+    STARTUP_BATCH_INTERVAL,
+    STARTUP_BATCH_SIZE,
+    STARTUP_MAX_WAIT,
+    STARTUP_QUIET_PERIOD,
+    STATE_HISTORY_LENGTH,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
     TURNING_OFF_DELAY,
     VALIDATION_TUPLES,
+    RolloutOrder,
     TakeOverControlMode,
     apply_service_schema,
     replace_none_str,
 )
-from .hass_utils import area_entities, setup_service_call_interceptor
+from .desired_state import DesiredState, DesiredStateStore, desired_state_from_settings
+from .hass_utils import area_entities, rollout_order, setup_service_call_interceptor
 from .helpers import (
-    clamp,
     color_difference_redmean,
     int_to_base36,
     remove_vowels,
     short_hash,
 )
+from .light_record import (
+    EventRecord,
+    LatencyEstimator,
+    LightRecord,
+    LightRecordFieldView,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine, Iterable
+    from collections.abc import Callable, Coroutine, Iterable, Mapping
 
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -249,7 +286,9 @@ def _switches_with_lights(
         entry = data.get(config.entry_id)
         if entry is None:  # entry might be disabled and therefore missing
             continue
-        switch = data[config.entry_id][SWITCH_DOMAIN]
+        switch = entry.get(SWITCH_DOMAIN)
+        if switch is None:  # entry is still being set up
+            continue
         switch._expand_light_groups(hass=hass)
         # Check if any of the lights are in the switch's lights
         if set(switch.lights) & set(all_check_lights):
@@ -355,8 +394,6 @@ async def handle_change_switch_settings(
 
     # deep copy the defaults so we don't modify the original dicts
     switch._set_changeable_settings(data=data, defaults=deepcopy(defaults))
-    if switch.is_on:
-        switch._update_time_interval_listener()
 
     _LOGGER.debug(
         "Called 'adaptive_lighting.change_switch_settings' service with '%s'",
@@ -402,6 +439,7 @@ async def async_setup_entry(  # noqa: PLR0915
     if (manager := data.get(ATTR_ADAPTIVE_LIGHTING_MANAGER)) is None:
         manager = AdaptiveLightingManager(hass)
         data[ATTR_ADAPTIVE_LIGHTING_MANAGER] = manager
+    await manager.async_restore_state()
 
     sleep_mode_switch = SimpleSwitch(
         which="Sleep Mode",
@@ -444,7 +482,7 @@ async def async_setup_entry(  # noqa: PLR0915
     )
 
     @callback
-    async def handle_apply(service_call: ServiceCall) -> None:
+    async def handle_apply(service_call: ServiceCall) -> ServiceResponse:
         """Handle the entity service apply."""
         data = service_call.data
         _LOGGER.debug(
@@ -453,6 +491,8 @@ async def async_setup_entry(  # noqa: PLR0915
         )
         switches = _switches_from_service_call(hass, service_call)
         lights = data[CONF_LIGHTS]
+        outcomes: list[dict[str, Any]] = []
+        jobs: list[Coroutine[Any, Any, dict[str, Any]]] = []
         for switch in switches:
             if not lights:
                 all_lights = switch.lights
@@ -465,18 +505,29 @@ async def async_setup_entry(  # noqa: PLR0915
                         "service",
                         parent=service_call.context,
                     )
-                    await switch._adapt_light(  # pylint: disable=protected-access
-                        light,
-                        context=context,
-                        transition=data[CONF_TRANSITION],
-                        adapt_brightness=data[ATTR_ADAPT_BRIGHTNESS],
-                        adapt_color=data[ATTR_ADAPT_COLOR],
-                        prefer_rgb_color=data[CONF_PREFER_RGB_COLOR],
-                        force=True,
+                    jobs.append(
+                        switch._timed_adapt_light(  # pylint: disable=protected-access
+                            light,
+                            context=context,
+                            transition=data[CONF_TRANSITION],
+                            adapt_brightness=data[ATTR_ADAPT_BRIGHTNESS],
+                            adapt_color=data[ATTR_ADAPT_COLOR],
+                            prefer_rgb_color=data[CONF_PREFER_RGB_COLOR],
+                            force=True,
+                        ),
                     )
+                else:
+                    outcomes.append(switch._adaptation_outcome(light, "off"))
+
+        # Adapt the lights concurrently, otherwise the (split) service calls and the
+        # sleeps in between them are serialized over all lights.
+        outcomes.extend(
+            await gather_with_limited_concurrency(SERVICE_CALL_CONCURRENCY, *jobs),
+        )
+        return _service_response(service_call, outcomes)
 
     @callback
-    async def handle_set_manual_control(service_call: ServiceCall) -> None:
+    async def handle_set_manual_control(service_call: ServiceCall) -> ServiceResponse:
         """Set or unset lights as 'manually controlled'."""
         data = service_call.data
         _LOGGER.debug(
@@ -485,6 +536,8 @@ async def async_setup_entry(  # noqa: PLR0915
         )
         switches = _switches_from_service_call(hass, service_call)
         lights = data[CONF_LIGHTS]
+        outcomes: list[dict[str, Any]] = []
+        jobs: list[Coroutine[Any, Any, list[dict[str, Any]]]] = []
         for switch in switches:
             if not lights:
                 all_lights = switch.lights
@@ -505,6 +558,9 @@ async def async_setup_entry(  # noqa: PLR0915
                         light,
                         service_call.context,
                     )
+                    outcomes.append(
+                        switch._adaptation_outcome(light, "manually_controlled"),
+                    )
             else:
                 switch.manager.reset(*all_lights)
                 if switch.is_on:
@@ -513,19 +569,27 @@ async def async_setup_entry(  # noqa: PLR0915
                         parent=service_call.context,
                     )
                     # pylint: disable=protected-access
-                    await switch._update_attrs_and_maybe_adapt_lights(
-                        context=context,
-                        lights=all_lights,
-                        transition=switch.initial_transition,
-                        force=True,
+                    jobs.append(
+                        switch._update_attrs_and_maybe_adapt_lights(
+                            context=context,
+                            lights=all_lights,
+                            transition=switch.initial_transition,
+                            force=True,
+                            max_concurrency=SERVICE_CALL_CONCURRENCY,
+                        ),
                     )
 
+        for switch_outcomes in await asyncio.gather(*jobs):
+            outcomes.extend(switch_outcomes)
+        return _service_response(service_call, outcomes)
+
     # Register `apply` service
     hass.services.async_register(
         domain=DOMAIN,
         service=SERVICE_APPLY,
         service_func=handle_apply,
         schema=apply_service_schema(switch.initial_transition),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     # Register `set_manual_control` service
@@ -534,6 +598,7 @@ async def async_setup_entry(  # noqa: PLR0915
         service=SERVICE_SET_MANUAL_CONTROL,
         service_func=handle_set_manual_control,
         schema=SET_MANUAL_CONTROL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     args: VolDictType = {vol.Optional(CONF_USE_DEFAULTS, default="current"): cv.string}
@@ -551,6 +616,31 @@ async def async_setup_entry(  # noqa: PLR0915
     )
 
 
+def rollout_schedule(
+    n_lights: int,
+    window: float,
+    transition: float,
+) -> list[tuple[float, float]]:
+    """Return the (delay, transition) for each light in a staggered rollout.
+
+    The start times are spread evenly over the window and the transitions are
+    shortened accordingly, such that all lights reach their target together.
+    """
+    delays = [window * i / n_lights for i in range(n_lights)]
+    arrival = max(transition, delays[-1]) if delays else transition
+    return [(delay, max(arrival - delay, 0)) for delay in delays]
+
+
+def _service_response(
+    service_call: ServiceCall,
+    outcomes: list[dict[str, Any]],
+) -> ServiceResponse:
+    """Return the per-light outcomes if the caller asked for a response."""
+    if not service_call.return_response:
+        return None
+    return {"lights": outcomes}
+
+
 def validate(
     config_entry: ConfigEntry | None,
     service_data: dict[str, Any] | None = None,
@@ -583,6 +673,32 @@ def validate(
     return data
 
 
+def _sun_light_settings_fields(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the `SunLightSettings` fields that come from the settings."""
+    return {
+        "adapt_until_sleep": data[CONF_ADAPT_UNTIL_SLEEP],
+        "max_brightness": data[CONF_MAX_BRIGHTNESS],
+        "max_color_temp": data[CONF_MAX_COLOR_TEMP],
+        "min_brightness": data[CONF_MIN_BRIGHTNESS],
+        "min_color_temp": data[CONF_MIN_COLOR_TEMP],
+        "sleep_brightness": data[CONF_SLEEP_BRIGHTNESS],
+        "sleep_color_temp": data[CONF_SLEEP_COLOR_TEMP],
+        "sleep_rgb_color": data[CONF_SLEEP_RGB_COLOR],
+        "sleep_rgb_or_color_temp": data[CONF_SLEEP_RGB_OR_COLOR_TEMP],
+        "sunrise_offset": data[CONF_SUNRISE_OFFSET],
+        "sunrise_time": data[CONF_SUNRISE_TIME],
+        "min_sunrise_time": data[CONF_MIN_SUNRISE_TIME],
+        "max_sunrise_time": data[CONF_MAX_SUNRISE_TIME],
+        "sunset_offset": data[CONF_SUNSET_OFFSET],
+        "sunset_time": data[CONF_SUNSET_TIME],
+        "min_sunset_time": data[CONF_MIN_SUNSET_TIME],
+        "max_sunset_time": data[CONF_MAX_SUNSET_TIME],
+        "brightness_mode": data[CONF_BRIGHTNESS_MODE],
+        "brightness_mode_time_dark": data[CONF_BRIGHTNESS_MODE_TIME_DARK],
+        "brightness_mode_time_light": data[CONF_BRIGHTNESS_MODE_TIME_LIGHT],
+    }
+
+
 def _is_state_event(
     event: Event[EventStateChangedData],
     from_or_to_state: Iterable[str],
@@ -625,48 +741,6 @@ def _is_light_group(state: State) -> bool:
     )
 
 
-def _supported_features(hass: HomeAssistant, light: str) -> set[str]:
-    state = hass.states.get(light)
-    assert state is not None
-    supported_features = int(
-        state.attributes.get(ATTR_SUPPORTED_FEATURES, 0),
-    )  # type: ignore[arg-type]
-    assert isinstance(supported_features, int)
-
-    supported: set[str] = set()
-
-    if supported_features & LightEntityFeature.TRANSITION:
-        supported.add("transition")
-
-    supported_color_modes = state.attributes.get(
-        ATTR_SUPPORTED_COLOR_MODES,
-        set(),
-    )  # type: ignore[arg-type]
-    color_modes = {
-        ColorMode.RGB,
-        ColorMode.RGBW,
-        ColorMode.RGBWW,
-        ColorMode.XY,
-        ColorMode.HS,
-    }
-
-    # Adding brightness when color mode is supported, see
-    # comment https://github.com/basnijholt/adaptive-lighting/issues/112#issuecomment-836944011
-
-    for mode in color_modes:
-        if mode in supported_color_modes:
-            supported.update({"color", "brightness"})
-            break
-
-    if ColorMode.COLOR_TEMP in supported_color_modes:
-        supported.update({"color_temp", "brightness"})
-
-    if ColorMode.BRIGHTNESS in supported_color_modes:
-        supported.add("brightness")
-
-    return supported
-
-
 # All comparisons should be done with RGB since
 # converting anything to color temp is inaccurate.
 def _convert_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
@@ -675,9 +749,9 @@ def _convert_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
 
     rgb = None
     if (color := attributes.get(ATTR_COLOR_TEMP_KELVIN)) is not None:
-        rgb = color_temperature_to_rgb(color)
+        rgb = kelvin_to_rgb(color)
     elif (color := attributes.get(ATTR_XY_COLOR)) is not None:
-        rgb = color_xy_to_RGB(*color)
+        rgb = xy_to_rgb(*color)
 
     if rgb is not None:
         attributes[ATTR_RGB_COLOR] = rgb
@@ -857,6 +931,9 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         self.sleep_mode_switch = sleep_mode_switch
         self.adapt_color_switch = adapt_color_switch
         self.adapt_brightness_switch = adapt_brightness_switch
+        # These decide which attributes of shared lights the switch owns
+        adapt_color_switch.on_toggle = manager.invalidate_ownership
+        adapt_brightness_switch.on_toggle = manager.invalidate_ownership
 
         data = validate(config_entry)
 
@@ -866,17 +943,35 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
 
         # backup data for use in change_switch_settings "configuration" CONF_USE_DEFAULTS
         self._config_backup = deepcopy(data)
+        self._current_settings: dict[str, Any] | None = None
         self._set_changeable_settings(data=data, defaults=None)
 
         # Set other attributes
         self._icon = ICON_MAIN
         self._state: bool | None = None
+        self._turned_on_at = 0.0
 
         # To count the number of `Context` instances
         self._context_cnt: int = 0
+        self._tick_cnt: int = 0
+
+        # The adaptations of a rollout, running in the background
+        self._rollout_task: asyncio.Task[None] | None = None
+
+        # Lights that did not finish adapting within the deadline of the last tick
+        self._carried_over_lights: list[str] = []
+        self.tick_statistics = TickStatistics()
 
         # Set in self._update_attrs_and_maybe_adapt_lights
-        self._settings: dict[str, Any] = {}
+        self._settings: Mapping[str, Any] = {}
+        # Identifies the desired states in the manager's store computed from _settings
+        self._settings_generation: int = 0
+        # Desired states of this generation, shared by lights with equal capabilities
+        # and profile
+        self._desired_by_capabilities: dict[
+            tuple[LightCapabilities, LightProfile | None],
+            DesiredState,
+        ] = {}
 
         # Set and unset tracker in async_turn_on and async_turn_off
         self.remove_listeners: list[CALLBACK_TYPE] = []
@@ -897,6 +992,10 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         data: dict[str, Any],
         defaults: dict[str, Any] | None = None,
     ) -> None:
+        """Apply the settings, only rebuilding what depends on the changed ones.
+
+        Timers and the manual control of the lights are kept.
+        """
         # Only pass settings users can change during runtime
         data = validate(
             config_entry=None,
@@ -904,8 +1003,12 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             defaults=defaults,
         )
 
+        previous = self._current_settings
         # backup data for use in change_switch_settings "current" CONF_USE_DEFAULTS
         self._current_settings = data
+        if previous is not None and previous == data:
+            _LOGGER.debug("%s: Settings are unchanged", self._name)
+            return
 
         self._detect_non_ha_changes = data[CONF_DETECT_NON_HA_CHANGES]
         self._include_config_in_attributes = data[CONF_INCLUDE_CONFIG_IN_ATTRIBUTES]
@@ -927,6 +1030,14 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         self._transition: int = data[CONF_TRANSITION]
         self._adapt_delay = data[CONF_ADAPT_DELAY]
         self._send_split_delay = data[CONF_SEND_SPLIT_DELAY]
+        self._auto_send_split_delay = data[CONF_AUTO_SEND_SPLIT_DELAY]
+        self._preload_off_lights = data[CONF_PRELOAD_OFF_LIGHTS]
+        self._priority = data[CONF_PRIORITY]
+        self._shared_interval_clock = data[CONF_SHARED_INTERVAL_CLOCK]
+        self._light_profiles = {
+            light: LightProfile(**profile)
+            for light, profile in data[CONF_LIGHT_PROFILES].items()
+        }
         self._take_over_control = data[CONF_TAKE_OVER_CONTROL]
         if not data[CONF_TAKE_OVER_CONTROL] and (
             data[CONF_DETECT_NON_HA_CHANGES] or data[CONF_ADAPT_ONLY_ON_BARE_TURN_ON]
@@ -947,6 +1058,8 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         self._skip_redundant_commands = data[CONF_SKIP_REDUNDANT_COMMANDS]
         self._intercept = data[CONF_INTERCEPT]
         self._multi_light_intercept = data[CONF_MULTI_LIGHT_INTERCEPT]
+        self._rollout_window = data[CONF_ROLLOUT_WINDOW]
+        self._rollout_order = RolloutOrder(data[CONF_ROLLOUT_ORDER])
         if not data[CONF_INTERCEPT] and data[CONF_MULTI_LIGHT_INTERCEPT]:
             _LOGGER.warning(
                 "%s: Config mismatch: `multi_light_intercept` set to `true` requires `intercept`"
@@ -955,34 +1068,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
                 self._name,
             )
             self._multi_light_intercept = False
-        self._expand_light_groups()  # updates manual control timers
-        observer = get_astral_observer(self.hass)
-
-        self._sun_light_settings = SunLightSettings(
-            name=self._name,
-            astral_observer=observer,
-            adapt_until_sleep=data[CONF_ADAPT_UNTIL_SLEEP],
-            max_brightness=data[CONF_MAX_BRIGHTNESS],
-            max_color_temp=data[CONF_MAX_COLOR_TEMP],
-            min_brightness=data[CONF_MIN_BRIGHTNESS],
-            min_color_temp=data[CONF_MIN_COLOR_TEMP],
-            sleep_brightness=data[CONF_SLEEP_BRIGHTNESS],
-            sleep_color_temp=data[CONF_SLEEP_COLOR_TEMP],
-            sleep_rgb_color=data[CONF_SLEEP_RGB_COLOR],
-            sleep_rgb_or_color_temp=data[CONF_SLEEP_RGB_OR_COLOR_TEMP],
-            sunrise_offset=data[CONF_SUNRISE_OFFSET],
-            sunrise_time=data[CONF_SUNRISE_TIME],
-            min_sunrise_time=data[CONF_MIN_SUNRISE_TIME],
-            max_sunrise_time=data[CONF_MAX_SUNRISE_TIME],
-            sunset_offset=data[CONF_SUNSET_OFFSET],
-            sunset_time=data[CONF_SUNSET_TIME],
-            min_sunset_time=data[CONF_MIN_SUNSET_TIME],
-            max_sunset_time=data[CONF_MAX_SUNSET_TIME],
-            brightness_mode=data[CONF_BRIGHTNESS_MODE],
-            brightness_mode_time_dark=data[CONF_BRIGHTNESS_MODE_TIME_DARK],
-            brightness_mode_time_light=data[CONF_BRIGHTNESS_MODE_TIME_LIGHT],
-            timezone=zoneinfo.ZoneInfo(self.hass.config.time_zone),
-        )
+        self._rebuild_changed_components(data, previous)
         _LOGGER.debug(
             "%s: Set switch settings for lights '%s'. now using data: '%s'",
             self._name,
@@ -990,6 +1076,69 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             data,
         )
 
+    def _rebuild_changed_components(
+        self,
+        data: dict[str, Any],
+        previous: dict[str, Any] | None,
+    ) -> None:
+        if previous is None:
+            self._expand_light_groups()  # updates manual control timers
+            self._sun_light_settings = SunLightSettings(
+                name=self._name,
+                astral_observer=get_astral_observer(self.hass),
+                timezone=zoneinfo.ZoneInfo(self.hass.config.time_zone),
+                **_sun_light_settings_fields(data),
+            )
+            return
+        if data[CONF_PRIORITY] != previous[CONF_PRIORITY]:
+            self.manager.invalidate_ownership()
+        if data[CONF_AUTORESET_CONTROL] != previous[CONF_AUTORESET_CONTROL]:
+            self.manager.set_auto_reset_manual_control_times(
+                self.lights,
+                self._auto_reset_manual_control_time,
+            )
+        if (
+            data[CONF_SHARED_INTERVAL_CLOCK] != previous[CONF_SHARED_INTERVAL_CLOCK]
+            and self.is_on
+        ):
+            self._update_time_interval_listener()
+        # Keep the `SunLightSettings` (and its cached sun events) if possible
+        sun_light_settings = self._sun_light_settings
+        if changes := {
+            field: value
+            for field, value in _sun_light_settings_fields(data).items()
+            if getattr(sun_light_settings, field) != value
+        }:
+            self._sun_light_settings = sun_light_settings.replace(**changes)
+        else:
+            self._settings_time = None  # Invalidate the settings
+
+    async def async_reconfigure(self, config_entry: ConfigEntry) -> bool:
+        """Apply changed options of the config entry in place.
+
+        Returns False if the name or the lights changed, which requires a reload.
+        """
+        data = validate(config_entry)
+        if any(
+            data[key] != self._config_backup[key] for key in (CONF_NAME, CONF_LIGHTS)
+        ):
+            return False
+        self._config_backup = deepcopy(data)
+        self._set_changeable_settings(data=data, defaults=None)
+        if data[CONF_INTERVAL] != self._interval:
+            self._interval = data[CONF_INTERVAL]
+            if self.is_on:
+                self._update_time_interval_listener()
+        _LOGGER.debug("%s: Reconfigured in place with '%s'", self._name, data)
+        self.manager.reset(*self.lights, reset_manual_control=False)
+        if self.is_on:
+            await self._update_attrs_and_maybe_adapt_lights(
+                context=self.create_context("reconfigure"),
+                transition=self.initial_transition,
+            )
+        self.async_write_ha_state()
+        return True
+
     @property
     def name(self) -> str:
         """Return the name of the device if any."""
@@ -1005,6 +1154,24 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         """Return true if adaptive lighting is on."""
         return self._state
 
+    @property
+    def enabled_attributes(self) -> LightControlAttributes:
+        """Return the attributes that the adapt brightness and color switches enable."""
+        return (
+            LightControlAttributes.BRIGHTNESS
+            if self.adapt_brightness_switch.is_on
+            else LightControlAttributes.NONE
+        ) | (
+            LightControlAttributes.COLOR
+            if self.adapt_color_switch.is_on
+            else LightControlAttributes.NONE
+        )
+
+    @property
+    def ownership_key(self) -> tuple[int, float, str]:
+        """Return the key by which the owner of a shared light is chosen (lowest)."""
+        return (-self._priority, self._turned_on_at, self._name)
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device info, used to group this and adjacent entities in the UI."""
@@ -1018,6 +1185,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
 
     async def async_added_to_hass(self) -> None:
         """Call when entity about to be added to hass."""
+        self.manager.add_switch(self)
         if self.hass.is_running:
             await self._setup_listeners()
         else:
@@ -1028,7 +1196,17 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         last_state: State | None = await self.async_get_last_state()
         is_new_entry = last_state is None  # newly added to HA
         if is_new_entry or last_state.state == STATE_ON:  # type: ignore[union-attr]
-            await self.async_turn_on(adapt_lights=not self._only_once)
+            # Keep the manual control that the manager restored from storage
+            if self.hass.is_running:
+                await self.async_turn_on(
+                    adapt_lights=not self._only_once,
+                    reset_manual_control=False,
+                )
+            else:
+                # Home Assistant is starting, adapt once the lights have settled
+                await self.async_turn_on(adapt_lights=False, reset_manual_control=False)
+                if not self._only_once:
+                    self.manager.startup_warmup.add(self)
         else:
             self._state = False
             assert not self.remove_listeners
@@ -1036,6 +1214,9 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
     async def async_will_remove_from_hass(self) -> None:
         """Remove the listeners upon removing the component."""
         self._remove_listeners()
+        self._cancel_rollout()
+        self.manager.startup_warmup.discard(self)
+        self.manager.remove_switch(self)
 
     def _expand_light_groups(self, hass: HomeAssistant | None = None) -> None:
         hass = hass or self.hass
@@ -1046,6 +1227,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             self._auto_reset_manual_control_time,
         )
         self.lights = list(all_lights)
+        self.manager.invalidate_ownership()
 
     async def _setup_listeners(self, _: Event[NoEventData] | None = None) -> None:
         _LOGGER.debug("%s: Called '_setup_listeners'", self._name)
@@ -1067,31 +1249,46 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         self._expand_light_groups()
 
     def _update_time_interval_listener(self) -> None:
-        """Create or recreate the adaptation interval listener.
+        """Create or recreate the adaptation interval loop.
 
-        Recreation is necessary when the configuration has changed (e.g., `send_split_delay`).
+        Recreation is necessary when the configuration has changed (e.g., `interval`).
+        The interval and adaptation are a coupled process: every tick schedules the
+        next one once it has finished, so ticks never overlap, see `_async_interval_tick`.
+        With `shared_interval_clock`, the manager's clock runs the ticks instead.
         """
         self._remove_interval_listener()
+        if self._shared_interval_clock:
+            self.manager.interval_clock.add(self)
+            return
+        self._schedule_interval_tick(self._interval.total_seconds())
 
-        # An adaptation takes a little longer than its nominal duration due processing overhead,
-        # so we factor this in to avoid overlapping adaptations. Since this is a constant value,
-        # it might not cover all cases, but if large enough, it covers most.
-        # Ideally, the interval and adaptation are a coupled process where a finished adaptation
-        # triggers the next, but that requires a larger architectural change.
-        processing_overhead_time = 0.5
-
-        adaptation_interval = (
-            self._interval
-            + timedelta(milliseconds=self._send_split_delay)
-            + timedelta(seconds=processing_overhead_time)
-        )
-
-        self.remove_interval = async_track_time_interval(
+    def _schedule_interval_tick(self, delay: float) -> None:
+        self.remove_interval = async_call_later(
             self.hass,
-            action=self._async_update_at_interval_action,
-            interval=adaptation_interval,
+            delay,
+            self._async_interval_tick,
         )
 
+    async def _async_interval_tick(self, now: datetime.datetime) -> None:
+        """Run a single tick of the interval loop and schedule the next one.
+
+        The next tick is due one `interval` after the start of this tick, but is only
+        scheduled once this tick has completed. Because a tick is cut off at its
+        deadline, a slow tick delays the next one instead of piling up on top of it.
+        """
+        self.remove_interval = lambda: None  # The timer has fired
+        tick_cnt = self._tick_cnt
+        start = self.hass.loop.time()
+        try:
+            await self._async_update_at_interval_action(now)
+        finally:
+            # Only reschedule if the loop was not stopped or restarted in the meantime
+            if tick_cnt == self._tick_cnt:
+                elapsed = self.hass.loop.time() - start
+                self._schedule_interval_tick(
+                    max(self._interval.total_seconds() - elapsed, 0),
+                )
+
     def _call_on_remove_callbacks(self) -> None:
         """Call callbacks registered by async_on_remove."""
         # This is called when the integration is removed from HA
@@ -1110,8 +1307,10 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             )
 
     def _remove_interval_listener(self) -> None:
+        self._tick_cnt += 1  # Stops a running tick from scheduling the next one
         self.remove_interval()
         self.remove_interval = lambda: None
+        self.manager.interval_clock.discard(self)
 
     def _remove_listeners(self) -> None:
         self._remove_interval_listener()
@@ -1158,8 +1357,13 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
     async def async_turn_on(  # type: ignore[override]
         self,
         adapt_lights: bool = True,
+        reset_manual_control: bool = True,
     ) -> None:
-        """Turn on adaptive lighting."""
+        """Turn on adaptive lighting.
+
+        With `reset_manual_control=False`, only lights that are off or that the
+        manager doesn't know yet are reset.
+        """
         _LOGGER.debug(
             "%s: Called 'async_turn_on', current state is '%s'",
             self._name,
@@ -1168,13 +1372,26 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         if self.is_on:
             return
         self._state = True
-        self.manager.reset(*self.lights)
+        self._turned_on_at = self.hass.loop.time()
+        self.manager.invalidate_ownership()
+        if reset_manual_control:
+            self.manager.reset(*self.lights)
+        else:
+            self.manager.reset(
+                *(
+                    light
+                    for light in self.lights
+                    if self.hass.states.is_state(light, STATE_OFF)
+                    or light not in self.manager.manual_control
+                ),
+            )
         await self._setup_listeners()
         if adapt_lights:
             await self._update_attrs_and_maybe_adapt_lights(
                 context=self.create_context("turn_on"),
                 transition=self.initial_transition,
                 force=True,
+                rollout=True,
             )
 
     async def async_turn_off(self, **kwargs: Any) -> None:  # noqa: ARG002
@@ -1183,19 +1400,237 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             return
         self._state = False
         self._remove_listeners()
+        self._cancel_rollout()
+        self.manager.invalidate_ownership()
         self.manager.reset(*self.lights)
 
     async def _async_update_at_interval_action(
         self,
         now: Any = None,  # noqa: ARG002
+        *,
+        delays: Mapping[str, float] | None = None,
+        deadline: float | None = None,
     ) -> None:
-        """Update the attributes and maybe adapt the lights."""
-        await self._update_attrs_and_maybe_adapt_lights(
+        """Update the attributes and maybe adapt the lights.
+
+        The adaptations have to finish within one `interval` (or by `deadline`), the
+        lights that did not make it are carried over to the front of the next tick.
+        `delays` (in seconds) of the lights are set by the shared interval clock, which
+        also shifts the deadline of each light by its delay. Carried over lights
+        start without delay.
+        """
+        start = self.hass.loop.time()
+        carried_over = [
+            light for light in self._carried_over_lights if light in self.lights
+        ]
+        if delays is not None and carried_over:
+            delays = {**delays, **dict.fromkeys(carried_over, 0.0)}
+        lights = carried_over + [
+            light for light in self.lights if light not in carried_over
+        ]
+        outcomes = await self._update_attrs_and_maybe_adapt_lights(
             context=self.create_context("interval"),
+            lights=lights,
             transition=self._transition,
             force=False,
+            deadline=deadline or start + self._interval.total_seconds(),
+            delays=delays,
+        )
+        self._carried_over_lights = [
+            outcome[ATTR_ENTITY_ID]
+            for outcome in outcomes
+            if outcome["outcome"] == "carried_over"
+        ]
+        self.tick_statistics.record(
+            self.hass.loop.time() - start,
+            len(self._carried_over_lights),
+        )
+        if self._carried_over_lights:
+            _LOGGER.debug(
+                "%s: Interval tick overran its deadline, carrying over %s",
+                self._name,
+                self._carried_over_lights,
+            )
+        if self._preload_off_lights:
+            self._preload_lights(self.create_context("preload"))
+
+    def _preload_lights(self, context: Context) -> None:
+        """Fire 'adaptive_lighting.preload' events for the lights that are off.
+
+        An automation can then push the desired states to lights that accept them
+        while off. A light is preloaded when its desired state changed, at most every
+        `PRELOAD_MIN_INTERVAL` seconds.
+        """
+        now = self.hass.loop.time()
+        for light in self.lights:
+            if not self.hass.states.is_state(light, STATE_OFF):
+                continue
+            record = self.manager.record(light)
+            desired = self.desired_state(light, self._transition)
+            preloaded, preloaded_at = record.preloaded, record.preloaded_at
+            if preloaded is not None and (
+                self._is_close_to(light, preloaded, desired)
+                or (
+                    preloaded_at is not None
+                    and now - preloaded_at < PRELOAD_MIN_INTERVAL
+                )
+            ):
+                continue
+            record.preloaded = desired
+            record.preloaded_at = now
+            event_data: dict[str, Any] = {
+                ATTR_ENTITY_ID: light,
+                SWITCH_DOMAIN: self.entity_id,
+            }
+            if self.adapt_brightness_switch.is_on and desired.brightness is not None:
+                event_data[ATTR_BRIGHTNESS] = desired.brightness
+            if self.adapt_color_switch.is_on:
+                if desired.color_temp_kelvin is not None:
+                    event_data[ATTR_COLOR_TEMP_KELVIN] = desired.color_temp_kelvin
+                elif desired.rgb_color is not None:
+                    event_data[ATTR_RGB_COLOR] = desired.rgb_color
+            _LOGGER.debug("%s: Preloading '%s' with %s", self._name, light, event_data)
+            self.hass.bus.async_fire(f"{DOMAIN}.preload", event_data, context=context)
+
+    def _is_close_to(
+        self,
+        light: str,
+        desired: DesiredState,
+        other: DesiredState,
+    ) -> bool:
+        """Return whether two desired states of a light are (nearly) the same."""
+        tolerance = self.manager.redundancy_tolerance(light)
+        return all(
+            tolerance.is_close(attr, getattr(desired, attr), getattr(other, attr))
+            for attr in (ATTR_BRIGHTNESS, ATTR_COLOR_TEMP_KELVIN, ATTR_RGB_COLOR)
         )
 
+    def is_preloaded(self, light: str, params: dict[str, Any]) -> bool:
+        """Return whether a bare turn on of a light can skip its interception.
+
+        That is the case when the light (off) was preloaded with its desired state.
+        """
+        if (
+            not self._preload_off_lights
+            or has_brightness_attribute(params)
+            or has_color_attribute(params)
+        ):
+            return False
+        record = self.manager.light_records.get(light)
+        if record is None or record.preloaded is None:
+            return False
+        return self._is_close_to(light, record.preloaded, self.desired_state(light))
+
+    async def async_adapt_deferred_light(self, light: str) -> None:
+        """Adapt a light that was skipped because it was still transitioning.
+
+        Called when its transition ends, using the settings of the skipped update,
+        such that the light converges without waiting for the next interval.
+        """
+        if not self.is_on or light not in self.lights:
+            return
+        context = self.create_context("interval")
+        if not self._filter_adaptable_lights(context, [light], force=False):
+            return
+        await self.manager.update_manually_controlled_from_untracked_change(
+            self,
+            light,
+            False,  # noqa: FBT003
+            context,
+        )
+        if self.manager.get_adaption_control_attributes(self, light).has_none():
+            return
+        _LOGGER.debug(
+            "%s: Adapting '%s' after its transition ended, context.id=%s.",
+            self._name,
+            light,
+            context.id,
+        )
+        await self._timed_adapt_light(light, context, self._transition)
+
+    @property
+    def _sun_light_settings(self) -> SunLightSettings:
+        return self._sun_light_settings_value
+
+    @_sun_light_settings.setter
+    def _sun_light_settings(self, sun_light_settings: SunLightSettings) -> None:
+        self._sun_light_settings_value = sun_light_settings
+        # Loop time at which `_settings` were computed, None invalidates them
+        self._settings_time: float | None = None
+
+    def _update_settings(self, transition: int | None) -> None:
+        """Recompute the settings, which invalidates the lights' desired states.
+
+        Color spaces that no light needs are never calculated, see `LightSettings`.
+        """
+        self._settings = self._sun_light_settings.get_settings(
+            self.sleep_mode_switch.is_on,
+            transition,
+        )
+        self._settings_time = self.hass.loop.time()
+        self._settings_generation += 1
+        self._desired_by_capabilities.clear()
+
+    def desired_state(
+        self,
+        light: str,
+        transition: int | None = None,
+    ) -> DesiredState:
+        """Return the desired state of a light from the manager's store.
+
+        The state is computed from the current settings for the first reader after
+        they changed, and shared by lights with the same capabilities and profile
+        (see `light_profile`). Settings older than one `interval` (e.g., when the
+        switch is off) are recomputed first, with `transition`.
+        """
+        if (
+            self._settings_time is None
+            or self.hass.loop.time() - self._settings_time
+            > self._interval.total_seconds()
+        ):
+            self._update_settings(transition)
+        store = self.manager.desired_states
+        if (desired := store.get(light, self._name, self._settings_generation)) is None:
+            key = (self.manager.capabilities(light), self.light_profile(light))
+            desired = self._desired_by_capabilities.get(key)
+            if desired is None:
+                is_sleep = self.sleep_mode_switch.is_on
+                settings = self._settings
+                if key[1] is not None:
+                    settings = key[1].apply(
+                        settings,
+                        self._sun_light_settings,
+                        is_sleep,
+                    )
+                sleep_rgb = (
+                    is_sleep
+                    and self._sun_light_settings.sleep_rgb_or_color_temp == "rgb_color"
+                )
+                desired = desired_state_from_settings(
+                    self._name,
+                    self._settings_generation,
+                    settings,
+                    key[0],
+                    force_rgb_color=sleep_rgb or settings["force_rgb_color"],
+                )
+                self._desired_by_capabilities[key] = desired
+            store.set(light, desired)
+        return desired
+
+    def light_profile(self, light: str) -> LightProfile | None:
+        """Return the profile of a light, or else of a light group that contains it."""
+        if (profile := self._light_profiles.get(light)) is not None:
+            return profile
+        for group, profile in self._light_profiles.items():
+            state = self.hass.states.get(group)
+            if (
+                state is not None
+                and _is_light_group(state)
+                and light in state.attributes["entity_id"]
+            ):
+                return profile
+        return None
+
     async def prepare_adaptation_data(
         self,
         light: str,
@@ -1205,8 +1640,12 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         prefer_rgb_color: bool | None = None,
         force: bool = False,
         context: Context | None = None,
+        filter_by_state: bool | None = None,
     ) -> AdaptationData | None:
-        """Prepare `AdaptationData` for adapting a light."""
+        """Prepare `AdaptationData` for adapting a light.
+
+        `filter_by_state` overrides the `skip_redundant_commands` setting.
+        """
         adaptation_attributes = self.manager.get_adaption_control_attributes(
             self,
             light,
@@ -1232,48 +1671,29 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             )
             return None
 
-        # The switch might be off and not have _settings set.
-        self._settings = self._sun_light_settings.get_settings(
-            self.sleep_mode_switch.is_on,
-            transition,
-        )
+        desired = self.desired_state(light, transition)
 
         # Build service data.
         service_data: dict[str, Any] = {ATTR_ENTITY_ID: light}
-        features = _supported_features(self.hass, light)
 
         # Check transition == 0 to fix #378
-        use_transition = "transition" in features and transition > 0
+        use_transition = desired.supports_transition and transition > 0
         if use_transition:
             service_data[ATTR_TRANSITION] = transition
 
-        if "brightness" in features and adapt_brightness:
-            brightness = round(255 * self._settings["brightness_pct"] / 100)
-            service_data[ATTR_BRIGHTNESS] = brightness
+        if desired.brightness is not None and adapt_brightness:
+            service_data[ATTR_BRIGHTNESS] = desired.brightness
 
-        sleep_rgb = (
-            self.sleep_mode_switch.is_on
-            and self._sun_light_settings.sleep_rgb_or_color_temp == "rgb_color"
-        )
         if (
-            "color_temp" in features
+            desired.color_temp_kelvin is not None
             and adapt_color
-            and not (prefer_rgb_color and "color" in features)
-            and not (sleep_rgb and "color" in features)
-            and not (self._settings["force_rgb_color"] and "color" in features)
+            and not (prefer_rgb_color and desired.rgb_color is not None)
         ):
             _LOGGER.debug("%s: Setting color_temp of light %s", self._name, light)
-            state = self.hass.states.get(light)
-            assert isinstance(state, State)
-            attributes = state.attributes
-            min_kelvin = attributes["min_color_temp_kelvin"]
-            max_kelvin = attributes["max_color_temp_kelvin"]
-            color_temp_kelvin = self._settings["color_temp_kelvin"]
-            color_temp_kelvin = clamp(color_temp_kelvin, min_kelvin, max_kelvin)
-            service_data[ATTR_COLOR_TEMP_KELVIN] = color_temp_kelvin
-        elif "color" in features and adapt_color:
+            service_data[ATTR_COLOR_TEMP_KELVIN] = desired.color_temp_kelvin
+        elif desired.rgb_color is not None and adapt_color:
             _LOGGER.debug("%s: Setting rgb_color of light %s", self._name, light)
-            service_data[ATTR_RGB_COLOR] = self._settings["rgb_color"]
+            service_data[ATTR_RGB_COLOR] = desired.rgb_color
 
         required_attrs = [ATTR_RGB_COLOR, ATTR_COLOR_TEMP_KELVIN, ATTR_BRIGHTNESS]
         if not any(attr in service_data for attr in required_attrs):
@@ -1293,13 +1713,32 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             light,
             context,
             transition if use_transition else 0,
-            self._send_split_delay / 1000.0,
+            self._split_delay(light),
             service_data,
             split=self._separate_turn_on_commands,
-            filter_by_state=self._skip_redundant_commands,
+            filter_by_state=(
+                self._skip_redundant_commands
+                if filter_by_state is None
+                else filter_by_state
+            ),
             force=force,
+            tolerance=self.manager.redundancy_tolerance(light),
         )
 
+    def _split_delay(self, light: str) -> float:
+        """Return the delay (seconds) between the `separate_turn_on_commands`.
+
+        With `auto_send_split_delay`, the light's learned latency, at most the
+        `send_split_delay` (or `MAX_AUTO_SEND_SPLIT_DELAY` if that is 0).
+        """
+        if not self._auto_send_split_delay:
+            return self._send_split_delay / 1000.0
+        maximum = (self._send_split_delay or MAX_AUTO_SEND_SPLIT_DELAY) / 1000.0
+        record = self.manager.light_records.get(light)
+        if record is None or record.latency is None:
+            return maximum
+        return min(record.latency.estimate(), maximum)
+
     async def _adapt_light(
         self,
         light: str,
@@ -1309,10 +1748,17 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         adapt_color: bool | None = None,
         prefer_rgb_color: bool | None = None,
         force: bool = False,
-    ) -> None:
-        if (lock := self.manager.turn_off_locks.get(light)) and lock.locked():
+        filter_by_state: bool | None = None,
+    ) -> str:
+        """Adapt a light, return the outcome.
+
+        That is "adapted", "skipped" (no adaptation calls were made), or
+        "superseded" (cancelled by another adaptation of the light).
+        """
+        record = self.manager.light_records.get(light)
+        if record and (lock := record.turn_off_lock) and lock.locked():
             _LOGGER.debug("%s: '%s' is locked", self._name, light)
-            return
+            return "skipped"
 
         data = await self.prepare_adaptation_data(
             light,
@@ -1322,11 +1768,61 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             prefer_rgb_color,
             force,
             context,
+            filter_by_state,
         )
         if data is None:
-            return  # nothing to adapt
+            return "skipped"  # nothing to adapt
+
+        if not await self.execute_cancellable_adaptation_calls(data):
+            return "superseded"
+        return "adapted"
+
+    def _adaptation_outcome(
+        self,
+        light: str,
+        outcome: str,
+        duration: float = 0.0,
+    ) -> dict[str, Any]:
+        """Describe what happened to a light, used in service call responses."""
+        return {
+            ATTR_ENTITY_ID: light,
+            SWITCH_DOMAIN: self.entity_id,
+            "outcome": outcome,
+            "duration": round(duration, 3),
+        }
 
-        await self.execute_cancellable_adaptation_calls(data)
+    async def _timed_adapt_light(
+        self,
+        light: str,
+        context: Context,
+        transition: int | None = None,
+        adapt_brightness: bool | None = None,
+        adapt_color: bool | None = None,
+        prefer_rgb_color: bool | None = None,
+        force: bool = False,
+        filter_by_state: bool | None = None,
+        delay: float = 0.0,
+    ) -> dict[str, Any]:
+        """Adapt a light and return its outcome including the time it took.
+
+        The adaptation starts after `delay` seconds, unless the switch is off by then.
+        """
+        if delay:
+            await asyncio.sleep(delay)
+            if not self.is_on:
+                return self._adaptation_outcome(light, "cancelled")
+        start = time.monotonic()
+        outcome = await self._adapt_light(
+            light,
+            context,
+            transition,
+            adapt_brightness,
+            adapt_color,
+            prefer_rgb_color,
+            force,
+            filter_by_state,
+        )
+        return self._adaptation_outcome(light, outcome, time.monotonic() - start)
 
     async def _execute_adaptation_calls(self, data: AdaptationData) -> None:
         """Executes a sequence of adaptation service calls for the given service datas."""
@@ -1368,10 +1864,22 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
                 data.context.id,
             )
             light = service_data[ATTR_ENTITY_ID]
-            self.manager.last_service_data[light] = {
-                **self.manager.last_service_data.get(light, {}),
-                **service_data,
-            }
+            last_service_data = self.manager.last_service_data.get(light, {})
+            merged = {**last_service_data, **service_data}
+            if merged != last_service_data:
+                # Only persist when it changed, which restarts the save delay
+                self.manager.last_service_data[light] = merged
+                self.manager.async_schedule_save()
+            record = self.manager.record(light)
+            record.last_adaptation_service_data = (
+                dict(service_data)
+                if is_first_call
+                else {**(record.last_adaptation_service_data or {}), **service_data}
+            )
+            # The split calls share a context, measure from the first one
+            probe = record.latency_probe
+            if probe is None or probe[0] != data.context.id:
+                record.latency_probe = (data.context.id, self.hass.loop.time())
             await self.hass.services.async_call(
                 LIGHT_DOMAIN,
                 SERVICE_TURN_ON,
@@ -1382,11 +1890,12 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
     async def execute_cancellable_adaptation_calls(
         self,
         data: AdaptationData,
-    ) -> None:
+    ) -> bool:
         """Executes a cancellable sequence of adaptation service calls for the given service datas.
 
         Wraps the sequence of service calls in a task that can be cancelled from elsewhere, e.g.,
         to cancel an ongoing adaptation when a light is turned off.
+        Returns False if the task was cancelled, e.g., by another adaptation of the light.
         """
         # Prevent overlap of multiple adaptation sequences
         self.manager.cancel_ongoing_adaptation_calls(data.entity_id)
@@ -1404,12 +1913,125 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
                 self.manager.adaptation_tasks_color[data.entity_id] = task
             await task
         except asyncio.CancelledError:
+            if (current := asyncio.current_task()) and current.cancelling():
+                raise  # The caller itself is cancelled
             _LOGGER.debug(
                 "%s: Ongoing adaptation of %s cancelled, with AdaptationData: %s",
                 self._name,
                 data.entity_id,
                 data,
             )
+            return False
+        return True
+
+    def _filter_adaptable_lights(
+        self,
+        context: Context,
+        lights: list[str],
+        force: bool,
+    ) -> list[str]:
+        """Return the lights that are on and ready to be adapted."""
+        on_lights = [light for light in lights if is_on(self.hass, light)]
+
+        if force:
+            return on_lights
+
+        filtered_lights: list[str] = []
+        records = self.manager.light_records
+        for light in on_lights:
+            record = records.get(light)
+            # Don't adapt lights that haven't finished prior transitions.
+            timer = record.transition_timer if record is not None else None
+            if timer is not None and timer.is_running():
+                _LOGGER.debug(
+                    "%s: Light '%s' is still transitioning, deferring until it ends,"
+                    " context.id='%s'",
+                    self._name,
+                    light,
+                    context.id,
+                )
+                record.deferred_adaptation = self
+            elif (
+                # This is to prevent lights immediately turning on after
+                # being turned off in 'interval' update, see #726
+                not self._detect_non_ha_changes
+                and is_our_context(context, "interval")
+                and record is not None
+                and (turn_on := record.turn_on_event)
+                and (turn_off := record.turn_off_event)
+                and turn_off.time_fired > turn_on.time_fired
+            ):
+                _LOGGER.debug(
+                    "%s: Light '%s' was turned just turned off, context.id='%s'",
+                    self._name,
+                    light,
+                    context.id,
+                )
+            else:
+                filtered_lights.append(light)
+        return filtered_lights
+
+    def _start_rollout(
+        self,
+        lights: list[str],
+        context: Context,
+        transition: float | None,
+    ) -> None:
+        """Spread forced adaptations over the rollout window, in the background.
+
+        A rollout that is still running is superseded (cancelled) by the new one.
+        """
+        self._cancel_rollout()
+        self._rollout_task = self.hass.async_create_task(
+            self._rollout(lights, context, transition),
+        )
+
+    def _cancel_rollout(self) -> None:
+        if self._rollout_task is not None and not self._rollout_task.done():
+            _LOGGER.debug("%s: Cancelling the running rollout", self._name)
+            self._rollout_task.cancel()
+        self._rollout_task = None
+
+    async def _rollout(
+        self,
+        lights: list[str],
+        context: Context,
+        transition: float | None,
+    ) -> None:
+        lights = rollout_order(self.hass, lights, self._rollout_order)
+        schedule = rollout_schedule(
+            len(lights),
+            self._rollout_window,
+            self._transition if transition is None else transition,
+        )
+        _LOGGER.debug(
+            "%s: Rolling out %s lights over %s seconds in '%s' order, context.id=%s",
+            self._name,
+            len(lights),
+            self._rollout_window,
+            self._rollout_order.value,
+            context.id,
+        )
+
+        async def adapt(light: str, delay: float, transition: float) -> dict[str, Any]:
+            await asyncio.sleep(delay)
+            return await self._timed_adapt_light(
+                light,
+                context,
+                transition,
+                force=True,
+            )
+
+        await asyncio.gather(
+            *(
+                adapt(light, delay, light_transition)
+                for light, (delay, light_transition) in zip(
+                    lights,
+                    schedule,
+                    strict=True,
+                )
+            ),
+        )
 
     async def _update_attrs_and_maybe_adapt_lights(
         self,
@@ -1418,7 +2040,22 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         lights: list[str] | None = None,
         transition: int | None = None,
         force: bool = False,
-    ) -> None:
+        max_concurrency: int | None = None,
+        rollout: bool = False,
+        filter_by_state: bool | None = None,
+        deadline: float | None = None,
+        delays: Mapping[str, float] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Update the switch attributes and adapt the lights that need it.
+
+        With `rollout`, the adaptations are spread over the `rollout_window` in the
+        background, and their outcomes are not returned.
+        With `deadline` (in event loop time), adaptations that have not finished by
+        then are cancelled and reported as "carried_over".
+        With `delays`, the adaptation of each light starts after its delay (seconds),
+        and its deadline is shifted by as much.
+        Returns the outcome for each light that was considered for adaptation.
+        """
         assert context is not None
         _LOGGER.debug(
             "%s: '_update_attrs_and_maybe_adapt_lights' called with context.id='%s'"
@@ -1430,59 +2067,22 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             force,
         )
         assert self.is_on
-        self._settings.update(
-            self._sun_light_settings.get_settings(
-                self.sleep_mode_switch.is_on,
-                transition,
-            ),
-        )
+        self._update_settings(transition)
         self.async_write_ha_state()
 
         if not force and self._only_once:
-            return
+            return []
 
         if lights is None:
             lights = self.lights
 
-        on_lights = [light for light in lights if is_on(self.hass, light)]
-
-        if force:
-            filtered_lights = on_lights
-        else:
-            filtered_lights: list[str] = []
-            for light in on_lights:
-                # Don't adapt lights that haven't finished prior transitions.
-                timer = self.manager.transition_timers.get(light)
-                if timer is not None and timer.is_running():
-                    _LOGGER.debug(
-                        "%s: Light '%s' is still transitioning, context.id='%s'",
-                        self._name,
-                        light,
-                        context.id,
-                    )
-                elif (
-                    # This is to prevent lights immediately turning on after
-                    # being turned off in 'interval' update, see #726
-                    not self._detect_non_ha_changes
-                    and is_our_context(context, "interval")
-                    and (turn_on := self.manager.turn_on_event.get(light))
-                    and (turn_off := self.manager.turn_off_event.get(light))
-                    and turn_off.time_fired > turn_on.time_fired
-                ):
-                    _LOGGER.debug(
-                        "%s: Light '%s' was turned just turned off, context.id='%s'",
-                        self._name,
-                        light,
-                        context.id,
-                    )
-                else:
-                    filtered_lights.append(light)
-
+        filtered_lights = self._filter_adaptable_lights(context, lights, force)
         _LOGGER.debug("%s: filtered_lights: '%s'", self._name, filtered_lights)
         if not filtered_lights:
-            return
+            return []
 
-        tasks: list[asyncio.Task[None]] = []
+        outcomes: list[dict[str, Any]] = []
+        lights_to_adapt: list[str] = []
         for light in filtered_lights:
             await self.manager.update_manually_controlled_from_untracked_change(
                 self,
@@ -1500,23 +2100,97 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
                     light,
                     context.id,
                 )
+                outcomes.append(self._adaptation_outcome(light, "manually_controlled"))
                 continue
 
-            _LOGGER.debug(
-                "%s: Calling _adapt_light from _update_attrs_and_maybe_adapt_lights:"
-                " '%s' with transition %s and context.id=%s",
-                self._name,
+            if is_our_context(context, "interval") and self.manager.is_backing_off(
+                self,
+                light,
+            ):
+                outcomes.append(self._adaptation_outcome(light, "backing_off"))
+                continue
+
+            _LOGGER.debug(
+                "%s: Calling _adapt_light from _update_attrs_and_maybe_adapt_lights:"
+                " '%s' with transition %s and context.id=%s",
+                self._name,
+                light,
+                transition,
+                context.id,
+            )
+            lights_to_adapt.append(light)
+
+        if (
+            rollout
+            and deadline is None
+            and self._rollout_window > 0
+            and len(lights_to_adapt) > 1
+        ):
+            self._start_rollout(lights_to_adapt, context, transition)
+            return outcomes
+
+        coros = [
+            self._timed_adapt_light(
                 light,
+                context,
                 transition,
-                context.id,
+                force=force,
+                filter_by_state=filter_by_state,
+                delay=delays.get(light, 0.0) if delays else 0.0,
+            )
+            for light in lights_to_adapt
+        ]
+
+        if max_concurrency is not None:
+            outcomes.extend(
+                await gather_with_limited_concurrency(max_concurrency, *coros),
             )
-            coro = self._adapt_light(light, context, transition, force=force)
-            task = self.hass.async_create_task(
-                coro,
+        elif deadline is not None:
+            outcomes.extend(
+                await self._gather_until_deadline(
+                    deadline,
+                    lights_to_adapt,
+                    coros,
+                    delays,
+                ),
             )
-            tasks.append(task)
-        if tasks:
-            await asyncio.gather(*tasks)
+        elif coros:
+            tasks = [self.hass.async_create_task(coro) for coro in coros]
+            outcomes.extend(await asyncio.gather(*tasks))
+        return outcomes
+
+    async def _gather_until_deadline(
+        self,
+        deadline: float,
+        lights: list[str],
+        coros: list[Coroutine[Any, Any, dict[str, Any]]],
+        delays: Mapping[str, float] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run the adaptations and cancel the ones that are unfinished at the deadline.
+
+        With `delays`, the deadline of each light is shifted by its delay, such that
+        a light that starts late gets as much time to adapt as the first one.
+        """
+        if not coros:
+            return []
+        now = self.hass.loop.time()
+
+        async def until_deadline(
+            light: str,
+            coro: Coroutine[Any, Any, dict[str, Any]],
+        ) -> dict[str, Any]:
+            delay = delays.get(light, 0.0) if delays else 0.0
+            timeout = max(deadline + delay - now, 0)
+            try:
+                return await asyncio.wait_for(coro, timeout)
+            except TimeoutError:
+                return self._adaptation_outcome(light, "carried_over", timeout)
+
+        tasks = [
+            self.hass.async_create_task(until_deadline(light, coro))
+            for light, coro in zip(lights, coros, strict=True)
+        ]
+        return list(await asyncio.gather(*tasks))
 
     async def _respond_to_off_to_on_event(
         self,
@@ -1554,7 +2228,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             # adaptive_lighting.apply can turn on light, so check this is not our context
             and not is_our_context(event.context)
         ):
-            service_data = self.manager.turn_on_event[entity_id].data[ATTR_SERVICE_DATA]
+            service_data = self.manager.turn_on_event[entity_id].service_data
             if self.manager._mark_manual_control_if_non_bare_turn_on(
                 entity_id,
                 service_data,
@@ -1596,6 +2270,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             context=self.create_context("sleep", parent=event.context),
             transition=self._sleep_transition,
             force=True,
+            rollout=True,
         )
 
     def fire_manual_control_event(
@@ -1642,6 +2317,8 @@ class SimpleSwitch(SwitchEntity, RestoreEntity):
         self._unique_id = f"{self._config_name}_{slugify(self._which)}"
         self._name = f"Adaptive Lighting {which}: {self._config_name}"
         self._initial_state = initial_state
+        # Called when the switch is turned on or off
+        self.on_toggle: Callable[[], None] | None = None
 
     @property
     def name(self) -> str:
@@ -1689,11 +2366,15 @@ class SimpleSwitch(SwitchEntity, RestoreEntity):
         """Turn on adaptive lighting sleep mode."""
         _LOGGER.debug("%s: Turning on", self._name)
         self._state = True
+        if self.on_toggle is not None:
+            self.on_toggle()
 
     async def async_turn_off(self, **kwargs: Any) -> None:  # noqa: ARG002
         """Turn off adaptive lighting sleep mode."""
         _LOGGER.debug("%s: Turning off", self._name)
         self._state = False
+        if self.on_toggle is not None:
+            self.on_toggle()
 
 
 type AdaptiveSwitches = list[AdaptiveSwitch]
@@ -1709,40 +2390,97 @@ class AdaptiveLightingManager:
         self.hass = hass
         self.lights: set[str] = set()
 
-        # Tracks 'light.turn_off' service calls
-        self.turn_off_event: dict[str, Event] = {}
-        # Tracks 'light.turn_on' service calls
-        self.turn_on_event: dict[str, Event] = {}
-        # Tracks 'light.toggle' service calls
-        self.toggle_event: dict[str, Event] = {}
-        # Tracks 'on' → 'off' state changes
-        self.on_to_off_event: dict[str, Event[EventStateChangedData]] = {}
-        # Tracks 'off' → 'on' state changes
-        self.off_to_on_event: dict[str, Event[EventStateChangedData]] = {}
-        # Keep 'asyncio.sleep' tasks that can be cancelled by 'light.turn_on' events
-        self.sleep_tasks: dict[str, asyncio.Task[None]] = {}
-        # Locks that prevent light adjusting when waiting for a light to 'turn_off'
-        self.turn_off_locks: dict[str, asyncio.Lock] = {}
-        # Tracks which lights are manually controlled
-        self.manual_control: dict[str, LightControlAttributes] = {}
-        # Track 'state_changed' events of self.lights resulting from this integration
-        self.our_last_state_on_change: dict[str, list[State]] = {}
-        # Track last 'service_data' to 'light.turn_on' resulting from this integration
-        self.last_service_data: dict[str, dict[str, Any]] = {}
-        # Track ongoing split adaptations to be able to cancel them
-        self.adaptation_tasks_brightness: dict[str, asyncio.Task[None]] = {}
-        self.adaptation_tasks_color: dict[str, asyncio.Task[None]] = {}
-
-        # Track auto reset of manual_control
-        self.auto_reset_manual_control_timers: dict[str, _AsyncSingleShotTimer] = {}
-        self.auto_reset_manual_control_times: dict[str, float] = {}
-
-        # Track light transitions
-        self.transition_timers: dict[str, _AsyncSingleShotTimer] = {}
+        # Everything tracked per light, see `LightRecord`
+        self.light_records: dict[str, LightRecord] = {}
+        self._next_purge = hass.loop.time() + LIGHT_RECORD_PURGE_INTERVAL
+
+        # Dictionary views of the fields of the light records, keyed by light
+        self.turn_off_event: LightRecordFieldView[EventRecord] = self._view(
+            "turn_off_event",
+            EventRecord.from_event,
+        )
+        self.turn_on_event: LightRecordFieldView[EventRecord] = self._view(
+            "turn_on_event",
+            EventRecord.from_event,
+        )
+        self.toggle_event: LightRecordFieldView[EventRecord] = self._view(
+            "toggle_event",
+            EventRecord.from_event,
+        )
+        self.on_to_off_event: LightRecordFieldView[EventRecord] = self._view(
+            "on_to_off_event",
+            EventRecord.from_event,
+        )
+        self.off_to_on_event: LightRecordFieldView[EventRecord] = self._view(
+            "off_to_on_event",
+            EventRecord.from_event,
+        )
+        self.turn_off_waiters: LightRecordFieldView[asyncio.Future[bool]] = self._view(
+            "turn_off_waiter",
+        )
+        self.turn_off_locks: LightRecordFieldView[asyncio.Lock] = self._view(
+            "turn_off_lock",
+        )
+        self.manual_control: LightRecordFieldView[LightControlAttributes] = self._view(
+            "manual_control",
+        )
+        self.our_last_state_on_change: LightRecordFieldView[deque[State]] = self._view(
+            "our_last_state_on_change",
+            _state_history,
+        )
+        self.last_service_data: LightRecordFieldView[dict[str, Any]] = self._view(
+            "last_service_data",
+        )
+        self.adaptation_tasks_brightness: LightRecordFieldView[asyncio.Task[None]] = (
+            self._view("adaptation_task_brightness")
+        )
+        self.adaptation_tasks_color: LightRecordFieldView[asyncio.Task[None]] = (
+            self._view("adaptation_task_color")
+        )
+        self.auto_reset_manual_control_timers: LightRecordFieldView[
+            _AsyncSingleShotTimer
+        ] = self._view("auto_reset_timer")
+        self.auto_reset_manual_control_times: LightRecordFieldView[float] = self._view(
+            "auto_reset_time",
+        )
+        self.transition_timers: LightRecordFieldView[_AsyncSingleShotTimer] = (
+            self._view("transition_timer")
+        )
+        # Switches that skipped a light because it was transitioning, and adapt it
+        # once the transition timer expires
+        self.deferred_adaptations: LightRecordFieldView[AdaptiveSwitch] = self._view(
+            "deferred_adaptation",
+        )
+
+        # The target of each light, shared by all adaptation paths
+        self.desired_states = DesiredStateStore()
 
         # Track _execute_cancellable_adaptation_calls tasks
         self.adaptation_tasks: set[asyncio.Task[None]] = set()
 
+        # Defers the first adaptation after a restart until the lights settled
+        self.startup_warmup = _StartupWarmup(hass)
+        self.interval_clock = _SharedIntervalClock(hass)
+
+        # The switches, and light → (its switches, the owner of each attribute),
+        # rebuilt lazily after `invalidate_ownership`
+        self.switches: set[AdaptiveSwitch] = set()
+        self._ownership: (
+            dict[
+                str,
+                tuple[
+                    list[AdaptiveSwitch],
+                    dict[LightControlAttributes, AdaptiveSwitch] | None,
+                ],
+            ]
+            | None
+        ) = None
+
+        # Persists the state above (see `_state_snapshot`) across restarts
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._restore_lock = asyncio.Lock()
+        self._restored = False
+
         # Setup listeners and its callbacks to remove them later
         self.listener_removers = [
             self.hass.bus.async_listen(
@@ -1755,7 +2493,12 @@ class AdaptiveLightingManager:
             ),
         ]
 
-        self._proactively_adapting_contexts: dict[str, str] = {}
+        # context.id → (entity_id, expiry in loop time), ordered by expiry
+        self._proactively_adapting_contexts: OrderedDict[str, tuple[str, float]] = (
+            OrderedDict()
+        )
+        # entity_id → context ids, the index to clear the contexts of a light
+        self._proactively_adapting_entities: dict[str, set[str]] = {}
         self._context_cnt: int = 0
 
         try:
@@ -1776,6 +2519,15 @@ class AdaptiveLightingManager:
                     self._service_interceptor_turn_on_handler,
                 ),
             )
+
+            self.listener_removers.append(
+                setup_service_call_interceptor(
+                    hass,
+                    LIGHT_DOMAIN,
+                    SERVICE_TURN_OFF,
+                    self._service_interceptor_turn_off_handler,
+                ),
+            )
         except RuntimeError:
             _LOGGER.warning(
                 "Failed to set up service call interceptors, "
@@ -1783,42 +2535,313 @@ class AdaptiveLightingManager:
                 exc_info=True,
             )
 
+    def _view(
+        self,
+        field: str,
+        convert: Callable[[Any], Any] | None = None,
+    ) -> LightRecordFieldView[Any]:
+        return LightRecordFieldView(self.light_records, field, convert)
+
+    @callback
+    def _maybe_purge_light_records(self) -> None:
+        """Drop the records of lights that are gone from HA for `LIGHT_RECORD_TTL`.
+
+        Runs at most every `LIGHT_RECORD_PURGE_INTERVAL` seconds, triggered by
+        'state_changed' events such that it doesn't need a timer of its own.
+        """
+        now = self.hass.loop.time()
+        if now < self._next_purge:
+            return
+        self._next_purge = now + LIGHT_RECORD_PURGE_INTERVAL
+        for light, record in list(self.light_records.items()):
+            if light in self.lights or self.hass.states.get(light) is not None:
+                record.missing_since = None
+            elif record.missing_since is None:
+                record.missing_since = now
+            elif now - record.missing_since > LIGHT_RECORD_TTL:
+                _LOGGER.debug("Dropping the record of '%s', which is gone", light)
+                for timer in (record.transition_timer, record.auto_reset_timer):
+                    if timer is not None:
+                        timer.cancel()
+                self.cancel_ongoing_adaptation_calls(light)
+                self.desired_states.pop(light)
+                del self.light_records[light]
+
+    def record(self, light: str) -> LightRecord:
+        """Return the record of a light, creating it if needed."""
+        if (record := self.light_records.get(light)) is None:
+            record = self.light_records[light] = LightRecord()
+        return record
+
+    def capabilities(self, light: str) -> LightCapabilities:
+        """Return the capabilities of a light, cached until its attributes change."""
+        record = self.record(light)
+        if (capabilities := record.capabilities) is None:
+            state = self.hass.states.get(light)
+            assert state is not None
+            capabilities = record.capabilities = light_capabilities(state.attributes)
+        return capabilities
+
+    def redundancy_tolerance(self, light: str) -> RedundancyTolerance:
+        """Return the tolerance for redundant commands learned for a light."""
+        record = self.light_records.get(light)
+        if record is None or record.redundancy_tolerance is None:
+            return DEFAULT_REDUNDANCY_TOLERANCE
+        return record.redundancy_tolerance
+
+    def _maybe_learn_redundancy_tolerance(
+        self,
+        record: LightRecord,
+        new_state: State | None,
+        *,
+        settled: bool = False,
+    ) -> None:
+        """Learn how a light rounds the attributes it reports after our commands.
+
+        Only settled states are learned from, so for a command with a transition
+        the state once the transition ended (`settled`), not the ones in between.
+        """
+        service_data = record.last_adaptation_service_data
+        if (
+            new_state is None
+            or new_state.state != STATE_ON
+            or not is_our_context(new_state.context)
+            or service_data is None
+            or (service_data.get(ATTR_TRANSITION) and not settled)
+        ):
+            return
+        tolerance = record.redundancy_tolerance or DEFAULT_REDUNDANCY_TOLERANCE
+        record.redundancy_tolerance = tolerance.learn(
+            service_data,
+            new_state.attributes,
+        )
+
+    def is_backing_off(self, switch: AdaptiveSwitch, light: str) -> bool:
+        """Return whether to skip the interval adaptation of a non-converging light.
+
+        Called once per interval update of the light, it counts the consecutive
+        updates at which the light did not reflect our last command. From
+        `NON_CONVERGENCE_THRESHOLD` on, the light is skipped for one interval, then
+        two, four, etc. (at most `NON_CONVERGENCE_MAX_BACKOFF` seconds), with an
+        adaptation in between to retry.
+        """
+        record = self.light_records.get(light)
+        if record is None or record.last_adaptation_service_data is None:
+            return False
+        now = self.hass.loop.time()
+        if record.backoff_until is not None:
+            if now < record.backoff_until:
+                return True
+            record.backoff_until = None  # retry
+            return False
+        state = self.hass.states.get(light)
+        if state is None or has_converged(
+            record.last_adaptation_service_data,
+            state,
+            self.get_adaption_control_attributes(switch, light),
+            self.redundancy_tolerance(light),
+        ):
+            record.non_convergences = None
+            return False
+        non_convergences = record.non_convergences = (record.non_convergences or 0) + 1
+        if non_convergences < NON_CONVERGENCE_THRESHOLD:
+            return False
+        backoff = min(
+            switch._interval.total_seconds()
+            * 2 ** (non_convergences - NON_CONVERGENCE_THRESHOLD),
+            NON_CONVERGENCE_MAX_BACKOFF,
+        )
+        record.backoff_until = now + backoff
+        _LOGGER.debug(
+            "%s: '%s' did not reflect the last %s commands (%s), skipping its"
+            " adaptations for %s seconds",
+            switch._name,
+            light,
+            non_convergences,
+            record.last_adaptation_service_data,
+            backoff,
+        )
+        return True
+
+    def _maybe_record_latency(
+        self,
+        record: LightRecord,
+        new_state: State | None,
+    ) -> None:
+        """Record how long a light took to report the first state of our command."""
+        probe = record.latency_probe
+        if probe is None or new_state is None or new_state.context.id != probe[0]:
+            return
+        record.latency_probe = None
+        if record.latency is None:
+            record.latency = LatencyEstimator()
+        record.latency.add(self.hass.loop.time() - probe[1])
+
+    def _maybe_forget_preload(
+        self,
+        light: str,
+        record: LightRecord,
+        new_state: State | None,
+    ) -> None:
+        """Forget the preloaded state of a light once it is turned on.
+
+        A bare turn on of a light that is preloaded with its current desired state
+        needs no adaptation, so its 'off' → 'on' event is treated as already adapted.
+        """
+        if new_state is None or new_state.state != STATE_ON:
+            return
+        if record.preloaded is not None:
+            turn_on = record.turn_on_event
+            params = (
+                turn_on.service_data or {}
+                if turn_on is not None and turn_on.context.id == new_state.context.id
+                else {}
+            )
+            if any(
+                switch.is_on and switch.is_preloaded(light, params)
+                for switch in self.switches_of(light)
+            ):
+                self.clear_proactively_adapting(light)
+                self.set_proactively_adapting(new_state.context.id, light)
+        record.preloaded = None
+
+    def _maybe_reset_backoff(
+        self,
+        light: str,
+        record: LightRecord,
+        new_state: State | None,
+    ) -> None:
+        """Forget the non-convergence of a light that reported a change by itself."""
+        if record.non_convergences is None or (
+            new_state is not None and is_our_context(new_state.context)
+        ):
+            return
+        _LOGGER.debug("'%s' reported a state change, resetting its backoff", light)
+        record.non_convergences = None
+        record.backoff_until = None
+
+    def _maybe_invalidate_capabilities(
+        self,
+        light: str,
+        record: LightRecord,
+        old_state: State | None,
+        new_state: State | None,
+    ) -> None:
+        """Drop the cached capabilities (and desired state) if they might change.
+
+        The learned redundancy tolerance is reset too, a different light (or a light
+        with different capabilities) may round differently.
+        """
+        if record.capabilities is None:
+            return
+        if (
+            old_state is None
+            or new_state is None
+            or any(
+                old_state.attributes.get(attr) != new_state.attributes.get(attr)
+                for attr in CAPABILITY_ATTRS
+            )
+        ):
+            record.capabilities = None
+            record.redundancy_tolerance = None
+            self.desired_states.pop(light)
+
     def disable(self) -> None:
         """Disable the listener by removing all subscribed handlers."""
         for remove in self.listener_removers:
             remove()
+        self.startup_warmup.cancel()
+        self.interval_clock.cancel()
+
+    async def async_restore_state(self) -> None:
+        """Restore the state that was persisted before the last restart."""
+        async with self._restore_lock:
+            if self._restored:
+                return
+            self._restored = True
+            snapshot = await self._store.async_load()
+        if not snapshot:
+            return
+        _LOGGER.debug("Restoring AdaptiveLightingManager state: %s", snapshot)
+        for light, attributes in snapshot.get("last_service_data", {}).items():
+            # JSON turned the tuples (e.g., rgb_color) into lists
+            self.last_service_data[light] = {
+                key: tuple(value) if isinstance(value, list) else value
+                for key, value in attributes.items()
+            }
+        now = time.time()
+        deadlines = snapshot.get("auto_reset_deadlines", {})
+        for light, attributes in snapshot.get("manual_control", {}).items():
+            self.manual_control[light] = LightControlAttributes(attributes)
+            if (deadline := deadlines.get(light)) is not None:
+                # Resume the auto reset with the time that was remaining
+                self._start_auto_reset_timer(light, max(deadline - now, 0))
+
+    @callback
+    def _state_snapshot(self) -> dict[str, Any]:
+        """Return a JSON serializable snapshot of the state to persist."""
+        return {
+            "manual_control": {
+                light: int(attributes)
+                for light, attributes in self.manual_control.items()
+            },
+            "auto_reset_deadlines": {
+                light: timer.start_time.timestamp() + timer.delay
+                for light, timer in self.auto_reset_manual_control_timers.items()
+                if timer.is_running() and timer.start_time is not None
+            },
+            "last_service_data": dict(self.last_service_data),
+        }
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Persist the state after a delay, bundling frequent changes."""
+        self._store.async_delay_save(self._state_snapshot, STORAGE_SAVE_DELAY)
 
     def set_proactively_adapting(self, context_id: str, entity_id: str) -> None:
         """Declare the adaptation with context_id as proactively adapting,
         and associate it to an entity_id.
-        """  # noqa: D205
-        self._proactively_adapting_contexts[context_id] = entity_id
-
-    def is_proactively_adapting(self, context_id: str) -> bool:
-        """Determine whether an adaptation with the given context_id is proactive."""
-        is_proactively_adapting_context = (
-            context_id in self._proactively_adapting_contexts
-        )
 
-        _LOGGER.debug(
-            "is_proactively_adapting_context='%s', context_id='%s'",
-            is_proactively_adapting_context,
+        The declaration expires after `PROACTIVE_CONTEXT_LIFETIME` seconds.
+        """  # noqa: D205
+        now = self.hass.loop.time()
+        self._expire_proactively_adapting(now)
+        contexts = self._proactively_adapting_contexts
+        if context_id in contexts:
+            self._discard_proactively_adapting(context_id)
+        contexts[context_id] = (entity_id, now + PROACTIVE_CONTEXT_LIFETIME)
+        self._proactively_adapting_entities.setdefault(entity_id, set()).add(
             context_id,
         )
 
-        return is_proactively_adapting_context
+    def is_proactively_adapting(self, context_id: str) -> bool:
+        """Determine whether an adaptation with the given context_id is proactive."""
+        entry = self._proactively_adapting_contexts.get(context_id)
+        return entry is not None and entry[1] > self.hass.loop.time()
 
     def clear_proactively_adapting(self, entity_id: str) -> None:
         """Clear all context IDs associated with the given entity ID.
 
         Call this method to clear past context IDs and avoid a memory leak.
         """
-        # First get the keys to avoid modifying the dict while iterating it
-        keys = [
-            k for k, v in self._proactively_adapting_contexts.items() if v == entity_id
-        ]
-        for key in keys:
-            self._proactively_adapting_contexts.pop(key)
+        for context_id in self._proactively_adapting_entities.pop(entity_id, ()):
+            self._proactively_adapting_contexts.pop(context_id, None)
+
+    def _discard_proactively_adapting(self, context_id: str) -> None:
+        entity_id, _ = self._proactively_adapting_contexts.pop(context_id)
+        if context_ids := self._proactively_adapting_entities.get(entity_id):
+            context_ids.discard(context_id)
+            if not context_ids:
+                del self._proactively_adapting_entities[entity_id]
+
+    def _expire_proactively_adapting(self, now: float) -> None:
+        """Remove the expired contexts, which are at the front of the ordered dict."""
+        contexts = self._proactively_adapting_contexts
+        while contexts:
+            context_id, (_, expiry) = next(iter(contexts.items()))
+            if expiry > now:
+                break
+            self._discard_proactively_adapting(context_id)
 
     def create_context(
         self,
@@ -1866,6 +2889,7 @@ class AdaptiveLightingManager:
                     # and of TOGGLE calls when toggling off.
                     or self.hass.states.is_state(entity_id, STATE_ON)
                     or self.manual_control.get(entity_id, False)
+                    or switch.is_preloaded(entity_id, data[CONF_PARAMS])
                     or (
                         switch._take_over_control
                         and switch._adapt_only_on_bare_turn_on
@@ -2075,6 +3099,20 @@ class AdaptiveLightingManager:
                 context=context,
             )
 
+    def _service_interceptor_turn_off_handler(
+        self,
+        call: ServiceCall,  # noqa: ARG002
+        service_data: ServiceData,
+    ) -> None:
+        """Cancel the pending adaptations of lights before they are turned off.
+
+        Otherwise, an adaptation that is still in progress (e.g., the second call of
+        `separate_turn_on_commands`) could turn the light back on.
+        """
+        for entity_id in self._get_entity_list(service_data):
+            if entity_id in self.lights:
+                self.cancel_ongoing_adaptation_calls(entity_id)
+
     async def _service_interceptor_turn_on_single_light_handler(
         self,
         entity_ids: list[str],
@@ -2185,11 +3223,20 @@ class AdaptiveLightingManager:
         )
 
         async def reset() -> None:
-            # Called when the timer expires, doesn't need to do anything
+            # Called when the timer expires, learn from the settled state and adapt
+            # the light if that was skipped
             _LOGGER.debug(
                 "Transition finished for light %s",
                 light,
             )
+            if (record := self.light_records.get(light)) is not None:
+                self._maybe_learn_redundancy_tolerance(
+                    record,
+                    self.hass.states.get(light),
+                    settled=True,
+                )
+            if (switch := self.deferred_adaptations.pop(light, None)) is not None:
+                self.hass.async_create_task(switch.async_adapt_deferred_light(light))
 
         self._handle_timer(light, self.transition_timers, last_transition, reset)
 
@@ -2234,7 +3281,14 @@ class AdaptiveLightingManager:
             self.get_manual_control_attributes(light),
         )
         self.manual_control[light] = attributes
-        delay = self.auto_reset_manual_control_times.get(light)
+        self._start_auto_reset_timer(
+            light,
+            self.auto_reset_manual_control_times.get(light),
+        )
+        self.async_schedule_save()
+
+    def _start_auto_reset_timer(self, light: str, delay: float | None) -> None:
+        """(Re)start the timer that resets the manual control after `delay` seconds."""
 
         async def reset() -> None:
             _LOGGER.debug(
@@ -2304,29 +3358,96 @@ class AdaptiveLightingManager:
             # Extend to pausing all only if there is at least one manually controlled attribute
             denied_adaptation_attributes = LightControlAttributes.ALL
 
-        enabled_adaptation_attributes = (
-            LightControlAttributes.BRIGHTNESS
-            if switch.adapt_brightness_switch.is_on
-            else LightControlAttributes.NONE
-        ) | (
-            LightControlAttributes.COLOR
-            if switch.adapt_color_switch.is_on
-            else LightControlAttributes.NONE
-        )
-
         return (
             LightControlAttributes.ALL
             & ~denied_adaptation_attributes
-            & enabled_adaptation_attributes
+            & switch.enabled_attributes
+            & self.owned_attributes(switch, light)
         )
 
+    def add_switch(self, switch: AdaptiveSwitch) -> None:
+        """Register a switch for the ownership of its lights."""
+        self.switches.add(switch)
+        self.invalidate_ownership()
+
+    def remove_switch(self, switch: AdaptiveSwitch) -> None:
+        """Unregister a switch for the ownership of its lights."""
+        self.switches.discard(switch)
+        self.invalidate_ownership()
+
+    def invalidate_ownership(self) -> None:
+        """Rebuild the ownership index, e.g., when a switch or its lights changed."""
+        self._ownership = None
+
+    def _ownership_index(
+        self,
+    ) -> dict[
+        str,
+        tuple[
+            list[AdaptiveSwitch],
+            dict[LightControlAttributes, AdaptiveSwitch] | None,
+        ],
+    ]:
+        if self._ownership is not None:
+            return self._ownership
+        switches_of: dict[str, list[AdaptiveSwitch]] = {}
+        for switch in sorted(self.switches, key=lambda s: s.ownership_key):
+            for light in switch.lights:
+                switches_of.setdefault(light, []).append(switch)
+        self._ownership = {}
+        for light, switches in switches_of.items():
+            claimants = [s for s in switches if s.is_on]
+            owners: dict[LightControlAttributes, AdaptiveSwitch] | None = None
+            if len(claimants) > 1:
+                owners = {}
+                for attribute in (
+                    LightControlAttributes.BRIGHTNESS,
+                    LightControlAttributes.COLOR,
+                ):
+                    owner = next(
+                        (s for s in claimants if attribute in s.enabled_attributes),
+                        None,
+                    )
+                    if owner is not None:
+                        owners[attribute] = owner
+            self._ownership[light] = (switches, owners)
+        return self._ownership
+
+    def switches_of(self, light: str) -> list[AdaptiveSwitch]:
+        """Return the switches that contain `light` (without expanding groups)."""
+        if (entry := self._ownership_index().get(light)) is None:
+            return []
+        return entry[0]
+
+    def owned_attributes(
+        self,
+        switch: AdaptiveSwitch,
+        light: str,
+    ) -> LightControlAttributes:
+        """Return the attributes of a light that `switch` adapts.
+
+        Every attribute of a light that is in multiple switches is owned by a single
+        switch: of the switches that are on and adapt it, the one with the highest
+        `priority`, then the one that was turned on first.
+        """
+        entry = self._ownership_index().get(light)
+        if entry is None or entry[1] is None:
+            return LightControlAttributes.ALL
+        owned = LightControlAttributes.NONE
+        for attribute, owner in entry[1].items():
+            if owner is switch:
+                owned |= attribute
+        return owned
+
     def cancel_ongoing_adaptation_calls(
         self,
         light_id: str,
     ) -> None:
         """Cancel ongoing adaptation service calls for a specific light entity."""
-        brightness_task = self.adaptation_tasks_brightness.get(light_id)
-        color_task = self.adaptation_tasks_color.get(light_id)
+        if (record := self.light_records.get(light_id)) is None:
+            return
+        brightness_task = record.adaptation_task_brightness
+        color_task = record.adaptation_task_color
         if brightness_task is not None and not brightness_task.done():
             _LOGGER.debug(
                 "Cancelled ongoing brightness adaptation calls (%s) for '%s'",
@@ -2346,17 +3467,23 @@ class AdaptiveLightingManager:
     def reset(self, *lights: str, reset_manual_control: bool = True) -> None:
         """Reset the 'manual_control' status of the lights."""
         for light in lights:
+            record = self.record(light)
             if reset_manual_control:
                 _LOGGER.debug(
                     "Light %s: Clearing manual control attributes.",
                     light,
                 )
-                self.manual_control[light] = LightControlAttributes.NONE
-                if timer := self.auto_reset_manual_control_timers.pop(light, None):
+                record.manual_control = LightControlAttributes.NONE
+                if timer := record.auto_reset_timer:
+                    record.auto_reset_timer = None
                     timer.cancel()
-            self.our_last_state_on_change.pop(light, None)
-            self.last_service_data.pop(light, None)
+            record.our_last_state_on_change = None
+            record.last_service_data = None
+            record.last_adaptation_service_data = None
+            record.deferred_adaptation = None
             self.cancel_ongoing_adaptation_calls(light)
+        if lights:
+            self.async_schedule_save()
 
     def _get_entity_list(self, service_data: ServiceData) -> list[str]:
         if ATTR_ENTITY_ID in service_data:
@@ -2398,14 +3525,12 @@ class AdaptiveLightingManager:
             return
 
         def off(eid: str, event: Event) -> None:
-            self.turn_off_event[eid] = event
+            self.record(eid).turn_off_event = EventRecord.from_event(event)
             self.reset(eid)
 
         async def on(eid: str, event: Event) -> None:
-            task = self.sleep_tasks.get(eid)
-            if task is not None:
-                task.cancel()
-            self.turn_on_event[eid] = event
+            self._resolve_turn_off_waiter(eid, turned_off=False)
+            self.record(eid).turn_on_event = EventRecord.from_event(event)
 
             # Only check for manual control via this path if the light was already ON.
             # Turning on from OFF is handled separately in _respond_to_off_to_on_event,
@@ -2436,8 +3561,13 @@ class AdaptiveLightingManager:
                 and timer.is_running()
                 and event.time_fired > timer.start_time  # type: ignore[operator]
             ):
-                # Restart the auto reset timer
-                timer.start()
+                # Restart the auto reset timer with the configured delay, also when
+                # it was restored with only the remaining time
+                self._start_auto_reset_timer(
+                    eid,
+                    self.auto_reset_manual_control_times.get(eid, timer.delay),
+                )
+                self.async_schedule_save()
 
         if service == SERVICE_TURN_OFF:
             transition = service_data.get(ATTR_TRANSITION)
@@ -2468,7 +3598,7 @@ class AdaptiveLightingManager:
             for eid in entity_ids:
                 state = self.hass.states.get(eid)
                 assert state
-                self.toggle_event[eid] = event
+                self.record(eid).toggle_event = EventRecord.from_event(event)
                 if state.state == STATE_ON:  # is turning off
                     off(eid, event)
                 elif state.state == STATE_OFF:  # is turning on
@@ -2479,12 +3609,21 @@ class AdaptiveLightingManager:
         event: Event[EventStateChangedData],
     ) -> None:
         """Track 'state_changed' events."""
+        self._maybe_purge_light_records()
         entity_id = event.data.get(ATTR_ENTITY_ID, "")
         if entity_id not in self.lights:
             return
 
+        self.startup_warmup.state_changed()
+
+        record = self.record(entity_id)
         old_state = event.data.get("old_state")
         new_state = event.data.get("new_state")
+        self._maybe_invalidate_capabilities(entity_id, record, old_state, new_state)
+        self._maybe_learn_redundancy_tolerance(record, new_state)
+        self._maybe_reset_backoff(entity_id, record, new_state)
+        self._maybe_record_latency(record, new_state)
+        self._maybe_forget_preload(entity_id, record, new_state)
 
         new_on = (
             new_state if new_state is not None and new_state.state == STATE_ON else None
@@ -2521,9 +3660,7 @@ class AdaptiveLightingManager:
             # called with a color_temp outside of its range (and HA reports the
             # incorrect 'min_kelvin' and 'max_kelvin', which happens e.g., for
             # Philips Hue White GU10 Bluetooth lights).
-            last_state: list[State] | None = self.our_last_state_on_change.get(
-                entity_id,
-            )
+            last_state = record.our_last_state_on_change
             if is_our_context(new_on.context):
                 if (
                     last_state is not None
@@ -2536,22 +3673,23 @@ class AdaptiveLightingManager:
                         entity_id,
                         new_on.context.id,
                     )
-                    self.our_last_state_on_change[entity_id].append(new_on)
+                    last_state.append(new_on)
                 else:
                     _LOGGER.debug(
                         "AdaptiveLightingManager: New adapt '%s' found for %s",
                         new_on,
                         entity_id,
                     )
-                    self.our_last_state_on_change[entity_id] = [new_on]
+                    record.our_last_state_on_change = _state_history([new_on])
                     self.start_transition_timer(entity_id)
             elif last_state is not None:
-                self.our_last_state_on_change[entity_id].append(new_on)
+                last_state.append(new_on)
 
         if old_on and new_off:
             # Tracks 'on' → 'off' state changes
-            self.on_to_off_event[entity_id] = event
+            record.on_to_off_event = EventRecord.from_event(event)
             self.reset(entity_id)
+            self._resolve_turn_off_waiter(entity_id, turned_off=True)
             _LOGGER.debug(
                 "Detected an 'on' → 'off' event for '%s' with context.id='%s'",
                 entity_id,
@@ -2559,7 +3697,7 @@ class AdaptiveLightingManager:
             )
         elif old_off and new_on:
             # Tracks 'off' → 'on' state changes
-            self.off_to_on_event[entity_id] = event
+            record.off_to_on_event = EventRecord.from_event(event)
             _LOGGER.debug(
                 "Detected an 'off' → 'on' event for '%s' with context.id='%s'",
                 entity_id,
@@ -2577,7 +3715,7 @@ class AdaptiveLightingManager:
                 return
 
             self.reset(entity_id, reset_manual_control=False)
-            lock = self.turn_off_locks.setdefault(entity_id, asyncio.Lock())
+            lock = record.turn_off_lock = record.turn_off_lock or asyncio.Lock()
             async with lock:
                 if await self.just_turned_off(entity_id):
                     # Stop if a rapid 'off' → 'on' → 'off' happens.
@@ -2589,7 +3727,7 @@ class AdaptiveLightingManager:
 
             switches = _switches_with_lights(self.hass, [entity_id])
             for switch in switches:
-                if switch.is_on:
+                if switch.is_on and self.owned_attributes(switch, entity_id).has_any():
                     await switch._respond_to_off_to_on_event(
                         entity_id,
                         event,
@@ -2616,7 +3754,7 @@ class AdaptiveLightingManager:
             return
 
         turn_on_attributes = get_light_control_attributes(
-            turn_on_event.data[ATTR_SERVICE_DATA],
+            turn_on_event.service_data,
         )
 
         if not turn_on_attributes:
@@ -2800,8 +3938,10 @@ class AdaptiveLightingManager:
         if the brightness is still decreasing. Only if it is the case we
         adjust the lights.
         """
-        off_to_on_event = self.off_to_on_event[entity_id]
-        on_to_off_event = self.on_to_off_event.get(entity_id)
+        record = self.record(entity_id)
+        off_to_on_event = record.off_to_on_event
+        assert off_to_on_event is not None
+        on_to_off_event = record.on_to_off_event
 
         if on_to_off_event is None:
             _LOGGER.debug(
@@ -2820,7 +3960,7 @@ class AdaptiveLightingManager:
             # a legitimate turn-on if a 'light.turn_on' call for this light (or
             # for a member of this light group) fired between the two state
             # changes.
-            turn_on_event = self.turn_on_event.get(entity_id)
+            turn_on_event = record.turn_on_event
             if (
                 turn_on_event is not None
                 and on_to_off_event.time_fired
@@ -2849,14 +3989,17 @@ class AdaptiveLightingManager:
 
         id_on_to_off = on_to_off_event.context.id
 
-        turn_off_event = self.turn_off_event.get(entity_id)
+        turn_off_event = record.turn_off_event
         if turn_off_event is not None:
-            transition = turn_off_event.data[ATTR_SERVICE_DATA].get(ATTR_TRANSITION)
+            transition = turn_off_event.service_data.get(ATTR_TRANSITION)
         else:
             transition = None
 
         if self._off_to_on_state_event_is_from_turn_on(entity_id, off_to_on_event):
-            is_toggle = off_to_on_event == self.toggle_event.get(entity_id)
+            is_toggle = (
+                record.toggle_event is not None
+                and off_to_on_event.context.id == record.toggle_event.context.id
+            )
             from_service = "light.toggle" if is_toggle else "light.turn_on"
             _LOGGER.debug(
                 "just_turned_off: State change 'off' → 'on' triggered by '%s'",
@@ -2887,42 +4030,39 @@ class AdaptiveLightingManager:
             return False
 
         # Here we could just `return True` but because we want to prevent any updates
-        # from happening to this light (through async_track_time_interval or
+        # from happening to this light (through the interval loop or
         # sleep_state) for some time, we wait below until the light
-        # is 'off' or the time has passed.
+        # is 'off', 'light.turn_on' is called, or the time has passed.
+        if not is_on(self.hass, entity_id):
+            _LOGGER.debug("just_turned_off: '%s' is already off", entity_id)
+            return True
 
-        delay -= delta_time  # delta_time has passed since the 'off' → 'on' event
+        # It can happen that the actual transition time is longer than the
+        # specified time in the 'turn_off' service, so allow for some slack.
+        timeout = delay - delta_time + 2 * TURNING_OFF_DELAY
         _LOGGER.debug(
-            "just_turned_off: Waiting with adjusting '%s' for %s",
+            "just_turned_off: Waiting with adjusting '%s' for at most %s",
             entity_id,
-            delay,
+            timeout,
         )
-        total_sleep = 0
-        for _ in range(3):
-            # It can happen that the actual transition time is longer than the
-            # specified time in the 'turn_off' service.
-            coro = asyncio.sleep(delay)
-            total_sleep += delay
-            task = self.sleep_tasks[entity_id] = asyncio.ensure_future(coro)
-            try:
-                await task
-            except asyncio.CancelledError:  # 'light.turn_on' has been called
-                _LOGGER.debug(
-                    "just_turned_off: Sleep task is cancelled due to 'light.turn_on('%s')' call",
-                    entity_id,
-                )
-                return False
-
-            if not is_on(self.hass, entity_id):
-                _LOGGER.debug(
-                    "just_turned_off: '%s' is off after %s seconds, cancelling adaptation",
-                    entity_id,
-                    total_sleep,
-                )
-                return True
-            delay = TURNING_OFF_DELAY  # next time only wait this long
+        waiter = self.hass.loop.create_future()
+        record.turn_off_waiter = waiter
+        try:
+            turned_off = await asyncio.wait_for(waiter, timeout)
+        except TimeoutError:
+            turned_off = not is_on(self.hass, entity_id)
+        else:
+            _LOGGER.debug(
+                "just_turned_off: '%s' resolved by %s",
+                entity_id,
+                "an 'on' → 'off' state change" if turned_off else "'light.turn_on'",
+            )
+            return turned_off
+        finally:
+            if record.turn_off_waiter is waiter:
+                record.turn_off_waiter = None
 
-        if transition is not None:
+        if turned_off or transition is not None:
             # Always ignore when there's a 'turn_off' transition.
             # Because it seems like HA cannot detect whether a light is
             # transitioning into 'off'. Maybe needs some discussion/input?
@@ -2933,10 +4073,18 @@ class AdaptiveLightingManager:
         _LOGGER.debug(
             "just_turned_off: '%s' is still on after %s seconds, assuming it was intended to be on",
             entity_id,
-            total_sleep,
+            timeout,
         )
         return False
 
+    def _resolve_turn_off_waiter(self, entity_id: str, *, turned_off: bool) -> None:
+        """Resolve a pending `just_turned_off` decision for `entity_id`, if any."""
+        if (record := self.light_records.get(entity_id)) is None:
+            return
+        waiter, record.turn_off_waiter = record.turn_off_waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(turned_off)
+
     def _mark_manual_control_if_non_bare_turn_on(
         self,
         entity_id: str,
@@ -2962,6 +4110,261 @@ class AdaptiveLightingManager:
         return False
 
 
+class _StateHistory(deque[State]):
+    """Our first state change of an adaptation and a bounded history behind it.
+
+    The first state is never evicted because it identifies our adaptation.
+    """
+
+    def append(self, state: State) -> None:
+        """Append a state, dropping the oldest one after our first if full."""
+        if len(self) >= STATE_HISTORY_LENGTH:
+            del self[1]
+        super().append(state)
+
+
+def _state_history(states: Iterable[State]) -> deque[State]:
+    return _StateHistory(states)
+
+
+@dataclass
+class TickStatistics:
+    """Counters of the interval loop of an `AdaptiveSwitch`, see diagnostics."""
+
+    ticks: int = 0
+    overruns: int = 0
+    carried_over_lights: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+
+    def record(self, duration: float, n_carried_over: int) -> None:
+        """Record a finished tick."""
+        self.ticks += 1
+        if n_carried_over:
+            self.overruns += 1
+            self.carried_over_lights += n_carried_over
+        self.last_duration = round(duration, 3)
+        self.max_duration = max(self.max_duration, self.last_duration)
+
+
+class _StartupWarmup:
+    """Defer the first adaptation after a restart until the lights have settled.
+
+    While Home Assistant starts, integrations are still restoring and polling
+    their lights. Switches that turn on during startup register here instead of
+    adapting right away. Once started, and once none of the lights changed state
+    for `STARTUP_QUIET_PERIOD` seconds, the lights are adapted in rate-limited
+    batches. Lights whose state already matches the target are skipped.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the warm-up."""
+        self.hass = hass
+        self.switches: list[AdaptiveSwitch] = []
+        self.last_state_change: float = hass.loop.time()
+        self.task: asyncio.Task[None] | None = None
+        self._remove_started_listener: CALLBACK_TYPE | None = None
+
+    @property
+    def pending(self) -> bool:
+        """Return whether switches are waiting for their first adaptation."""
+        return bool(self.switches)
+
+    def add(self, switch: AdaptiveSwitch) -> None:
+        """Adapt the lights of the switch once Home Assistant started and settled."""
+        if switch not in self.switches:
+            self.switches.append(switch)
+        if self._remove_started_listener is None and self.task is None:
+            self._remove_started_listener = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STARTED,
+                self._started,
+            )
+
+    def discard(self, switch: AdaptiveSwitch) -> None:
+        """Stop waiting for the switch, e.g., when it is removed."""
+        if switch in self.switches:
+            self.switches.remove(switch)
+
+    def state_changed(self) -> None:
+        """Register a state change of one of the lights."""
+        self.last_state_change = self.hass.loop.time()
+
+    @callback
+    def _started(self, _: Event[NoEventData]) -> None:
+        self._remove_started_listener = None
+        self.task = self.hass.async_create_task(self._run())
+
+    async def _wait_until_settled(self) -> None:
+        loop = self.hass.loop
+        deadline = loop.time() + STARTUP_MAX_WAIT
+        while (now := loop.time()) < deadline:
+            quiet_remaining = self.last_state_change + STARTUP_QUIET_PERIOD - now
+            if quiet_remaining <= 0:
+                return
+            await asyncio.sleep(min(quiet_remaining, deadline - now))
+        _LOGGER.debug(
+            "Lights did not settle within %s seconds after startup, adapting anyway",
+            STARTUP_MAX_WAIT,
+        )
+
+    async def _run(self) -> None:
+        await self._wait_until_settled()
+        switches, self.switches = self.switches, []
+        jobs = [
+            (switch, light)
+            for switch in switches
+            if switch.is_on
+            for light in switch.lights
+        ]
+        _LOGGER.debug(
+            "Startup warm-up: adapting %s lights in batches of %s",
+            len(jobs),
+            STARTUP_BATCH_SIZE,
+        )
+        for i in range(0, len(jobs), STARTUP_BATCH_SIZE):
+            if i > 0:
+                await asyncio.sleep(STARTUP_BATCH_INTERVAL)
+            batch: dict[AdaptiveSwitch, list[str]] = {}
+            for switch, light in jobs[i : i + STARTUP_BATCH_SIZE]:
+                batch.setdefault(switch, []).append(light)
+            await asyncio.gather(
+                *(
+                    switch._update_attrs_and_maybe_adapt_lights(  # pylint: disable=protected-access
+                        context=switch.create_context("startup"),
+                        lights=lights,
+                        transition=switch.initial_transition,
+                        force=True,
+                        filter_by_state=True,
+                    )
+                    for switch, lights in batch.items()
+                    if switch.is_on
+                ),
+            )
+
+    def cancel(self) -> None:
+        """Cancel the warm-up."""
+        if self._remove_started_listener is not None:
+            self._remove_started_listener()
+            self._remove_started_listener = None
+        if self.task is not None:
+            self.task.cancel()
+        self.switches.clear()
+
+
+class _SharedIntervalClock:
+    """A single interval loop for the switches with `shared_interval_clock`.
+
+    Instead of a timer per switch, whose ticks fire at unrelated times and each send
+    the commands for all lights of the switch at once, one clock ticks every shortest
+    `interval` of its switches. A tick adapts the switches whose `interval` passed,
+    each computing its settings once, and spreads all their lights evenly over
+    `SHARED_CLOCK_SPREAD` of the tick, interleaving the integrations.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the clock."""
+        self.hass = hass
+        # The switches on the clock and the (event loop) time of their last tick
+        self.switches: dict[AdaptiveSwitch, float] = {}
+        self._remove_timer: CALLBACK_TYPE | None = None
+        self._next_tick: float | None = None  # (event loop) time of the pending tick
+
+    @property
+    def period(self) -> float:
+        """Return the time between two ticks, the shortest interval of the switches."""
+        return min(switch._interval.total_seconds() for switch in self.switches)
+
+    def add(self, switch: AdaptiveSwitch) -> None:
+        """Run the interval ticks of the switch, starting one interval from now.
+
+        A switch with a shorter interval than the others brings the pending tick
+        forward, such that the clock runs at the new (shorter) period right away.
+        """
+        now = self.hass.loop.time()
+        self.switches[switch] = now
+        if self._remove_timer is None:
+            self._schedule_tick(self.period)
+        elif self._next_tick is not None and self._next_tick > now + self.period:
+            self.cancel()
+            self._schedule_tick(self.period)
+
+    def discard(self, switch: AdaptiveSwitch) -> None:
+        """Stop running the ticks of the switch, e.g., when it is turned off."""
+        self.switches.pop(switch, None)
+        if not self.switches:
+            self.cancel()
+
+    def cancel(self) -> None:
+        """Stop the clock."""
+        if self._remove_timer is not None:
+            self._remove_timer()
+            self._remove_timer = None
+        self._next_tick = None
+
+    def slots(self, switches: list[AdaptiveSwitch], period: float) -> dict[str, float]:
+        """Return the delay of each light of `switches` within a tick of `period`."""
+        lights = rollout_order(
+            self.hass,
+            list(
+                dict.fromkeys(light for switch in switches for light in switch.lights),
+            ),
+            RolloutOrder.PLATFORM,
+        )
+        spacing = period * SHARED_CLOCK_SPREAD / max(len(lights), 1)
+        return {light: index * spacing for index, light in enumerate(lights)}
+
+    def _schedule_tick(self, delay: float) -> None:
+        self._next_tick = self.hass.loop.time() + delay
+        self._remove_timer = async_call_later(self.hass, delay, self._tick)
+
+    async def _tick(self, _: datetime.datetime) -> None:
+        self._remove_timer = self._next_tick = None  # The timer has fired
+        start = self.hass.loop.time()
+        period = self.period
+        try:
+            await self._run_due_switches(start, period)
+        finally:
+            # Like the loop of a single switch, the next tick is due one period after
+            # the start of this one, but only scheduled once this one has completed
+            if self.switches and self._remove_timer is None:
+                elapsed = self.hass.loop.time() - start
+                self._schedule_tick(max(self.period - elapsed, 0))
+
+    async def _run_due_switches(self, start: float, period: float) -> None:
+        due = [
+            switch
+            for switch, last_tick in self.switches.items()
+            # Half a period of slack rounds the interval to a multiple of the period
+            if start - last_tick >= switch._interval.total_seconds() - period / 2
+        ]
+        for switch in due:
+            self.switches[switch] = start
+        delays = self.slots(due, period)
+        _LOGGER.debug(
+            "Shared interval clock: adapting %s lights of %s switches over %s seconds",
+            len(delays),
+            len(due),
+            period * SHARED_CLOCK_SPREAD,
+        )
+        results = await asyncio.gather(
+            *(
+                switch._async_update_at_interval_action(  # pylint: disable=protected-access
+                    delays=delays,
+                    deadline=start + period,
+                )
+                for switch in due
+            ),
+            return_exceptions=True,
+        )
+        for switch, result in zip(due, results, strict=True):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "%s: Interval tick of the shared clock failed",
+                    switch.entity_id,
+                    exc_info=result,
+                )
+
+
 class _AsyncSingleShotTimer:
     def __init__(self, delay: float, callback: Callable[[], None | Any]) -> None:
         """Initialize the timer."""
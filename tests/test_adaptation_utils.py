@@ -5,6 +5,7 @@ from unittest.mock import Mock
 import pytest
 from homeassistant.components.adaptive_lighting.adaptation_utils import (
     LightControlAttributes,
+    RedundancyTolerance,
     ServiceData,
     _create_service_call_data_iterator,
     _has_relevant_service_data_attributes,
@@ -13,6 +14,7 @@ from homeassistant.components.adaptive_lighting.adaptation_utils import (
     get_light_control_attributes,
     has_brightness_attribute,
     has_color_attribute,
+    has_converged,
     has_effect_attribute,
     manual_control_event_attribute_to_flags,
     prepare_adaptation_data,
@@ -20,11 +22,14 @@ from homeassistant.components.adaptive_lighting.adaptation_utils import (
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_BRIGHTNESS_PCT,
+    ATTR_COLOR_MODE,
     ATTR_COLOR_TEMP_KELVIN,
     ATTR_EFFECT,
     ATTR_FLASH,
     ATTR_HS_COLOR,
+    ATTR_RGB_COLOR,
     ATTR_TRANSITION,
+    ColorMode,
 )
 from homeassistant.const import ATTR_ENTITY_ID, STATE_ON
 from homeassistant.core import Context, State
@@ -114,6 +119,83 @@ async def test_remove_redundant_attributes(
     assert _remove_redundant_attributes(service_data, state) == service_data_expected
 
 
+def test_has_converged():
+    """Test comparing the state of a light with the service data sent to it."""
+    service_data = {
+        ATTR_ENTITY_ID: "light.test",
+        ATTR_BRIGHTNESS: 100,
+        ATTR_COLOR_TEMP_KELVIN: 3000,
+        ATTR_RGB_COLOR: (255, 0, 0),
+    }
+    state = State(
+        "light.test",
+        STATE_ON,
+        {
+            ATTR_BRIGHTNESS: 100,
+            ATTR_COLOR_MODE: ColorMode.COLOR_TEMP,
+            ATTR_COLOR_TEMP_KELVIN: 3000,
+            ATTR_RGB_COLOR: (255, 177, 110),
+        },
+    )
+    # Only the color of the current color mode is compared
+    assert has_converged(service_data, state, LightControlAttributes.ALL)
+    stuck = State("light.test", STATE_ON, {**state.attributes, ATTR_BRIGHTNESS: 50})
+    assert not has_converged(service_data, stuck, LightControlAttributes.ALL)
+    # Manually controlled attributes are not compared
+    assert has_converged(service_data, stuck, LightControlAttributes.COLOR)
+
+
+def test_remove_redundant_attributes_with_tolerance():
+    """Test that attributes the light reports rounded are considered redundant."""
+    service_data = {
+        ATTR_ENTITY_ID: "light.test",
+        ATTR_BRIGHTNESS: 255,
+        ATTR_COLOR_TEMP_KELVIN: 2712,
+        ATTR_RGB_COLOR: (255, 167, 87),
+    }
+    rounded = State(
+        "light.test",
+        STATE_ON,
+        # 2712 K is 368.7 mired, which the light rounds to 369 mired (2710 K)
+        {
+            ATTR_BRIGHTNESS: 254,
+            ATTR_COLOR_TEMP_KELVIN: 2710,
+            ATTR_RGB_COLOR: (254, 168, 87),
+        },
+    )
+    assert _remove_redundant_attributes(service_data, rounded) == {
+        ATTR_ENTITY_ID: "light.test",
+        ATTR_BRIGHTNESS: 255,
+    }
+    tolerance = RedundancyTolerance().learn(service_data, rounded.attributes)
+    assert tolerance.brightness == 1
+    assert _remove_redundant_attributes(service_data, rounded, tolerance) == {
+        ATTR_ENTITY_ID: "light.test",
+    }
+
+    # Actual changes are neither learned nor considered redundant
+    changed = State(
+        "light.test",
+        STATE_ON,
+        {
+            ATTR_BRIGHTNESS: 200,
+            ATTR_COLOR_TEMP_KELVIN: 3000,
+            ATTR_RGB_COLOR: (255, 0, 0),
+        },
+    )
+    assert tolerance.learn(service_data, changed.attributes) is tolerance
+
+    # A rounding that is no longer seen decays away
+    obeyed = {ATTR_BRIGHTNESS: 255, ATTR_COLOR_TEMP_KELVIN: 2712}
+    tolerance = RedundancyTolerance(brightness=3, mired=3.0).learn(service_data, obeyed)
+    assert (tolerance.brightness, tolerance.mired) == (1, 1.5)
+    tolerance = tolerance.learn(service_data, obeyed)
+    assert (tolerance.brightness, tolerance.mired) == (0, 1.0)
+    assert (
+        _remove_redundant_attributes(service_data, changed, tolerance) == service_data
+    )
+
+
 @pytest.mark.parametrize(
     ("service_data", "expected_relevant"),
     [
@@ -0,0 +1,44 @@
+"""Tests for Adaptive Lighting light capabilities."""
+
+from homeassistant.components.adaptive_lighting.capabilities import (
+    LightFeature,
+    light_capabilities,
+)
+from homeassistant.components.light import (
+    ATTR_MAX_COLOR_TEMP_KELVIN,
+    ATTR_MIN_COLOR_TEMP_KELVIN,
+    ATTR_SUPPORTED_COLOR_MODES,
+    ColorMode,
+    LightEntityFeature,
+)
+from homeassistant.const import ATTR_SUPPORTED_FEATURES
+
+
+def test_light_capabilities():
+    """Test the features and that lights with equal capabilities share them."""
+    dimmer = light_capabilities({ATTR_SUPPORTED_COLOR_MODES: [ColorMode.BRIGHTNESS]})
+    assert dimmer.features == LightFeature.BRIGHTNESS
+    assert dimmer.min_color_temp_kelvin is None
+
+    color_temp_attributes = {
+        ATTR_SUPPORTED_FEATURES: LightEntityFeature.TRANSITION,
+        ATTR_SUPPORTED_COLOR_MODES: [ColorMode.COLOR_TEMP, ColorMode.HS],
+        ATTR_MIN_COLOR_TEMP_KELVIN: 2000,
+        ATTR_MAX_COLOR_TEMP_KELVIN: 6500,
+    }
+    capabilities = light_capabilities(color_temp_attributes)
+    assert capabilities.features == (
+        LightFeature.BRIGHTNESS
+        | LightFeature.COLOR_TEMP
+        | LightFeature.COLOR
+        | LightFeature.TRANSITION
+    )
+    assert capabilities.min_color_temp_kelvin == 2000
+    assert capabilities.max_color_temp_kelvin == 6500
+    assert light_capabilities(dict(color_temp_attributes)) is capabilities
+
+    narrower = light_capabilities(
+        {**color_temp_attributes, ATTR_MAX_COLOR_TEMP_KELVIN: 5000},
+    )
+    assert narrower is not capabilities
+    assert light_capabilities({}).features == LightFeature.NONE
@@ -5,8 +5,11 @@ import pytest
 from astral import LocationInfo
 from astral.location import Location
 from homeassistant.components.adaptive_lighting.color_and_brightness import (
+    LightProfile,
+    LightSettings,
     SunEvent,
     SunEvents,
+    SunLightSettings,
 )
 
 # Create a mock astral location object (its `.observer` is passed to `SunEvents`)
@@ -207,3 +210,142 @@ def test_closest_event(tzinfo_and_location):
     event_name, ts = sun_events.closest_event(sunrise)
     assert event_name == SunEvent.SUNRISE
     assert ts == location.sunrise(sunrise.date()).timestamp()
+
+
+def test_light_settings_are_lazy():
+    calls = []
+
+    def rgb_color():
+        calls.append(1)
+        return (255, 160, 80)
+
+    settings = LightSettings(
+        brightness_pct=50,
+        color_temp_kelvin=3000,
+        sun_position=0.5,
+        force_rgb_color=False,
+        rgb_color=rgb_color,
+    )
+    assert settings["brightness_pct"] == 50
+    assert settings["color_temp_kelvin"] == 3000
+    assert len(settings) == 8
+    assert "hs_color" in settings
+    assert not calls
+
+    assert settings["color_temp_mired"] == 333
+    hs_color = settings["hs_color"]
+    assert settings["rgb_color"] == (255, 160, 80)
+    assert settings["hs_color"] == hs_color
+    assert calls == [1]
+    assert set(dict(settings)) == set(settings)
+
+    with pytest.raises(KeyError):
+        settings["name"]
+
+
+@pytest.mark.parametrize("sleep_rgb_or_color_temp", ["color_temp", "rgb_color"])
+@pytest.mark.parametrize("adapt_until_sleep", [False, True])
+@pytest.mark.parametrize("brightness_mode", ["default", "linear", "tanh"])
+def test_light_profile_matches_settings_with_its_values(
+    brightness_mode,
+    adapt_until_sleep,
+    sleep_rgb_or_color_temp,
+):
+    """Test that applying a profile equals computing with the profile's values."""
+    base = SunLightSettings(
+        name="test",
+        astral_observer=location.observer,
+        adapt_until_sleep=adapt_until_sleep,
+        max_brightness=100,
+        max_color_temp=5500,
+        min_brightness=1,
+        min_color_temp=2000,
+        sleep_brightness=1,
+        sleep_rgb_or_color_temp=sleep_rgb_or_color_temp,
+        sleep_color_temp=1000,
+        sleep_rgb_color=(255, 56, 0),
+        sunrise_time=None,
+        min_sunrise_time=None,
+        max_sunrise_time=None,
+        sunset_time=None,
+        min_sunset_time=None,
+        max_sunset_time=None,
+        brightness_mode_time_dark=dt.timedelta(seconds=900),
+        brightness_mode_time_light=dt.timedelta(seconds=3600),
+        brightness_mode=brightness_mode,
+    )
+    overrides = {
+        "min_brightness": 20,
+        "max_brightness": 60,
+        "min_color_temp": 2700,
+        "max_color_temp": 4000,
+        "sleep_brightness": 5,
+        "sleep_color_temp": 1500,
+    }
+    profile = LightProfile(**overrides)
+    expected = base.replace(**overrides)
+    for hour in range(0, 24, 2):
+        now = dt.datetime(2022, 6, 1, hour, 17, tzinfo=dt.UTC)
+        for is_sleep in (False, True):
+            settings = profile.apply(
+                base.brightness_and_color(now, is_sleep),
+                base,
+                is_sleep,
+            )
+            wanted = expected.brightness_and_color(now, is_sleep)
+            assert settings["brightness_pct"] == pytest.approx(wanted["brightness_pct"])
+            assert settings["color_temp_kelvin"] == wanted["color_temp_kelvin"]
+            assert settings["rgb_color"] == wanted["rgb_color"]
+            assert settings["force_rgb_color"] == wanted["force_rgb_color"]
+
+    # Without overrides, the settings are unchanged
+    settings = base.brightness_and_color(now, False)
+    unchanged = LightProfile().apply(settings, base, False)
+    assert unchanged["brightness_pct"] == settings["brightness_pct"]
+    assert unchanged["color_temp_kelvin"] == settings["color_temp_kelvin"]
+
+
+def test_light_profile_until_sleep_at_night():
+    """Test a profile while the color goes to the sleep color after sunset."""
+    amsterdam = Location(
+        LocationInfo(
+            timezone="Europe/Amsterdam",
+            latitude=52.379189,
+            longitude=4.899431,
+        ),
+    )
+    base = SunLightSettings(
+        name="test",
+        astral_observer=amsterdam.observer,
+        adapt_until_sleep=True,
+        max_brightness=100,
+        max_color_temp=5500,
+        min_brightness=1,
+        min_color_temp=2000,
+        sleep_brightness=1,
+        sleep_rgb_or_color_temp="color_temp",
+        sleep_color_temp=1000,
+        sleep_rgb_color=(255, 56, 0),
+        sunrise_time=None,
+        min_sunrise_time=None,
+        max_sunrise_time=None,
+        sunset_time=None,
+        min_sunset_time=None,
+        max_sunset_time=None,
+        brightness_mode_time_dark=dt.timedelta(seconds=900),
+        brightness_mode_time_light=dt.timedelta(seconds=3600),
+        timezone=zoneinfo.ZoneInfo("Europe/Amsterdam"),
+    )
+    profile = LightProfile(min_color_temp=2700, max_color_temp=4000)
+    now = dt.datetime(2022, 1, 15, 22, tzinfo=dt.UTC)
+    settings = base.brightness_and_color(now, False)
+    assert settings["sun_position"] < 0
+    assert settings["color_temp_kelvin"] < 2000  # between sleep and min
+
+    applied = profile.apply(settings, base, False)
+    wanted = base.replace(min_color_temp=2700, max_color_temp=4000)
+    assert (
+        applied["color_temp_kelvin"]
+        == wanted.brightness_and_color(now, False)["color_temp_kelvin"]
+    )
+    assert applied["color_temp_kelvin"] < 2000
@@ -0,0 +1,44 @@
+"""Tests for the memoized color conversions."""
+
+import pytest
+from homeassistant.components.adaptive_lighting.color_conversion import (
+    KELVIN_MAX,
+    KELVIN_MIN,
+    KELVIN_STEP,
+    kelvin_to_rgb,
+    rgb_to_xy,
+    xy_to_hs,
+    xy_to_rgb,
+)
+from homeassistant.util.color import (
+    color_RGB_to_xy,
+    color_temperature_to_rgb,
+    color_xy_to_hs,
+    color_xy_to_RGB,
+)
+
+
+def test_kelvin_to_rgb_table():
+    for kelvin in range(KELVIN_MIN, KELVIN_MAX + 1, KELVIN_STEP):
+        assert kelvin_to_rgb(kelvin) == color_temperature_to_rgb(kelvin)
+        assert kelvin_to_rgb(float(kelvin)) == color_temperature_to_rgb(kelvin)
+
+
+@pytest.mark.parametrize("kelvin", [500, 999, 2702, 4321.5, 10001, 40000, 50000])
+def test_kelvin_to_rgb_outside_table(kelvin):
+    assert kelvin_to_rgb(kelvin) == color_temperature_to_rgb(kelvin)
+
+
+def test_rgb_xy_hs_conversions():
+    for r in range(0, 256, 15):
+        for g in range(0, 256, 15):
+            for b in range(0, 256, 15):
+                xy = rgb_to_xy(r, g, b)
+                assert xy == color_RGB_to_xy(r, g, b)
+                assert xy_to_hs(*xy) == color_xy_to_hs(*xy)
+                assert xy_to_rgb(*xy) == color_xy_to_RGB(*xy)
+    # Cached results are identical
+    hits = rgb_to_xy.cache_info().hits
+    assert rgb_to_xy(255, 180, 100) == rgb_to_xy(255, 180, 100)
+    assert rgb_to_xy(255, 180, 100) == color_RGB_to_xy(255, 180, 100)
+    assert rgb_to_xy.cache_info().hits == hits + 2
@@ -3,12 +3,16 @@
 from unittest.mock import AsyncMock
 
 from homeassistant.components.adaptive_lighting.adaptation_utils import ServiceData
+from homeassistant.components.adaptive_lighting.const import RolloutOrder
 from homeassistant.components.adaptive_lighting.hass_utils import (
+    interceptor_timings,
+    rollout_order,
     setup_service_call_interceptor,
 )
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
 from homeassistant.const import SERVICE_TURN_ON
 from homeassistant.core import ServiceCall
+from homeassistant.helpers import entity_registry
 from homeassistant.util.read_only_dict import ReadOnlyDict
 
 
@@ -78,3 +82,149 @@ async def test_service_call_interceptor_data_manipulation(hass):
     (service_call,) = service_func_mock.call_args[0]
     assert service_call.data == {"test1": "changed", "test2": "added"}
     assert isinstance(service_call.data, ReadOnlyDict)
+
+
+async def test_service_call_interceptor_chain(hass):
+    """Test that interceptors of a service share one proxy and run in order."""
+    service_func_mock = AsyncMock()
+    hass.services.async_register(LIGHT_DOMAIN, SERVICE_TURN_ON, service_func_mock)
+    calls = []
+
+    def read_only(call: ServiceCall, data: ServiceData):
+        calls.append(("read_only", data["test"]))
+
+    async def mutate(call: ServiceCall, data: ServiceData):
+        calls.append(("mutate", data["test"]))
+        data["test"] = "changed"
+
+    remove_read_only = setup_service_call_interceptor(
+        hass,
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        read_only,
+    )
+    proxy = hass.services._services[LIGHT_DOMAIN][SERVICE_TURN_ON]
+
+    async def service_call():
+        await hass.services.async_call(
+            LIGHT_DOMAIN,
+            SERVICE_TURN_ON,
+            {"test": "initial"},
+            blocking=True,
+        )
+        (service_call,) = service_func_mock.call_args[0]
+        return service_call
+
+    # Without modifications, the data is passed on as is
+    call = await service_call()
+    assert call.data == {"test": "initial"}
+
+    remove_mutate = setup_service_call_interceptor(
+        hass,
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        mutate,
+    )
+    assert hass.services._services[LIGHT_DOMAIN][SERVICE_TURN_ON] is proxy
+    calls.clear()
+    call = await service_call()
+    assert calls == [("read_only", "initial"), ("mutate", "initial")]
+    assert call.data == {"test": "changed"}
+    assert isinstance(call.data, ReadOnlyDict)
+
+    timings = interceptor_timings(hass)[f"{LIGHT_DOMAIN}.{SERVICE_TURN_ON}"]
+    assert timings[read_only.__qualname__].calls == 2
+    assert timings[mutate.__qualname__].calls == 1
+
+    # The original handler is reinstalled once the last hook is removed
+    remove_read_only()
+    assert hass.services._services[LIGHT_DOMAIN][SERVICE_TURN_ON] is proxy
+    remove_mutate()
+    assert hass.services._services[LIGHT_DOMAIN][SERVICE_TURN_ON] is not proxy
+    assert not interceptor_timings(hass)
+
+
+async def test_service_call_interceptor_chain_failing_hook(hass):
+    """Test that the modifications of a failing hook are discarded."""
+    service_func_mock = AsyncMock()
+    hass.services.async_register(LIGHT_DOMAIN, SERVICE_TURN_ON, service_func_mock)
+
+    def mutate(call: ServiceCall, data: ServiceData):
+        data["test"] = "changed"
+
+    def mutate_and_raise(call: ServiceCall, data: ServiceData):
+        data["test"] = "broken"
+        data["half"] = "applied"
+        raise ValueError
+
+    def remove_itself(call: ServiceCall, data: ServiceData):
+        remove_hook()
+        data["removed"] = True
+
+    removers = [
+        setup_service_call_interceptor(hass, LIGHT_DOMAIN, SERVICE_TURN_ON, hook)
+        for hook in (mutate, mutate_and_raise)
+    ]
+    remove_hook = setup_service_call_interceptor(
+        hass,
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        remove_itself,
+    )
+    removers.append(
+        setup_service_call_interceptor(hass, LIGHT_DOMAIN, SERVICE_TURN_ON, mutate),
+    )
+
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        {"test": "initial"},
+        blocking=True,
+    )
+    (service_call,) = service_func_mock.call_args[0]
+    # The hooks after the failing (and the removed) one still run
+    assert service_call.data == {"test": "changed", "removed": True}
+    timings = interceptor_timings(hass)[f"{LIGHT_DOMAIN}.{SERVICE_TURN_ON}"]
+    assert timings[mutate.__qualname__].calls == 2
+
+    for remove in removers:
+        remove()
+    assert not interceptor_timings(hass)
+
+
+async def test_rollout_order(hass):
+    """Test the rollout order by entity_id, platform, and area."""
+    ent_reg = entity_registry.async_get(hass)
+    for platform, area, object_id in [
+        ("hue", "kitchen", "a"),
+        ("hue", "bedroom", "b"),
+        ("zha", "kitchen", "c"),
+        ("zha", "bedroom", "d"),
+        ("hue", "kitchen", "e"),
+    ]:
+        entry = ent_reg.async_get_or_create(
+            LIGHT_DOMAIN,
+            platform,
+            object_id,
+            suggested_object_id=object_id,
+        )
+        ent_reg.async_update_entity(entry.entity_id, area_id=area)
+    lights = [f"light.{object_id}" for object_id in "abcde"]
+
+    assert rollout_order(hass, lights, RolloutOrder.ENTITY_ID) == lights
+    assert rollout_order(hass, lights, RolloutOrder.PLATFORM) == [
+        "light.a",
+        "light.c",
+        "light.b",
+        "light.d",
+        "light.e",
+    ]
+    assert rollout_order(hass, lights, RolloutOrder.AREA) == [
+        "light.a",
+        "light.c",
+        "light.e",
+        "light.b",
+        "light.d",
+    ]
+    # Lights that are not in the registry are kept
+    assert rollout_order(hass, ["light.x", *lights], RolloutOrder.AREA)[0] == "light.x"
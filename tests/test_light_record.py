@@ -0,0 +1,94 @@
+"""Tests for Adaptive Lighting light records."""
+
+from copy import deepcopy
+
+import pytest
+from homeassistant.components.adaptive_lighting.light_record import (
+    EventRecord,
+    LatencyEstimator,
+    LightRecord,
+    LightRecordFieldView,
+)
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_SERVICE_DATA
+from homeassistant.core import Context, Event
+
+
+def test_light_record_field_view():
+    """Test that a field view behaves like a dictionary of the set fields."""
+    records: dict[str, LightRecord] = {}
+    last_service_data = LightRecordFieldView(records, "last_service_data")
+    manual_control = LightRecordFieldView(records, "manual_control")
+
+    last_service_data["light.a"] = {"brightness": 10}
+    manual_control["light.b"] = 0
+    assert set(records) == {"light.a", "light.b"}
+    assert dict(last_service_data) == {"light.a": {"brightness": 10}}
+    # A falsy value is still set
+    assert "light.b" in manual_control
+    assert "light.a" not in manual_control
+    assert len(manual_control) == 1
+    assert last_service_data.get("light.b") is None
+
+    copied = deepcopy(last_service_data)
+    assert copied == {"light.a": {"brightness": 10}}
+    assert copied["light.a"] is not last_service_data["light.a"]
+
+    del last_service_data["light.a"]
+    assert records["light.a"].last_service_data is None
+    with pytest.raises(KeyError):
+        del last_service_data["light.a"]
+    assert last_service_data.pop("light.c", None) is None
+
+
+def test_light_record_slots():
+    """Test that records don't have a per-instance dictionary."""
+    record = LightRecord()
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.unknown = 1
+
+
+def test_event_record():
+    """Test that event records only keep the inspected parts of an event."""
+    context = Context()
+    event = Event(
+        "call_service",
+        {
+            ATTR_SERVICE_DATA: {
+                ATTR_ENTITY_ID: "light.a",
+                "brightness": 10,
+                "transition": 2,
+                "unrelated": "x" * 100,
+            },
+        },
+        context=context,
+    )
+    record = EventRecord.from_event(event)
+    assert record.service_data == {"brightness": 10, "transition": 2}
+    assert record.context.id == context.id
+    assert record.context is not context
+    assert record.time_fired == event.time_fired
+    assert EventRecord.from_event(record) is record
+
+    records: dict[str, LightRecord] = {}
+    view = LightRecordFieldView(records, "turn_on_event", EventRecord.from_event)
+    view["light.a"] = event
+    assert isinstance(records["light.a"].turn_on_event, EventRecord)
+
+
+def test_latency_estimator():
+    """Test that the estimate covers the slow responses of a light."""
+    latency = LatencyEstimator()
+    latency.add(0.1)
+    assert latency.estimate() == 0.1
+    for _ in range(8):
+        latency.add(0.1)
+    latency.add(1.0)
+    assert latency.ewma == pytest.approx(0.28)
+    assert latency.percentile == 1.0
+    assert latency.estimate() == 1.0
+    # The slow response drops out of the recent samples
+    for _ in range(20):
+        latency.add(0.2)
+    assert latency.percentile == 0.2
+    assert latency.estimate() == pytest.approx(0.2, abs=0.01)
@@ -22,6 +22,7 @@ from homeassistant.components.adaptive_lighting.adaptation_utils import (
     _create_service_call_data_iterator,
 )
 from homeassistant.components.adaptive_lighting.color_and_brightness import (
+    LightProfile,
     lerp_color_hsv,
 )
 from homeassistant.components.adaptive_lighting.const import (
@@ -30,19 +31,30 @@ from homeassistant.components.adaptive_lighting.const import (
     ATTR_ADAPTIVE_LIGHTING_MANAGER,
     CONF_ADAPT_ONLY_ON_BARE_TURN_ON,
     CONF_ADAPT_UNTIL_SLEEP,
+    CONF_AUTO_SEND_SPLIT_DELAY,
     CONF_AUTORESET_CONTROL,
     CONF_BRIGHTNESS_MODE,
     CONF_BRIGHTNESS_MODE_TIME_DARK,
     CONF_BRIGHTNESS_MODE_TIME_LIGHT,
     CONF_DETECT_NON_HA_CHANGES,
     CONF_INITIAL_TRANSITION,
+    CONF_INTERVAL,
+    CONF_LIGHT_PROFILES,
     CONF_MANUAL_CONTROL,
     CONF_MAX_BRIGHTNESS,
     CONF_MIN_COLOR_TEMP,
     CONF_MULTI_LIGHT_INTERCEPT,
     CONF_PREFER_RGB_COLOR,
+    CONF_PRELOAD_OFF_LIGHTS,
+    CONF_PRIORITY,
+    CONF_ROLLOUT_WINDOW,
+    CONF_SEND_SPLIT_DELAY,
     CONF_SEPARATE_TURN_ON_COMMANDS,
+    CONF_SHARED_INTERVAL_CLOCK,
+    CONF_SLEEP_BRIGHTNESS,
+    CONF_SLEEP_COLOR_TEMP,
     CONF_SLEEP_RGB_OR_COLOR_TEMP,
+    CONF_SLEEP_TRANSITION,
     CONF_SUNRISE_OFFSET,
     CONF_SUNRISE_TIME,
     CONF_SUNSET_TIME,
@@ -57,13 +69,23 @@ from homeassistant.components.adaptive_lighting.const import (
     DEFAULT_SLEEP_COLOR_TEMP,
     DEFAULT_SLEEP_RGB_COLOR,
     DOMAIN,
+    LIGHT_RECORD_TTL,
+    PROACTIVE_CONTEXT_LIFETIME,
     SERVICE_APPLY,
     SERVICE_CHANGE_SWITCH_SETTINGS,
     SERVICE_SET_MANUAL_CONTROL,
+    SHARED_CLOCK_SPREAD,
     SLEEP_MODE_SWITCH,
+    STATE_HISTORY_LENGTH,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
     UNDO_UPDATE_LISTENER,
     TakeOverControlMode,
 )
+from homeassistant.components.adaptive_lighting.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
 from homeassistant.components.adaptive_lighting.switch import (
     CONF_INTERCEPT,
     AdaptiveLightingManager,
@@ -74,12 +96,14 @@ from homeassistant.components.adaptive_lighting.switch import (
     create_context,
     is_our_context,
     is_our_context_id,
+    rollout_schedule,
     short_hash,
 )
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_BRIGHTNESS_PCT,
     ATTR_COLOR_TEMP_KELVIN,
+    ATTR_MAX_COLOR_TEMP_KELVIN,
     ATTR_RGB_COLOR,
     ATTR_TRANSITION,
     ATTR_XY_COLOR,
@@ -102,10 +126,13 @@ from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import (
     ATTR_AREA_ID,
     ATTR_ENTITY_ID,
+    ATTR_SERVICE,
+    ATTR_SERVICE_DATA,
     ATTR_SUPPORTED_FEATURES,
     CONF_LIGHTS,
     CONF_NAME,
     EVENT_CALL_SERVICE,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_STATE_CHANGED,
     SERVICE_TOGGLE,
     SERVICE_TURN_ON,
@@ -113,14 +140,21 @@ from homeassistant.const import (
     STATE_ON,
 )
 from homeassistant.const import __version__ as ha_version
-from homeassistant.core import Context, Event, HomeAssistant, State
+from homeassistant.core import (
+    Context,
+    CoreState,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import entity_registry
 from homeassistant.helpers.entity_platform import async_get_platforms
 from homeassistant.setup import async_setup_component
 from homeassistant.util.color import color_temperature_mired_to_kelvin
 
-from tests.common import MockConfigEntry
+from tests.common import MockConfigEntry, async_fire_time_changed
 
 # HA 2026.6 removed the legacy `light: platform: template` YAML format
 # (home-assistant/core#169615); use the modern `template:` format there.
@@ -1132,6 +1166,272 @@ async def test_apply_service(hass):
     assert old_state[ATTR_COLOR_TEMP_KELVIN] == new_state[ATTR_COLOR_TEMP_KELVIN]
 
 
+async def test_service_responses(hass):
+    """Test the per-light outcomes returned by apply and set_manual_control."""
+    switch, _ = await setup_lights_and_switch(hass)
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_LIGHT_2},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(ENTITY_LIGHT_1).state == STATE_ON
+    assert hass.states.get(ENTITY_LIGHT_2).state == STATE_OFF
+
+    async def call(service, **kwargs):
+        return await hass.services.async_call(
+            DOMAIN,
+            service,
+            {ATTR_ENTITY_ID: switch.entity_id, **kwargs},
+            blocking=True,
+            return_response=True,
+        )
+
+    response = await call(SERVICE_APPLY)
+    outcomes = {r[ATTR_ENTITY_ID]: r for r in response["lights"]}
+    assert outcomes.keys() == {ENTITY_LIGHT_1, ENTITY_LIGHT_2}
+    assert outcomes[ENTITY_LIGHT_1]["outcome"] in ("adapted", "skipped")
+    assert outcomes[ENTITY_LIGHT_1]["duration"] >= 0
+    assert outcomes[ENTITY_LIGHT_2]["outcome"] == "off"
+    assert all(r[SWITCH_DOMAIN] == switch.entity_id for r in response["lights"])
+
+    response = await call(SERVICE_APPLY, **{CONF_TURN_ON_LIGHTS: True})
+    assert [r["outcome"] for r in response["lights"]] == ["adapted", "adapted"]
+    await hass.async_block_till_done()
+    assert hass.states.get(ENTITY_LIGHT_2).state == STATE_ON
+
+    response = await call(SERVICE_SET_MANUAL_CONTROL, **{CONF_MANUAL_CONTROL: True})
+    assert {r["outcome"] for r in response["lights"]} == {"manually_controlled"}
+    assert all(switch.manager.manual_control[light] for light in switch.lights)
+
+    response = await call(SERVICE_SET_MANUAL_CONTROL, **{CONF_MANUAL_CONTROL: False})
+    outcomes = {r[ATTR_ENTITY_ID]: r["outcome"] for r in response["lights"]}
+    assert outcomes.keys() == {ENTITY_LIGHT_1, ENTITY_LIGHT_2}
+    assert not any(switch.manager.manual_control[light] for light in switch.lights)
+
+    # Without a requested response nothing is returned
+    assert (
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_APPLY,
+            {ATTR_ENTITY_ID: switch.entity_id},
+            blocking=True,
+        )
+        is None
+    )
+
+
+def test_rollout_schedule():
+    """Test that rollout delays are spread and transitions end together."""
+    assert rollout_schedule(0, 10, 5) == []
+    assert rollout_schedule(1, 10, 5) == [(0, 5)]
+    schedule = rollout_schedule(4, 8, 10)
+    assert [delay for delay, _ in schedule] == [0, 2, 4, 6]
+    assert {delay + transition for delay, transition in schedule} == {10}
+    # A window longer than the transition stretches the first transitions
+    schedule = rollout_schedule(4, 8, 1)
+    assert {delay + transition for delay, transition in schedule} == {6}
+    assert schedule[-1] == (6, 0)
+
+
+async def test_sleep_mode_rollout(hass):
+    """Test that toggling sleep mode spreads the adaptations over the window."""
+    await hass.async_start()
+    await hass.async_block_till_done()
+    switch, _ = await setup_lights_and_switch(
+        hass,
+        {CONF_ROLLOUT_WINDOW: 0.3, CONF_SLEEP_TRANSITION: 0},
+        all_lights=True,
+    )
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        {ATTR_ENTITY_ID: switch.lights},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    calls = []
+    timed_adapt_light = switch._timed_adapt_light
+
+    async def record(light, context, transition=None, **kwargs):
+        calls.append((light, transition, hass.loop.time()))
+        return await timed_adapt_light(light, context, transition, **kwargs)
+
+    switch._timed_adapt_light = record
+    start = hass.loop.time()
+    await hass.services.async_call(
+        SWITCH_DOMAIN,
+        SERVICE_TURN_ON,
+        {ATTR_ENTITY_ID: switch.sleep_mode_switch.entity_id},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert [light for light, *_ in calls] == switch.lights
+    delays = [t - start for *_, t in calls]
+    assert delays == sorted(delays)
+    assert delays[-1] >= 0.2 - 0.01
+    # The first light gets the longest transition, such that all arrive together
+    transitions = [transition for _, transition, _ in calls]
+    assert transitions == pytest.approx([0.2, 0.1, 0])
+
+    # The rollout runs in the background, and stops when the switch is turned off
+    await switch.async_turn_off()
+    calls.clear()
+    await switch.async_turn_on()
+    task = switch._rollout_task
+    assert task is not None
+    assert not task.done()
+    await switch.async_turn_off()
+    await hass.async_block_till_done()
+    assert task.cancelled()
+    assert len(calls) < len(switch.lights)
+
+
+async def test_startup_warmup(hass):
+    """Test that the first adaptation after a restart waits until lights settle."""
+    hass.set_state(CoreState.not_running)
+    with (
+        patch(
+            "homeassistant.components.adaptive_lighting.switch.STARTUP_QUIET_PERIOD",
+            0.1,
+        ),
+        patch(
+            "homeassistant.components.adaptive_lighting.switch.STARTUP_BATCH_SIZE",
+            1,
+        ),
+        patch(
+            "homeassistant.components.adaptive_lighting.switch.STARTUP_BATCH_INTERVAL",
+            0,
+        ),
+    ):
+        switch, _ = await setup_lights_and_switch(hass)
+        warmup = switch.manager.startup_warmup
+        assert switch.is_on
+        assert warmup.switches == [switch]
+        assert not switch.manager.last_service_data
+
+        turn_on_calls = []
+
+        @callback
+        def track(event):
+            if event.data[ATTR_SERVICE] == SERVICE_TURN_ON:
+                turn_on_calls.append(event.data[ATTR_SERVICE_DATA][ATTR_ENTITY_ID])
+
+        hass.bus.async_listen(EVENT_CALL_SERVICE, track)
+        hass.set_state(CoreState.running)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        assert warmup.task is not None
+        await warmup.task
+        await hass.async_block_till_done()
+        assert not warmup.pending
+        on_lights = [
+            light for light in switch.lights if hass.states.get(light).state == STATE_ON
+        ]
+        assert on_lights
+        assert sorted(turn_on_calls) == sorted(on_lights)
+
+        # Lights that already have the right state are skipped
+        turn_on_calls.clear()
+        warmup.add(switch)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        await warmup.task
+        await hass.async_block_till_done()
+        assert not turn_on_calls
+
+
+async def test_restore_manager_state(hass, hass_storage):
+    """Test that the manager state is persisted and restored after a restart."""
+    now = dt_util.utcnow().timestamp()
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": {
+            "manual_control": {
+                ENTITY_LIGHT_1: LightControlAttributes.BRIGHTNESS.value,
+                ENTITY_LIGHT_2: LightControlAttributes.NONE.value,
+            },
+            "auto_reset_deadlines": {ENTITY_LIGHT_1: now + 1000},
+            "last_service_data": {
+                ENTITY_LIGHT_3: {ATTR_BRIGHTNESS: 10, ATTR_RGB_COLOR: [255, 0, 0]},
+            },
+        },
+    }
+    switch, _ = await setup_lights_and_switch(hass, {CONF_AUTORESET_CONTROL: 3600})
+    manager = switch.manager
+
+    # Turning on the switch after the restart didn't reset the restored state
+    assert manager.manual_control[ENTITY_LIGHT_1] == LightControlAttributes.BRIGHTNESS
+    timer = manager.auto_reset_manual_control_timers[ENTITY_LIGHT_1]
+    assert timer.is_running()
+    assert 990 < timer.remaining_time() <= 1000
+    assert manager.last_service_data[ENTITY_LIGHT_3][ATTR_RGB_COLOR] == (255, 0, 0)
+
+    # Changes are written after a delay
+    manager.set_manual_control_attributes(ENTITY_LIGHT_2)
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + datetime.timedelta(seconds=STORAGE_SAVE_DELAY + 1),
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[STORAGE_KEY]["data"]
+    assert data["manual_control"][ENTITY_LIGHT_2] == LightControlAttributes.ALL
+    assert data["auto_reset_deadlines"][ENTITY_LIGHT_1] == pytest.approx(now + 1000)
+    assert data["auto_reset_deadlines"][ENTITY_LIGHT_2] == pytest.approx(
+        now + 3600,
+        abs=5,
+    )
+
+    # A touch restarts the restored timer with the configured delay, and is saved
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        {ATTR_ENTITY_ID: ENTITY_LIGHT_1},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    timer = manager.auto_reset_manual_control_timers[ENTITY_LIGHT_1]
+    assert timer.is_running()
+    assert 3590 < timer.remaining_time() <= 3600
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + datetime.timedelta(seconds=2 * STORAGE_SAVE_DELAY + 2),
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[STORAGE_KEY]["data"]
+    assert data["auto_reset_deadlines"][ENTITY_LIGHT_1] == pytest.approx(
+        dt_util.utcnow().timestamp() + 3600,
+        abs=5,
+    )
+
+    # Adaptations only schedule a save when the persisted 'service_data' changes
+    async def adapt(service_data):
+        await switch._execute_adaptation_calls(
+            AdaptationData(
+                ENTITY_LIGHT_3,
+                switch.create_context("test"),
+                0,
+                _create_service_call_data_iterator(hass, [service_data], False),
+                force=True,
+                max_length=1,
+                attributes=LightControlAttributes.ALL,
+            ),
+        )
+
+    service_data = {ATTR_ENTITY_ID: ENTITY_LIGHT_3, ATTR_BRIGHTNESS: 20}
+    with patch.object(manager, "async_schedule_save") as async_schedule_save:
+        await adapt(service_data)
+        async_schedule_save.assert_called_once()
+        await adapt(service_data)
+        async_schedule_save.assert_called_once()
+    for timer in manager.auto_reset_manual_control_timers.values():
+        timer.cancel()
+
+
 async def test_switch_off_on_off(hass):
     """Test switch rapid off_on_off."""
 
@@ -1163,21 +1463,26 @@ async def test_switch_off_on_off(hass):
         # Set state to on after a second (like happens IRL)
         await asyncio.sleep(1e-3)
         hass.states.async_set(ENTITY_LIGHT_1, STATE_ON)
-        # Set state to off after a second (like happens IRL)
         await asyncio.sleep(1e-3)
-        hass.states.async_set(ENTITY_LIGHT_1, STATE_OFF)
 
-        # Now we test whether the sleep task is there
-        assert ENTITY_LIGHT_1 in switch.manager.sleep_tasks
-        sleep_task = switch.manager.sleep_tasks[ENTITY_LIGHT_1]
-        assert not sleep_task.cancelled()
+        # Now we test whether the light waits for evidence of being turned off
+        assert ENTITY_LIGHT_1 in switch.manager.turn_off_waiters
+        waiter = switch.manager.turn_off_waiters[ENTITY_LIGHT_1]
+        assert not waiter.done()
 
-        # A 'light.turn_on' event should cancel that task
-        await turn_light(turn_light_state_at_end)
+        if turn_light_state_at_end:
+            # A 'light.turn_on' call resolves the waiter right away
+            await turn_light(True)
+            assert waiter.result() is False
+        else:
+            # Set state to off after a second (like happens IRL), which resolves it
+            hass.states.async_set(ENTITY_LIGHT_1, STATE_OFF)
+            await hass.async_block_till_done()
+            assert waiter.result() is True
+        assert ENTITY_LIGHT_1 not in switch.manager.turn_off_waiters
         await update()
         state = hass.states.get(ENTITY_LIGHT_1).state
         if turn_light_state_at_end:
-            assert sleep_task.cancelled()
             assert state == STATE_ON
         else:
             assert state == STATE_OFF
@@ -1551,6 +1856,489 @@ async def test_async_update_at_interval_action(hass):
     await switch._async_update_at_interval_action()
 
 
+async def test_light_record_history_and_purge(hass):
+    """Test that the state history is bounded and records of removed lights expire."""
+    switch, _ = await setup_lights_and_switch(hass)
+    manager = switch.manager
+    context = switch.create_context("test")
+    for brightness in range(STATE_HISTORY_LENGTH + 5):
+        hass.states.async_set(
+            ENTITY_LIGHT_1,
+            STATE_ON,
+            {ATTR_BRIGHTNESS: brightness},
+            context=context if brightness == 0 else None,
+        )
+        await hass.async_block_till_done()
+    history = manager.our_last_state_on_change[ENTITY_LIGHT_1]
+    assert len(history) == STATE_HISTORY_LENGTH
+    # Our own state is kept, so a late state of the same adaptation is no new adapt
+    assert history[0].context.id == context.id
+    with (
+        patch.object(manager, "start_transition_timer") as start_transition_timer,
+        patch.object(manager, "async_schedule_save") as async_schedule_save,
+    ):
+        hass.states.async_set(
+            ENTITY_LIGHT_1,
+            STATE_ON,
+            {ATTR_BRIGHTNESS: 1},
+            context=context,
+        )
+        await hass.async_block_till_done()
+    start_transition_timer.assert_not_called()
+    async_schedule_save.assert_not_called()
+    assert history[0].context.id == context.id
+    assert history[-1].attributes[ATTR_BRIGHTNESS] == 1
+    assert len(history) == STATE_HISTORY_LENGTH
+
+    manager.record("light.removed").manual_control = LightControlAttributes.ALL
+    manager._next_purge = 0
+    manager._maybe_purge_light_records()
+    assert manager.light_records["light.removed"].missing_since is not None
+    # Lights of the switches and lights that exist are kept
+    assert manager.light_records[ENTITY_LIGHT_1].missing_since is None
+
+    manager.light_records["light.removed"].missing_since -= LIGHT_RECORD_TTL + 1
+    manager._next_purge = 0
+    manager._maybe_purge_light_records()
+    assert "light.removed" not in manager.light_records
+    assert ENTITY_LIGHT_1 in manager.light_records
+
+
+async def test_reconfigure_in_place(hass):
+    """Test that options changes keep the switch, its timers and manual control."""
+    switch, _ = await setup_lights_and_switch(hass)
+    manager = switch.manager
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    manager.set_manual_control_attributes(ENTITY_LIGHT_2)
+    sun = switch._sun_light_settings.sun
+
+    hass.config_entries.async_update_entry(entry, options={CONF_MAX_BRIGHTNESS: 40})
+    await hass.async_block_till_done()
+    assert hass.data[DOMAIN][entry.entry_id][SWITCH_DOMAIN] is switch
+    assert switch._sun_light_settings.max_brightness == 40
+    assert switch._sun_light_settings.sun is sun  # the sun events are kept
+    assert manager.manual_control[ENTITY_LIGHT_2] == LightControlAttributes.ALL
+    assert hass.states.get(ENTITY_LIGHT_1).attributes[ATTR_BRIGHTNESS] <= 102
+
+    hass.config_entries.async_update_entry(
+        entry,
+        options={CONF_MAX_BRIGHTNESS: 40, CONF_SUNRISE_OFFSET: 600},
+    )
+    await hass.async_block_till_done()
+    assert hass.data[DOMAIN][entry.entry_id][SWITCH_DOMAIN] is switch
+    assert switch._sun_light_settings.sun is not sun
+
+    # Changing the lights requires reloading the entry
+    hass.config_entries.async_update_entry(
+        entry,
+        data={**entry.data, CONF_LIGHTS: [ENTITY_LIGHT_1]},
+    )
+    await hass.async_block_till_done()
+    new_switch = hass.data[DOMAIN][entry.entry_id][SWITCH_DOMAIN]
+    assert new_switch is not switch
+    assert new_switch.lights == [ENTITY_LIGHT_1]
+
+
+async def test_proactively_adapting_contexts(hass):
+    """Test the context bookkeeping of proactive adaptations and its expiry."""
+    switch, _ = await setup_lights_and_switch(hass)
+    manager = switch.manager
+    manager.set_proactively_adapting("a", ENTITY_LIGHT_1)
+    manager.set_proactively_adapting("b", ENTITY_LIGHT_1)
+    manager.set_proactively_adapting("c", ENTITY_LIGHT_2)
+    assert manager.is_proactively_adapting("a")
+    assert manager.is_proactively_adapting("c")
+    assert not manager.is_proactively_adapting("d")
+
+    manager.clear_proactively_adapting(ENTITY_LIGHT_1)
+    assert not manager.is_proactively_adapting("a")
+    assert not manager.is_proactively_adapting("b")
+    assert manager.is_proactively_adapting("c")
+    assert ENTITY_LIGHT_1 not in manager._proactively_adapting_entities
+
+    # Expired contexts are ignored and dropped by the next declaration
+    later = hass.loop.time() + PROACTIVE_CONTEXT_LIFETIME + 1
+    with patch.object(hass.loop, "time", return_value=later):
+        assert not manager.is_proactively_adapting("c")
+        manager.set_proactively_adapting("e", ENTITY_LIGHT_1)
+        assert manager.is_proactively_adapting("e")
+    assert list(manager._proactively_adapting_contexts) == ["e"]
+    assert manager._proactively_adapting_entities == {ENTITY_LIGHT_1: {"e"}}
+
+
+async def test_turn_off_cancels_pending_adaptation(hass):
+    """Test that 'light.turn_off' cancels pending adaptations before it executes."""
+    switch, _ = await setup_lights_and_switch(hass)
+    pending = asyncio.ensure_future(asyncio.sleep(10))
+    switch.manager.adaptation_tasks_brightness[ENTITY_LIGHT_1] = pending
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_LIGHT_1},
+        blocking=True,
+    )
+    assert pending.cancelled()
+    await hass.async_block_till_done()
+
+
+async def test_adapt_at_transition_end(hass):
+    """Test that a light skipped during its transition is adapted when it ends."""
+    switch, _ = await setup_lights_and_switch(hass)
+    manager = switch.manager
+    manager.last_service_data[ENTITY_LIGHT_1] = {ATTR_TRANSITION: 0.05}
+    manager.start_transition_timer(ENTITY_LIGHT_1)
+
+    calls = []
+    timed_adapt_light = switch._timed_adapt_light
+
+    async def record(light, context, transition=None, **kwargs):
+        calls.append(light)
+        return await timed_adapt_light(light, context, transition, **kwargs)
+
+    switch._timed_adapt_light = record
+    await switch._update_attrs_and_maybe_adapt_lights(
+        context=switch.create_context("interval"),
+        lights=[ENTITY_LIGHT_1],
+        transition=0,
+    )
+    assert not calls
+    assert manager.deferred_adaptations[ENTITY_LIGHT_1] is switch
+
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+    assert calls == [ENTITY_LIGHT_1]
+    assert ENTITY_LIGHT_1 not in manager.deferred_adaptations
+
+
+async def test_interval_tick_deadline(hass):
+    """Test that lights unfinished at the deadline are carried over to the next tick."""
+    switch, _ = await setup_lights_and_switch(hass, all_lights=True)
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        {ATTR_ENTITY_ID: switch.lights},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    switch._interval = datetime.timedelta(seconds=0.05)
+    slow_light = switch.lights[-1]
+
+    calls = []
+    timed_adapt_light = switch._timed_adapt_light
+
+    async def record(light, context, transition=None, **kwargs):
+        calls.append(light)
+        if light == slow_light:
+            await asyncio.sleep(10)
+        return await timed_adapt_light(light, context, transition, **kwargs)
+
+    switch._timed_adapt_light = record
+    await switch._async_update_at_interval_action()
+    assert switch._carried_over_lights == [slow_light]
+    assert switch.tick_statistics.ticks == 1
+    assert switch.tick_statistics.overruns == 1
+    assert switch.tick_statistics.carried_over_lights == 1
+
+    # The carried over light goes first in the next tick
+    calls.clear()
+    slow_light = None
+    await switch._async_update_at_interval_action()
+    assert calls[0] == switch.lights[-1]
+    assert not switch._carried_over_lights
+    assert switch.tick_statistics.ticks == 2
+    assert switch.tick_statistics.overruns == 1
+
+    # The loop schedules the next tick after the previous one has finished
+    switch._interval = datetime.timedelta(seconds=60)
+    switch._update_time_interval_listener()
+    for i in range(2):
+        async_fire_time_changed(hass, dt_util.utcnow() + (i + 1) * switch._interval)
+        await hass.async_block_till_done()
+    assert switch.tick_statistics.ticks == 4
+    await switch.async_turn_off()
+    async_fire_time_changed(hass, dt_util.utcnow() + 3 * switch._interval)
+    await hass.async_block_till_done()
+    assert switch.tick_statistics.ticks == 4
+
+    diagnostics = await async_get_config_entry_diagnostics(
+        hass,
+        hass.config_entries.async_entries(DOMAIN)[0],
+    )
+    assert diagnostics["interval_loop"]["overruns"] == 1
+
+
+async def test_non_converging_light_backoff(hass):
+    """Test that lights that ignore our commands are adapted exponentially less."""
+    switch, _ = await setup_lights_and_switch(
+        hass,
+        {CONF_DETECT_NON_HA_CHANGES: False},
+        True,
+    )
+    manager = switch.manager
+    interval = switch._interval.total_seconds()
+    brightness = hass.states.get(ENTITY_LIGHT_1).attributes[ATTR_BRIGHTNESS]
+    record = manager.record(ENTITY_LIGHT_1)
+
+    record.last_adaptation_service_data = {ATTR_BRIGHTNESS: brightness}
+    assert not manager.is_backing_off(switch, ENTITY_LIGHT_1)
+    assert record.non_convergences is None
+
+    # Only the attributes of our most recent adaptation are compared, not the
+    # stale ones of earlier adaptations (which remain in `last_service_data`)
+    record.last_service_data = {
+        ATTR_BRIGHTNESS: brightness,
+        ATTR_COLOR_TEMP_KELVIN: 1000,
+        ATTR_RGB_COLOR: (1, 2, 3),
+    }
+    assert not manager.is_backing_off(switch, ENTITY_LIGHT_1)
+    assert record.non_convergences is None
+
+    # The light does not reflect the brightness that we (supposedly) sent
+    record.last_adaptation_service_data = {ATTR_BRIGHTNESS: (brightness + 100) % 256}
+    assert not manager.is_backing_off(switch, ENTITY_LIGHT_1)
+    assert not manager.is_backing_off(switch, ENTITY_LIGHT_1)
+    assert manager.is_backing_off(switch, ENTITY_LIGHT_1)
+    assert record.non_convergences == 3
+    assert record.backoff_until == pytest.approx(hass.loop.time() + interval, abs=1)
+    outcomes = await switch._update_attrs_and_maybe_adapt_lights(
+        context=switch.create_context("interval"),
+        lights=[ENTITY_LIGHT_1],
+        transition=0,
+    )
+    assert [outcome["outcome"] for outcome in outcomes] == ["backing_off"]
+    diagnostics = await async_get_config_entry_diagnostics(
+        hass,
+        hass.config_entries.async_entries(DOMAIN)[0],
+    )
+    assert diagnostics["non_converging_lights"][ENTITY_LIGHT_1]["non_convergences"] == 3
+
+    # After the backoff one retry, then twice as long
+    later = hass.loop.time() + interval + 1
+    with patch.object(hass.loop, "time", return_value=later):
+        assert not manager.is_backing_off(switch, ENTITY_LIGHT_1)
+        assert manager.is_backing_off(switch, ENTITY_LIGHT_1)
+    assert record.backoff_until == later + 2 * interval
+
+    # A state change that the light reports by itself resets the backoff
+    state = hass.states.get(ENTITY_LIGHT_1)
+    hass.states.async_set(
+        ENTITY_LIGHT_1,
+        state.state,
+        {**state.attributes, ATTR_BRIGHTNESS: brightness + 1},
+    )
+    await hass.async_block_till_done()
+    assert record.non_convergences is None
+    assert record.backoff_until is None
+
+    # An adaptation replaces the attributes of the previous one
+    record = manager.record(ENTITY_LIGHT_2)
+
+    async def adapt():
+        await switch._update_attrs_and_maybe_adapt_lights(
+            context=switch.create_context("test"),
+            lights=[ENTITY_LIGHT_2],
+            transition=0,
+            force=True,
+        )
+        await hass.async_block_till_done()
+
+    await adapt()
+    assert ATTR_COLOR_TEMP_KELVIN in record.last_adaptation_service_data
+    await switch.adapt_color_switch.async_turn_off()
+    await adapt()
+    assert ATTR_BRIGHTNESS in record.last_adaptation_service_data
+    assert ATTR_COLOR_TEMP_KELVIN not in record.last_adaptation_service_data
+    assert ATTR_COLOR_TEMP_KELVIN in record.last_service_data
+
+
+async def test_redundancy_tolerance_learned_when_settled(hass):
+    """Test that the rounding of a light is learned only once its transition ended."""
+    switch, _ = await setup_lights_and_switch(hass, {CONF_DETECT_NON_HA_CHANGES: False})
+    manager = switch.manager
+    state = hass.states.get(ENTITY_LIGHT_1)
+    brightness = state.attributes[ATTR_BRIGHTNESS]
+    record = manager.record(ENTITY_LIGHT_1)
+    record.last_service_data = record.last_adaptation_service_data = {
+        ATTR_BRIGHTNESS: brightness + 2,
+        ATTR_TRANSITION: 0.05,
+    }
+
+    # Halfway through the transition
+    hass.states.async_set(
+        ENTITY_LIGHT_1,
+        STATE_ON,
+        {**state.attributes, ATTR_BRIGHTNESS: brightness + 1},
+        context=switch.create_context("test"),
+    )
+    await hass.async_block_till_done()
+    assert manager.redundancy_tolerance(ENTITY_LIGHT_1).brightness == 0
+
+    # Once the transition ended
+    hass.states.async_set(
+        ENTITY_LIGHT_1,
+        STATE_ON,
+        {**state.attributes, ATTR_BRIGHTNESS: brightness},
+        context=switch.create_context("test"),
+    )
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+    assert manager.redundancy_tolerance(ENTITY_LIGHT_1).brightness == 2
+
+    # Without a transition the first state is settled, an exact one narrows it
+    record.last_service_data = record.last_adaptation_service_data = {
+        ATTR_BRIGHTNESS: brightness,
+    }
+    hass.states.async_set(
+        ENTITY_LIGHT_1,
+        STATE_ON,
+        {**state.attributes, ATTR_BRIGHTNESS: brightness},
+        force_update=True,
+        context=switch.create_context("test"),
+    )
+    await hass.async_block_till_done()
+    assert manager.redundancy_tolerance(ENTITY_LIGHT_1).brightness == 1
+
+
+async def test_auto_send_split_delay(hass):
+    """Test that the split delay is learned per light, up to `send_split_delay`."""
+    switch, _ = await setup_lights_and_switch(
+        hass,
+        {
+            CONF_SEPARATE_TURN_ON_COMMANDS: True,
+            CONF_SEND_SPLIT_DELAY: 500,
+            CONF_AUTO_SEND_SPLIT_DELAY: True,
+        },
+    )
+    # Lights without a learned delay use the maximum
+    assert switch._split_delay("light.unknown") == 0.5
+
+    await switch._update_attrs_and_maybe_adapt_lights(
+        context=switch.create_context("test"),
+        transition=0,
+        force=True,
+    )
+    await hass.async_block_till_done()
+    latency = switch.manager.record(ENTITY_LIGHT_1).latency
+    assert latency is not None
+    assert latency.samples
+    assert switch._split_delay(ENTITY_LIGHT_1) == min(latency.estimate(), 0.5)
+    diagnostics = await async_get_config_entry_diagnostics(
+        hass,
+        hass.config_entries.async_entries(DOMAIN)[0],
+    )
+    assert ENTITY_LIGHT_1 in diagnostics["command_latencies"]
+
+    latency.add(10)
+    assert switch._split_delay(ENTITY_LIGHT_1) == 0.5
+
+    # Without a `send_split_delay`, the learned delay is still used (up to a second)
+    switch._send_split_delay = 0
+    assert switch._split_delay("light.unknown") == 1.0
+    assert switch._split_delay(ENTITY_LIGHT_1) == 1.0
+
+    # The latency of split calls is measured from the first call
+    record = switch.manager.record("light.silent")
+    service_datas = [
+        {ATTR_ENTITY_ID: "light.silent", ATTR_BRIGHTNESS: 10},
+        {ATTR_ENTITY_ID: "light.silent", ATTR_COLOR_TEMP_KELVIN: 3000},
+    ]
+    start = hass.loop.time()
+    await switch._execute_adaptation_calls(
+        AdaptationData(
+            "light.silent",
+            switch.create_context("test"),
+            0.05,
+            _create_service_call_data_iterator(hass, service_datas, False),
+            force=True,
+            max_length=2,
+            attributes=LightControlAttributes.ALL,
+        ),
+    )
+    assert record.latency_probe[1] - start < 0.05
+
+
+async def test_preload_off_lights(hass):
+    """Test that off lights are preloaded once, and then turn on unintercepted."""
+    switch, _ = await setup_lights_and_switch(
+        hass,
+        {CONF_PRELOAD_OFF_LIGHTS: True, CONF_DETECT_NON_HA_CHANGES: False},
+    )
+    events = []
+    hass.bus.async_listen(f"{DOMAIN}.preload", events.append)
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_LIGHT_1},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    switch._preload_lights(switch.create_context("preload"))
+    await hass.async_block_till_done()
+    assert [event.data[ATTR_ENTITY_ID] for event in events] == [ENTITY_LIGHT_1]
+    desired = switch.desired_state(ENTITY_LIGHT_1)
+    assert events[0].data[ATTR_BRIGHTNESS] == desired.brightness
+    assert events[0].data[ATTR_COLOR_TEMP_KELVIN] == desired.color_temp_kelvin
+    assert events[0].data[SWITCH_DOMAIN] == switch.entity_id
+
+    # Unchanged settings are not preloaded again, even after the rate limit
+    record = switch.manager.record(ENTITY_LIGHT_1)
+    record.preloaded_at = None
+    switch._preload_lights(switch.create_context("preload"))
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
+    assert switch.is_preloaded(ENTITY_LIGHT_1, {})
+    assert not switch.is_preloaded(ENTITY_LIGHT_1, {ATTR_BRIGHTNESS: 10})
+    assert not switch.is_preloaded(ENTITY_LIGHT_2, {})
+
+    # Changed settings are preloaded again
+    await switch.sleep_mode_switch.async_turn_on()
+    await switch._update_attrs_and_maybe_adapt_lights(
+        context=switch.create_context("test"),
+    )
+    await hass.async_block_till_done()
+    switch._preload_lights(switch.create_context("preload"))
+    await hass.async_block_till_done()
+    assert len(events) == 2
+    assert events[1].data[ATTR_BRIGHTNESS] < events[0].data[ATTR_BRIGHTNESS]
+
+    # But at most every `PRELOAD_MIN_INTERVAL` seconds
+    await switch.sleep_mode_switch.async_turn_off()
+    await switch._update_attrs_and_maybe_adapt_lights(
+        context=switch.create_context("test"),
+    )
+    await hass.async_block_till_done()
+    switch._preload_lights(switch.create_context("preload"))
+    await hass.async_block_till_done()
+    assert len(events) == 2
+
+    # A light that is preloaded with its current settings turns on without adaptation
+    record.preloaded_at = None
+    switch._preload_lights(switch.create_context("preload"))
+    await hass.async_block_till_done()
+    assert len(events) == 3
+    assert switch.is_preloaded(ENTITY_LIGHT_1, {})
+
+    turn_on_calls = []
+
+    @callback
+    def track(event):
+        if event.data[ATTR_SERVICE] == SERVICE_TURN_ON:
+            turn_on_calls.append(event.data[ATTR_SERVICE_DATA])
+
+    hass.bus.async_listen(EVENT_CALL_SERVICE, track)
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        {ATTR_ENTITY_ID: ENTITY_LIGHT_1},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert turn_on_calls == [{ATTR_ENTITY_ID: ENTITY_LIGHT_1}]
+    assert record.preloaded is None
+
+
 @pytest.mark.parametrize("separate_turn_on_commands", (True, False))
 async def test_separate_turn_on_commands(hass, separate_turn_on_commands):
     """Test 'separate_turn_on_commands' argument."""
@@ -1768,6 +2556,35 @@ async def test_cancellable_service_calls_task(hass):
     assert task.done()
 
 
+async def test_superseded_adaptation_calls(hass):
+    """Test that an adaptation that is cancelled by a newer one is reported as such."""
+    light, *_ = await setup_lights(hass)
+    _, switch = await setup_switch(hass, {})
+
+    def adaptation_data(brightness: int, initial_sleep: bool) -> AdaptationData:
+        service_data = {ATTR_BRIGHTNESS: brightness, ATTR_ENTITY_ID: light.entity_id}
+        return AdaptationData(
+            light.entity_id,
+            switch.create_context("test"),
+            10,
+            _create_service_call_data_iterator(hass, [service_data], False),
+            force=True,
+            max_length=1,
+            attributes=LightControlAttributes.ALL,
+            initial_sleep=initial_sleep,
+        )
+
+    first = asyncio.create_task(
+        switch.execute_cancellable_adaptation_calls(adaptation_data(10, True)),
+    )
+    await asyncio.sleep(0)
+    assert await switch.execute_cancellable_adaptation_calls(
+        adaptation_data(20, False),
+    )
+    assert not await first
+    assert switch.manager.last_service_data[light.entity_id][ATTR_BRIGHTNESS] == 20
+
+
 async def test_service_calls_task_cancellation(hass):
     """Tests if the task that wraps ongoing adaptation service calls gets cancelled."""
     _, switch = await setup_switch(hass, {})
@@ -1828,6 +2645,7 @@ async def test_proactive_adaptation(hass):
         {
             ATTR_BRIGHTNESS_PCT: 67,
             ATTR_COLOR_TEMP_KELVIN: 3448,
+            ATTR_RGB_COLOR: (255, 180, 100),
             "force_rgb_color": False,
         },
     )
@@ -1849,6 +2667,100 @@ async def test_proactive_adaptation(hass):
     assert state.attributes[ATTR_COLOR_TEMP_KELVIN] == 3448
 
 
+async def test_desired_state_store(hass):
+    """Test that all adaptation paths read the desired states computed once per update."""
+    switch, _ = await setup_lights_and_switch(hass, {CONF_INTERCEPT: True}, True)
+    _mock_sun_light_settings(
+        switch,
+        {
+            ATTR_BRIGHTNESS_PCT: 67,
+            ATTR_COLOR_TEMP_KELVIN: 3448,
+            ATTR_RGB_COLOR: (255, 180, 100),
+            "force_rgb_color": False,
+        },
+    )
+    get_settings = switch._sun_light_settings.get_settings
+
+    await switch._update_attrs_and_maybe_adapt_lights(
+        context=switch.create_context("test"),
+        transition=0,
+        force=True,
+    )
+    assert get_settings.call_count == 1
+    desired = switch.manager.desired_states.get(
+        ENTITY_LIGHT_1,
+        switch._name,
+        switch._settings_generation,
+    )
+    assert desired.brightness == 171
+    assert desired.owner == switch._name
+
+    # The intercepted 'light.turn_on' is a lookup in the store
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_LIGHT_3},
+        blocking=True,
+    )
+    await _turn_on_and_track_event_contexts(hass, "test_context", ENTITY_LIGHT_3)
+    assert get_settings.call_count == 1
+    assert hass.states.get(ENTITY_LIGHT_3).attributes[ATTR_BRIGHTNESS] == 171
+
+    # A new update invalidates the desired states
+    await switch._update_attrs_and_maybe_adapt_lights(
+        context=switch.create_context("test"),
+        transition=0,
+        force=True,
+    )
+    assert get_settings.call_count == 2
+    assert (
+        switch.manager.desired_states.get(
+            ENTITY_LIGHT_1,
+            switch._name,
+            switch._settings_generation - 1,
+        )
+        is None
+    )
+    await hass.async_block_till_done()
+
+
+async def test_capabilities_cache(hass):
+    """Test that capabilities are cached until the light's attributes change."""
+    switch, _ = await setup_lights_and_switch(hass, {}, True)
+    manager = switch.manager
+    switch.desired_state(ENTITY_LIGHT_1)
+    capabilities = manager.capabilities(ENTITY_LIGHT_1)
+    assert manager.record(ENTITY_LIGHT_1).capabilities is capabilities
+
+    # A state change without capability changes keeps the cache
+    state = hass.states.get(ENTITY_LIGHT_1)
+    hass.states.async_set(
+        ENTITY_LIGHT_1,
+        state.state,
+        {**state.attributes, ATTR_BRIGHTNESS: 1},
+    )
+    await hass.async_block_till_done()
+    assert manager.record(ENTITY_LIGHT_1).capabilities is capabilities
+
+    # A changed color temperature range invalidates it and the desired state
+    hass.states.async_set(
+        ENTITY_LIGHT_1,
+        state.state,
+        {**state.attributes, ATTR_MAX_COLOR_TEMP_KELVIN: 3000},
+    )
+    await hass.async_block_till_done()
+    assert manager.record(ENTITY_LIGHT_1).capabilities is None
+    assert (
+        manager.desired_states.get(
+            ENTITY_LIGHT_1,
+            switch._name,
+            switch._settings_generation,
+        )
+        is None
+    )
+    assert manager.capabilities(ENTITY_LIGHT_1).max_color_temp_kelvin == 3000
+
+
 async def test_proactive_adaptation_with_separate_commands(hass):
     """Validate that a split proactive adaptation yields one additional service call."""
     switch, _ = await setup_lights_and_switch(
@@ -1865,6 +2777,7 @@ async def test_proactive_adaptation_with_separate_commands(hass):
         {
             ATTR_BRIGHTNESS_PCT: 67,
             ATTR_COLOR_TEMP_KELVIN: 3448,
+            ATTR_RGB_COLOR: (255, 180, 100),
             "force_rgb_color": False,
         },
     )
@@ -2187,6 +3100,190 @@ async def test_two_switches_for_single_light(hass):
     assert before_color_temp != after_color_temp
 
 
+async def test_shared_interval_clock(hass):
+    """Test that a single clock runs and spreads the ticks of the switches."""
+    switch1, _ = await setup_lights_and_switch(
+        hass,
+        {CONF_SHARED_INTERVAL_CLOCK: True, CONF_INTERVAL: 60},
+    )
+    _, switch2 = await setup_switch(
+        hass,
+        {
+            CONF_NAME: "switch2",
+            CONF_LIGHTS: [ENTITY_LIGHT_3],
+            CONF_SHARED_INTERVAL_CLOCK: True,
+            CONF_INTERVAL: 180,
+        },
+    )
+    clock = switch1.manager.interval_clock
+    assert set(clock.switches) == {switch1, switch2}
+    assert clock.period == 60
+    delays = clock.slots([switch1, switch2], 60)
+    assert sorted(delays.values()) == pytest.approx([0, 16, 32])
+
+    ticks = switch1.tick_statistics.ticks
+    await switch1._async_update_at_interval_action(
+        delays={ENTITY_LIGHT_1: 0.01, ENTITY_LIGHT_2: 0.02},
+        deadline=hass.loop.time() + 60,
+    )
+    assert switch1.tick_statistics.ticks == ticks + 1
+    assert not switch1.tick_statistics.overruns
+
+    # Only the switches whose interval passed are adapted
+    for switch in (switch1, switch2):
+        switch._async_update_at_interval_action = AsyncMock()
+    start = hass.loop.time() + 60
+    await clock._run_due_switches(start, 60)
+    switch1._async_update_at_interval_action.assert_awaited_once()
+    switch2._async_update_at_interval_action.assert_not_awaited()
+    kwargs = switch1._async_update_at_interval_action.await_args.kwargs
+    assert kwargs["deadline"] == start + 60
+    assert set(kwargs["delays"]) == {ENTITY_LIGHT_1, ENTITY_LIGHT_2}
+    await clock._run_due_switches(start + 120, 60)
+    switch2._async_update_at_interval_action.assert_awaited_once()
+
+    await switch1.async_turn_off()
+    assert set(clock.switches) == {switch2}
+    await switch2.async_turn_off()
+    assert not clock.switches
+    assert clock._remove_timer is None
+
+    # A switch with a shorter interval brings the pending tick forward
+    await switch2.async_turn_on()
+    assert clock._next_tick == pytest.approx(hass.loop.time() + 180, abs=1)
+    await switch1.async_turn_on()
+    assert clock.period == 60
+    assert clock._next_tick == pytest.approx(hass.loop.time() + 60, abs=1)
+    await switch1.async_turn_off()
+    await switch2.async_turn_off()
+    assert clock._remove_timer is None
+
+
+async def test_shared_interval_clock_late_slots(hass):
+    """Test that lights in late slots of the clock still finish split adaptations."""
+    switch, _ = await setup_lights_and_switch(
+        hass,
+        {
+            CONF_SHARED_INTERVAL_CLOCK: True,
+            CONF_SEPARATE_TURN_ON_COMMANDS: True,
+        },
+    )
+    for light in switch.lights:
+        switch.manager.record(light).transition_timer = None
+    # The second command follows 0.05 seconds after the first one (with a split
+    # delay instead of a transition, which the test lights do not support)
+    switch._send_split_delay = 50
+    period = 0.1
+    delays = {ENTITY_LIGHT_1: 0.0, ENTITY_LIGHT_2: SHARED_CLOCK_SPREAD * period}
+    await switch._async_update_at_interval_action(
+        delays=delays,
+        deadline=hass.loop.time() + period,
+    )
+    assert not switch._carried_over_lights
+    assert not switch.tick_statistics.overruns
+
+    # Carried over lights get the first slot of the next tick
+    switch._carried_over_lights = [ENTITY_LIGHT_2]
+    switch._update_attrs_and_maybe_adapt_lights = AsyncMock(return_value=[])
+    await switch._async_update_at_interval_action(
+        delays=delays,
+        deadline=hass.loop.time() + period,
+    )
+    kwargs = switch._update_attrs_and_maybe_adapt_lights.await_args.kwargs
+    assert kwargs["lights"][0] == ENTITY_LIGHT_2
+    assert kwargs["delays"] == {ENTITY_LIGHT_1: 0.0, ENTITY_LIGHT_2: 0.0}
+
+
+async def test_light_profiles(hass):
+    """Test that lights (or light groups) with a profile get their own settings."""
+    hass.states.async_set("light.group", STATE_ON, {ATTR_ENTITY_ID: [ENTITY_LIGHT_2]})
+    switch, _ = await setup_lights_and_switch(
+        hass,
+        {
+            CONF_LIGHT_PROFILES: {
+                ENTITY_LIGHT_1: {CONF_SLEEP_BRIGHTNESS: 50},
+                "light.group": {CONF_SLEEP_BRIGHTNESS: 20, CONF_SLEEP_COLOR_TEMP: 2000},
+            },
+        },
+        all_lights=True,
+    )
+    assert switch.light_profile(ENTITY_LIGHT_1) == LightProfile(sleep_brightness=50)
+    assert switch.light_profile(ENTITY_LIGHT_3) is None
+
+    await switch.sleep_mode_switch.async_turn_on()
+    await switch._update_attrs_and_maybe_adapt_lights(
+        context=switch.create_context("test"),
+    )
+    assert switch.desired_state(ENTITY_LIGHT_1).brightness == round(255 * 0.5)
+    assert switch.desired_state(ENTITY_LIGHT_2).brightness == round(255 * 0.2)
+    assert switch.desired_state(ENTITY_LIGHT_2).color_temp_kelvin == 2000
+    assert switch.desired_state(ENTITY_LIGHT_3).brightness == round(
+        255 * DEFAULT_SLEEP_BRIGHTNESS / 100,
+    )
+
+
+async def test_shared_light_ownership(hass):
+    """Test that each attribute of a shared light is adapted by one switch only."""
+    switch1, _ = await setup_lights_and_switch(
+        hass,
+        {CONF_NAME: "switch1"},
+        all_lights=True,
+    )
+    switch2, _ = await setup_lights_and_switch(
+        hass,
+        {CONF_NAME: "switch2", CONF_PRIORITY: 1},
+        all_lights=True,
+    )
+    manager = switch1.manager
+    owned = manager.owned_attributes
+    assert owned(switch1, ENTITY_LIGHT_1) == LightControlAttributes.NONE
+    assert owned(switch2, ENTITY_LIGHT_1) == LightControlAttributes.ALL
+
+    # The switch with the higher priority leaves the color to the other switch
+    await switch2.adapt_color_switch.async_turn_off()
+    assert owned(switch1, ENTITY_LIGHT_1) == LightControlAttributes.COLOR
+    assert owned(switch2, ENTITY_LIGHT_1) == LightControlAttributes.BRIGHTNESS
+    assert (
+        manager.get_adaption_control_attributes(switch1, ENTITY_LIGHT_1)
+        == LightControlAttributes.COLOR
+    )
+    diagnostics = await async_get_config_entry_diagnostics(
+        hass,
+        hass.config_entries.async_entries(DOMAIN)[0],
+    )
+    assert diagnostics["shared_lights"][ENTITY_LIGHT_1] == "COLOR"
+
+    await switch2.async_turn_off()
+    assert owned(switch1, ENTITY_LIGHT_1) == LightControlAttributes.ALL
+
+    # With equal priorities, the switch that was turned on first owns the light
+    switch2._priority = 0
+    await switch2.async_turn_on()
+    await switch2.adapt_color_switch.async_turn_on()
+    assert owned(switch1, ENTITY_LIGHT_1) == LightControlAttributes.ALL
+    assert owned(switch2, ENTITY_LIGHT_1) == LightControlAttributes.NONE
+    assert manager.switches_of(ENTITY_LIGHT_1) == [switch1, switch2]
+
+    # Changing the priority moves the ownership
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_CHANGE_SWITCH_SETTINGS,
+        {ATTR_ENTITY_ID: switch2.entity_id, CONF_PRIORITY: 2},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert owned(switch1, ENTITY_LIGHT_1) == LightControlAttributes.NONE
+    assert owned(switch2, ENTITY_LIGHT_1) == LightControlAttributes.ALL
+    assert manager.switches_of(ENTITY_LIGHT_1) == [switch2, switch1]
+
+    # And so does removing a switch
+    entry2 = hass.config_entries.async_entries(DOMAIN)[1]
+    assert await hass.config_entries.async_unload(entry2.entry_id)
+    await hass.async_block_till_done()
+    assert manager.switches_of(ENTITY_LIGHT_1) == [switch1]
+    assert owned(switch1, ENTITY_LIGHT_1) == LightControlAttributes.ALL
+
+
 async def test_adapt_until_sleep_and_rgb_colors(hass):
     """Test setting up the Adaptive Lighting switches with different timezones.
 
@@ -2924,6 +4021,7 @@ async def test_multi_light_intercept_prepares_adaptation_for_first_entity(hass):
         {
             ATTR_BRIGHTNESS_PCT: 67,
             ATTR_COLOR_TEMP_KELVIN: 3448,
+            ATTR_RGB_COLOR: (255, 180, 100),
             "force_rgb_color": False,
         },
     )
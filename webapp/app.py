@@ -30,26 +30,28 @@ def date_range(tzinfo: dt.tzinfo) -> list[dt.datetime]:
 
 
 def copy_color_and_brightness_module() -> None:
-    """Copy the color_and_brightness module to the webapp folder."""
+    """Copy the color_and_brightness module (and its imports) to the webapp folder."""
+    replacements = {
+        "homeassistant.util.color": "homeassistant_util_color",
+        "from .color_conversion": "from color_conversion",
+    }
     with suppress(Exception):
         webapp_folder = Path(__file__).parent.absolute()
-        module = (
-            webapp_folder.parent
-            / "custom_components"
-            / "adaptive_lighting"
-            / "color_and_brightness.py"
-        )
-        new_module = webapp_folder / module.name
-        with module.open() as f:
-            lines = [
-                line.replace("homeassistant.util.color", "homeassistant_util_color")
-                for line in f.readlines()
-            ]
-        with new_module.open("r") as f:
-            existing_lines = f.readlines()
-        if existing_lines != lines:
-            with new_module.open("w") as f:
-                f.writelines(lines)
+        component = webapp_folder.parent / "custom_components" / "adaptive_lighting"
+        for name in ("color_and_brightness.py", "color_conversion.py"):
+            module = component / name
+            new_module = webapp_folder / module.name
+            with module.open() as f:
+                lines = f.readlines()
+            for old, new in replacements.items():
+                lines = [line.replace(old, new) for line in lines]
+            existing_lines = []
+            if new_module.exists():
+                with new_module.open("r") as f:
+                    existing_lines = f.readlines()
+            if existing_lines != lines:
+                with new_module.open("w") as f:
+                    f.writelines(lines)
 
 
 copy_color_and_brightness_module()
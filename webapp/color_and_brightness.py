@@ -4,21 +4,22 @@ from __future__ import annotations
 
 import bisect
 import colorsys
+import dataclasses
 import datetime
 import logging
 import math
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import UTC, timedelta
 from enum import Enum
 from functools import cached_property, partial
-from typing import Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import astral.sun
-from homeassistant_util_color import (
-    color_RGB_to_xy,
-    color_temperature_to_rgb,
-    color_xy_to_hs,
-)
+from color_conversion import kelvin_to_rgb, rgb_to_xy, xy_to_hs
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
 
 
 class SunEvent(str, Enum):
@@ -201,6 +202,24 @@ class SunEvents:
         raise ValueError(msg)
 
 
+# The `SunLightSettings` fields that the (cached) `SunLightSettings.sun` depends on
+_SUN_EVENTS_FIELDS = frozenset(
+    {
+        "name",
+        "astral_observer",
+        "sunrise_time",
+        "sunrise_offset",
+        "min_sunrise_time",
+        "max_sunrise_time",
+        "sunset_time",
+        "sunset_offset",
+        "min_sunset_time",
+        "max_sunset_time",
+        "timezone",
+    },
+)
+
+
 @dataclass(frozen=True)
 class SunLightSettings:
     """Track the state of the sun and associated light settings."""
@@ -246,6 +265,13 @@ class SunLightSettings:
             timezone=self.timezone,
         )
 
+    def replace(self, **changes: Any) -> SunLightSettings:
+        """Return a copy with `changes` that keeps the cached `sun` if unaffected."""
+        settings = dataclasses.replace(self, **changes)
+        if "sun" in self.__dict__ and _SUN_EVENTS_FIELDS.isdisjoint(changes):
+            settings.__dict__["sun"] = self.sun
+        return settings
+
     def _brightness_pct_default(self, dt: datetime.datetime) -> float:
         """Calculate the brightness percentage using the default method."""
         sun_position = self.sun.sun_position(dt)
@@ -342,16 +368,32 @@ class SunLightSettings:
         self,
         dt: datetime.datetime,
         is_sleep: bool,
-    ) -> dict[str, Any]:
-        """Calculate the brightness and color."""
+    ) -> LightSettings:
+        """Calculate the brightness and color.
+
+        Only the brightness and color temperature are calculated here, the other
+        color spaces are calculated when they are first read.
+        """
         sun_position = self.sun.sun_position(dt)
-        rgb_color: tuple[int, int, int]
+        return self.light_settings(
+            sun_position,
+            self.brightness_pct(dt, is_sleep),
+            is_sleep,
+        )
+
+    def light_settings(
+        self,
+        sun_position: float,
+        brightness_pct: float,
+        is_sleep: bool,
+    ) -> LightSettings:
+        """Return the settings with `brightness_pct` and the color at `sun_position`."""
+        rgb_color: Callable[[], tuple[int, int, int]]
         # Variable `force_rgb_color` is needed for RGB color after sunset (if enabled)
         force_rgb_color = False
-        brightness_pct = self.brightness_pct(dt, is_sleep)
         if is_sleep:
             color_temp_kelvin = self.sleep_color_temp
-            rgb_color = self.sleep_rgb_color
+            rgb_color = self._sleep_rgb_color
         elif (
             self.sleep_rgb_or_color_temp == "rgb_color"
             and self.adapt_until_sleep
@@ -361,38 +403,32 @@ class SunLightSettings:
             # https://github.com/basnijholt/adaptive-lighting/issues/624
             # This will result in a perceptible jump in color at sunset and sunrise
             # because the `color_temperature_to_rgb` function is not 100% accurate.
-            min_color_rgb = color_temperature_to_rgb(self.min_color_temp)
-            rgb_color = lerp_color_hsv(
-                min_color_rgb,
-                self.sleep_rgb_color,
-                sun_position,
-            )
+            rgb_color = partial(self._rgb_color_until_sleep, sun_position)
             color_temp_kelvin = self.color_temp_kelvin(sun_position)
             force_rgb_color = True
         else:
             color_temp_kelvin = self.color_temp_kelvin(sun_position)
-            r, g, b = color_temperature_to_rgb(color_temp_kelvin)
-            rgb_color = (round(r), round(g), round(b))
-        # backwards compatibility for versions < 1.3.1 - see #403
-        color_temp_mired: float = math.floor(1000000 / color_temp_kelvin)
-        xy_color: tuple[float, float] = color_RGB_to_xy(*rgb_color)
-        hs_color: tuple[float, float] = color_xy_to_hs(*xy_color)
-        return {
-            "brightness_pct": brightness_pct,
-            "color_temp_kelvin": color_temp_kelvin,
-            "color_temp_mired": color_temp_mired,
-            "rgb_color": rgb_color,
-            "xy_color": xy_color,
-            "hs_color": hs_color,
-            "sun_position": sun_position,
-            "force_rgb_color": force_rgb_color,
-        }
+            rgb_color = partial(_rounded_kelvin_to_rgb, color_temp_kelvin)
+        return LightSettings(
+            brightness_pct=brightness_pct,
+            color_temp_kelvin=color_temp_kelvin,
+            sun_position=sun_position,
+            force_rgb_color=force_rgb_color,
+            rgb_color=rgb_color,
+        )
+
+    def _sleep_rgb_color(self) -> tuple[int, int, int]:
+        return self.sleep_rgb_color
+
+    def _rgb_color_until_sleep(self, sun_position: float) -> tuple[int, int, int]:
+        min_color_rgb = kelvin_to_rgb(self.min_color_temp)
+        return lerp_color_hsv(min_color_rgb, self.sleep_rgb_color, sun_position)
 
     def get_settings(
         self,
         is_sleep: bool,
         transition: float | None,
-    ) -> dict[str, float | int | tuple[float, float] | tuple[float, float, float]]:
+    ) -> LightSettings:
         """Get all light settings.
 
         Calculating all values takes <0.5ms.
@@ -401,6 +437,155 @@ class SunLightSettings:
         return self.brightness_and_color(dt, is_sleep)
 
 
+def _rounded_kelvin_to_rgb(color_temp_kelvin: int) -> tuple[int, int, int]:
+    r, g, b = kelvin_to_rgb(color_temp_kelvin)
+    return (round(r), round(g), round(b))
+
+
+class LightSettings(Mapping[str, Any]):
+    """The light settings of one moment, as returned by `get_settings`.
+
+    A read-only mapping of which the color spaces other than the color temperature
+    are calculated on first access, so lights that only dim or only support color
+    temperatures never pay for the RGB, xy, and hs conversions.
+    """
+
+    _KEYS = (
+        "brightness_pct",
+        "color_temp_kelvin",
+        "color_temp_mired",
+        "rgb_color",
+        "xy_color",
+        "hs_color",
+        "sun_position",
+        "force_rgb_color",
+    )
+
+    def __init__(
+        self,
+        *,
+        brightness_pct: float,
+        color_temp_kelvin: int,
+        sun_position: float,
+        force_rgb_color: bool,
+        rgb_color: Callable[[], tuple[int, int, int]],
+    ) -> None:
+        """Initialize the settings, `rgb_color` calculates the RGB color."""
+        self.brightness_pct = brightness_pct
+        self.color_temp_kelvin = color_temp_kelvin
+        self.sun_position = sun_position
+        self.force_rgb_color = force_rgb_color
+        self._rgb_color = rgb_color
+
+    @cached_property
+    def color_temp_mired(self) -> int:
+        """Return the color temperature in mired, for versions < 1.3.1 (#403)."""
+        return math.floor(1000000 / self.color_temp_kelvin)
+
+    @cached_property
+    def rgb_color(self) -> tuple[int, int, int]:
+        """Return the RGB color."""
+        return self._rgb_color()
+
+    @cached_property
+    def xy_color(self) -> tuple[float, float]:
+        """Return the xy color."""
+        return rgb_to_xy(*self.rgb_color)
+
+    @cached_property
+    def hs_color(self) -> tuple[float, float]:
+        """Return the hs color."""
+        return xy_to_hs(*self.xy_color)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the setting `key`, calculating it if needed."""
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether `key` is a setting without calculating it."""
+        return key in self._KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the settings without calculating them."""
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        """Return the number of settings."""
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        """Return the settings that have been calculated so far."""
+        calculated = {k: v for k, v in vars(self).items() if k in self._KEYS}
+        return f"LightSettings({calculated})"
+
+
+@dataclass(frozen=True)
+class LightProfile:
+    """Overrides of the ranges and sleep values of `SunLightSettings` for some lights.
+
+    Every brightness mode computes `min + f * (max - min)` for some fraction `f`, so
+    mapping the brightness from the switch's range onto the profile's range gives the
+    brightness the switch would compute with the profile's values. The color is
+    computed from the sun position, like `SunLightSettings` does.
+    """
+
+    min_brightness: int | None = None
+    max_brightness: int | None = None
+    min_color_temp: int | None = None
+    max_color_temp: int | None = None
+    sleep_brightness: int | None = None
+    sleep_color_temp: int | None = None
+
+    def apply(
+        self,
+        settings: LightSettings,
+        sun_light_settings: SunLightSettings,
+        is_sleep: bool,
+    ) -> LightSettings:
+        """Return the `settings` of `sun_light_settings` with this profile applied."""
+        overrides = {
+            field.name: value
+            for field in dataclasses.fields(self)
+            if (value := getattr(self, field.name)) is not None
+        }
+        profile_settings = sun_light_settings.replace(**overrides)
+        if is_sleep:
+            brightness_pct = profile_settings.sleep_brightness
+        else:
+            brightness_pct = _rescale(
+                settings.brightness_pct,
+                (sun_light_settings.min_brightness, sun_light_settings.max_brightness),
+                (self.min_brightness, self.max_brightness),
+            )
+        return profile_settings.light_settings(
+            settings.sun_position,
+            clamp(brightness_pct, 1, 100),
+            is_sleep,
+        )
+
+
+def _or_default(value: float | None, default: float) -> float:
+    return default if value is None else value
+
+
+def _rescale(
+    value: float,
+    old_range: tuple[float, float],
+    new_range: tuple[float | None, float | None],
+) -> float:
+    """Map `value` from `old_range` onto `new_range` (its `None`s are the old ends)."""
+    if new_range == (None, None):
+        return value
+    old_min, old_max = old_range
+    new_min = _or_default(new_range[0], old_min)
+    new_max = _or_default(new_range[1], old_max)
+    if old_min == old_max:
+        return new_max
+    return lerp(value, x1=old_min, x2=old_max, y1=new_min, y2=new_max)
+
+
 def find_a_b(x1: float, x2: float, y1: float, y2: float) -> tuple[float, float]:
     """Compute the values of 'a' and 'b' for a scaled and shifted tanh function.
 